@@ -0,0 +1,87 @@
+"""
+Benchmark of the 'CollisionWorld' spatial hash broadphase against testing every pair of colliders.  Each frame every
+collider moves, the spatial hash is rebuilt and every collider is queried once (worst case, in game only the player
+and player attacks query).
+
+Run from the project root with the engine's 'crescent_api' module importable:
+    python -m benchmarks.collision_broadphase_benchmark
+"""
+
+import random
+import time
+from typing import List
+
+from src.utils.collision import Bounds, SpatialHash, bounds_overlap
+
+LEVEL_WIDTH = 1200.0
+LEVEL_HEIGHT = 144.0
+
+
+def make_bounds(collider_count: int) -> List[Bounds]:
+    bounds = []
+    for i in range(collider_count):
+        x = random.uniform(0.0, LEVEL_WIDTH)
+        y = random.uniform(0.0, LEVEL_HEIGHT)
+        w = random.uniform(4.0, 24.0)
+        h = random.uniform(4.0, 24.0)
+        bounds.append((x, y, x + w, y + h))
+    return bounds
+
+
+def move_bounds(all_bounds: List[Bounds]) -> None:
+    for i, bounds in enumerate(all_bounds):
+        offset = random.uniform(-1.0, 1.0)
+        all_bounds[i] = (bounds[0] + offset, bounds[1], bounds[2] + offset, bounds[3])
+
+
+def run_all_pairs(all_bounds: List[Bounds]) -> int:
+    collision_count = 0
+    for i, bounds in enumerate(all_bounds):
+        for j, other_bounds in enumerate(all_bounds):
+            if i != j and bounds_overlap(bounds, other_bounds):
+                collision_count += 1
+    return collision_count
+
+
+def run_spatial_hash(spatial_hash: SpatialHash, all_bounds: List[Bounds]) -> int:
+    spatial_hash.clear()
+    for i, bounds in enumerate(all_bounds):
+        spatial_hash.insert(i, bounds)
+    collision_count = 0
+    for i, bounds in enumerate(all_bounds):
+        for j in spatial_hash.query(bounds):
+            if i != j and bounds_overlap(bounds, all_bounds[j]):
+                collision_count += 1
+    return collision_count
+
+
+def main() -> None:
+    random.seed(0)
+    frames = 100
+    spatial_hash = SpatialHash()
+    print(
+        f"{'colliders':>10}{'all pairs ms':>16}{'spatial hash ms':>18}{'speedup':>10}"
+    )
+    for collider_count in [10, 50, 100, 250, 500]:
+        all_bounds = make_bounds(collider_count)
+        all_pairs_time = 0.0
+        spatial_hash_time = 0.0
+        for frame in range(frames):
+            move_bounds(all_bounds)
+            start_time = time.perf_counter()
+            all_pairs_count = run_all_pairs(all_bounds)
+            all_pairs_time += time.perf_counter() - start_time
+            start_time = time.perf_counter()
+            spatial_hash_count = run_spatial_hash(spatial_hash, all_bounds)
+            spatial_hash_time += time.perf_counter() - start_time
+            assert all_pairs_count == spatial_hash_count
+        all_pairs_ms = all_pairs_time / frames * 1000.0
+        spatial_hash_ms = spatial_hash_time / frames * 1000.0
+        print(
+            f"{collider_count:>10}{all_pairs_ms:>16.3f}{spatial_hash_ms:>18.3f}"
+            f"{all_pairs_ms / spatial_hash_ms:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
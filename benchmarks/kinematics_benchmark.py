@@ -0,0 +1,109 @@
+"""
+Benchmark of batched 'Kinematics' movement against each entity moving itself from its own task (resumed by a task
+manager, building a temporary 'Vector2' for its offset every step like the old per-node movement did).  Entities are
+stand-ins with a 'position' attribute, so the cost of engine position writes isn't included, only task resumes, the
+movement math and the write back pass.  Whether NumPy is used depends on it being installed.
+
+Run from the project root with the engine's 'crescent_api' module importable:
+    python -m benchmarks.kinematics_benchmark
+"""
+
+import random
+import time
+from typing import List
+
+from crescent_api import Vector2
+
+from src.utils.game_clock import Clock
+from src.utils.kinematics import Kinematics
+from src.utils.task import Task, TaskManager, co_suspend
+
+
+class MovingEntity:
+    def __init__(self, entity_id: int, position: Vector2, direction: Vector2):
+        self.entity_id = entity_id
+        self.position = position
+        self.direction = direction
+        self.move_speed = random.uniform(20.0, 80.0)
+        self.clock = Clock()
+
+    def subscribe_to_event(self, event_id: str, scoped_node, callback) -> None:
+        pass
+
+    def add_to_position(self, offset: Vector2) -> None:
+        position = self.position
+        self.position = Vector2(position.x + offset.x, position.y + offset.y)
+
+
+def make_entities(entity_count: int) -> List[MovingEntity]:
+    entities = []
+    for i in range(entity_count):
+        position = Vector2(random.uniform(0.0, 1200.0), random.uniform(0.0, 144.0))
+        direction = random.choice([Vector2(-1.0, 0.0), Vector2(1.0, 0.0)])
+        entity = MovingEntity(i, position, direction)
+        # Per entity time dilation
+        entity.clock.delta_time = 1.0 / 60.0 * random.choice([0.5, 1.0])
+        entities.append(entity)
+    return entities
+
+
+async def move_task(entity: MovingEntity):
+    try:
+        while True:
+            delta_time = entity.clock.delta_time
+            entity.add_to_position(
+                Vector2(
+                    entity.direction.x * entity.move_speed * delta_time,
+                    entity.direction.y * entity.move_speed * delta_time,
+                )
+            )
+            await co_suspend()
+    except GeneratorExit:
+        pass
+
+
+def main() -> None:
+    random.seed(0)
+    frames = 200
+    print(f"NumPy: {Kinematics.is_vectorized()}")
+    print(f"{'entities':>10}{'per entity ms':>16}{'batched ms':>14}{'speedup':>10}")
+    for entity_count in [10, 50, 100, 250, 500, 1000, 2000]:
+        entities = make_entities(entity_count)
+        task_manager = TaskManager()
+        for entity in entities:
+            task_manager.add_task(Task(coroutine=move_task(entity)))
+        per_entity_time = 0.0
+        for frame in range(frames):
+            start_time = time.perf_counter()
+            task_manager.update()
+            per_entity_time += time.perf_counter() - start_time
+        task_manager.kill_tasks()
+
+        Kinematics.clear()
+        entities = make_entities(entity_count)
+        for entity in entities:
+            Kinematics.add_body(
+                entity,
+                Vector2(
+                    entity.direction.x * entity.move_speed,
+                    entity.direction.y * entity.move_speed,
+                ),
+                clock=entity.clock,
+            )
+        batched_time = 0.0
+        for frame in range(frames):
+            start_time = time.perf_counter()
+            Kinematics.step()
+            batched_time += time.perf_counter() - start_time
+        Kinematics.clear()
+
+        per_entity_ms = per_entity_time / frames * 1000.0
+        batched_ms = batched_time / frames * 1000.0
+        print(
+            f"{entity_count:>10}{per_entity_ms:>16.3f}{batched_ms:>14.3f}"
+            f"{per_entity_ms / batched_ms:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Micro-benchmark of 'Task.resume' throughput against the previous task implementation (recursive resume with an
+'Awaitable' allocated per suspend).
+
+Run from the project root with the engine's 'crescent_api' module importable:
+    python -m benchmarks.task_resume_benchmark
+"""
+
+import time
+from typing import Callable, Coroutine, Optional
+
+from src.utils.task import Task, co_suspend
+
+
+# --- Previous implementation, kept verbatim for comparison --- #
+class LegacyAwaitable:
+    class State:
+        SUSPENDED = 0
+        FINISHED = 1
+
+    def __init__(self, state: int):
+        self.state = state
+
+    def __await__(self):
+        yield self
+
+
+class LegacyTask:
+    def __init__(self, coroutine: Coroutine):
+        self.coroutine = coroutine
+        self.on_close_subscribers = []
+        self.valid = True
+        self.current_task: "LegacyTask" = self
+        self.parent_task: Optional["LegacyTask"] = None
+
+    def __await__(self):
+        yield self
+
+    def resume(self) -> None:
+        if self.valid:
+            try:
+                task_return_value = self.current_task.coroutine.send(None)
+                if issubclass(type(task_return_value), LegacyAwaitable):
+                    if task_return_value.state == LegacyAwaitable.State.FINISHED:
+                        raise StopIteration
+                elif issubclass(type(task_return_value), LegacyTask):
+                    # Swap subtask in place
+                    task_return_value.parent_task = self.current_task
+                    self.current_task = task_return_value
+            except StopIteration:
+                if self.current_task.parent_task:
+                    self.current_task = self.current_task.parent_task
+                    self.resume()
+                else:
+                    self.valid = False
+
+
+def legacy_co_suspend() -> LegacyAwaitable:
+    return LegacyAwaitable(LegacyAwaitable.State.SUSPENDED)
+
+
+# --- Workloads --- #
+def make_flat_coroutine(task_type: type, suspend_func: Callable) -> Coroutine:
+    async def flat_coroutine():
+        while True:
+            await suspend_func()
+
+    return flat_coroutine()
+
+
+def make_nested_coroutine(
+    task_type: type, suspend_func: Callable, depth=4, frames_per_leaf=3
+) -> Coroutine:
+    """
+    Mimics the player's nested stance -> attack tasks, subtasks are created and finish every few frames.
+    """
+
+    async def leaf_coroutine():
+        for i in range(frames_per_leaf):
+            await suspend_func()
+
+    async def nested_coroutine(current_depth: int):
+        while True:
+            if current_depth >= depth:
+                await task_type(leaf_coroutine())
+            else:
+                await task_type(nested_coroutine(current_depth + 1))
+
+    return nested_coroutine(1)
+
+
+def run_workload(
+    task_type: type, suspend_func: Callable, make_coroutine: Callable, task_count: int
+) -> float:
+    frames = 2000
+    tasks = [
+        task_type(make_coroutine(task_type, suspend_func)) for i in range(task_count)
+    ]
+    start_time = time.perf_counter()
+    for frame in range(frames):
+        for task in tasks:
+            task.resume()
+    elapsed_time = time.perf_counter() - start_time
+    for task in tasks:
+        close_task_chain(task)
+    return (frames * task_count) / elapsed_time
+
+
+def close_task_chain(task) -> None:
+    current_task = task.current_task
+    while current_task:
+        current_task.coroutine.close()
+        current_task = current_task.parent_task
+
+
+def main() -> None:
+    print(
+        f"{'workload':<24}{'tasks':>8}{'legacy/s':>16}{'current/s':>16}{'speedup':>10}"
+    )
+    for workload_name, make_coroutine in [
+        ("flat suspend", make_flat_coroutine),
+        ("nested subtasks", make_nested_coroutine),
+    ]:
+        for task_count in [10, 100, 500]:
+            legacy_rate = run_workload(
+                LegacyTask, legacy_co_suspend, make_coroutine, task_count
+            )
+            current_rate = run_workload(Task, co_suspend, make_coroutine, task_count)
+            print(
+                f"{workload_name:<24}{task_count:>8}{legacy_rate:>16,.0f}{current_rate:>16,.0f}"
+                f"{current_rate / legacy_rate:>9.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Benchmark of 'TypeDispatch' lookups against the 'issubclass' chains they replaced in the player's contact handling,
+item activation and 'ItemUtils.get_item_from_type'.
+
+Run from the project root with the engine's 'crescent_api' module importable:
+    python -m benchmarks.type_dispatch_benchmark
+"""
+
+import random
+import time
+from typing import Callable, List
+
+from src.characters.enemy import Enemy, EnemyAttack
+from src.characters.enemy_boss import EnemyBossProjectile
+from src.characters.enemy_crow import EnemyCrow
+from src.characters.enemy_jester import EnemyJester, EnemyJesterProjectile
+from src.characters.enemy_rabbit import EnemyRabbit
+from src.characters.enemy_snake import EnemySnake
+from src.environment.bridge_gate import BridgeGate
+from src.items import *
+from src.utils.type_dispatch import TypeDispatch
+
+
+# --- Previous implementation, 'issubclass' chains in the order they were checked --- #
+def legacy_get_contact_response(node_type: type):
+    if issubclass(node_type, Enemy):
+        return "enemy"
+    elif issubclass(node_type, EnemyAttack):
+        return "enemy_attack"
+    elif issubclass(node_type, Item):
+        return "item"
+    elif issubclass(node_type, BridgeGate):
+        return "bridge_gate"
+    return None
+
+
+def legacy_get_item_class(item_type: type):
+    if issubclass(item_type, HealthRestoreItem):
+        return HealthRestoreItem
+    elif issubclass(item_type, ScrollItem):
+        return ScrollItem
+    elif issubclass(item_type, LeverItem):
+        return LeverItem
+    elif issubclass(item_type, EnergyRestoredFromAttacksIncreaseItem):
+        return EnergyRestoredFromAttacksIncreaseItem
+    elif issubclass(item_type, DamageDecreaseItem):
+        return DamageDecreaseItem
+    elif issubclass(item_type, SpecialAttackDoubledItem):
+        return SpecialAttackDoubledItem
+    elif issubclass(item_type, SpecialAttackTimeDecreaseItem):
+        return SpecialAttackTimeDecreaseItem
+    elif issubclass(item_type, SaveChargeItem):
+        return SaveChargeItem
+    elif issubclass(item_type, DamageDeflectWhenChargedItem):
+        return DamageDeflectWhenChargedItem
+    elif issubclass(item_type, AbilitySlowTimeItem):
+        return AbilitySlowTimeItem
+    elif issubclass(item_type, AbilityDualSpecialItem):
+        return AbilityDualSpecialItem
+    elif issubclass(item_type, AbilityHoodFormItem):
+        return AbilityHoodFormItem
+    return None
+
+
+ITEM_TYPES = [
+    HealthRestoreItem,
+    ScrollItem,
+    LeverItem,
+    EnergyRestoredFromAttacksIncreaseItem,
+    DamageDecreaseItem,
+    SpecialAttackDoubledItem,
+    SpecialAttackTimeDecreaseItem,
+    SaveChargeItem,
+    DamageDeflectWhenChargedItem,
+    AbilitySlowTimeItem,
+    AbilityDualSpecialItem,
+    AbilityHoodFormItem,
+]
+
+contact_dispatch = TypeDispatch(
+    {
+        Enemy: "enemy",
+        EnemyAttack: "enemy_attack",
+        Item: "item",
+        BridgeGate: "bridge_gate",
+    }
+)
+item_class_dispatch = TypeDispatch(
+    {item_class: item_class for item_class in ITEM_TYPES}
+)
+
+
+# --- Workloads --- #
+def make_enemy_wave_contacts(contact_count: int) -> List[type]:
+    """
+    Contacts for a frame in a dense enemy wave, mostly enemies and their projectiles with the odd bridge gate.
+    """
+    wave_types = [
+        EnemyRabbit,
+        EnemySnake,
+        EnemyCrow,
+        EnemyJester,
+        EnemyJesterProjectile,
+        EnemyBossProjectile,
+        BridgeGate,
+    ]
+    return [random.choice(wave_types) for i in range(contact_count)]
+
+
+def make_power_up_area_contacts(contact_count: int) -> List[type]:
+    """
+    Contacts for a frame in a power up area with every item type on the ground.
+    """
+    return [ITEM_TYPES[i % len(ITEM_TYPES)] for i in range(contact_count)]
+
+
+def run_workload(lookup_func: Callable, contacts: List[type]) -> float:
+    frames = 2000
+    start_time = time.perf_counter()
+    for frame in range(frames):
+        for contact_type in contacts:
+            lookup_func(contact_type)
+    elapsed_time = time.perf_counter() - start_time
+    return (frames * len(contacts)) / elapsed_time
+
+
+def main() -> None:
+    random.seed(0)
+    print(
+        f"{'workload':<32}{'contacts':>10}{'issubclass/s':>16}{'dispatch/s':>16}{'speedup':>10}"
+    )
+    for workload_name, make_contacts, legacy_func, dispatch_func in [
+        (
+            "enemy wave contacts",
+            make_enemy_wave_contacts,
+            legacy_get_contact_response,
+            contact_dispatch.get,
+        ),
+        (
+            "power up area contacts",
+            make_power_up_area_contacts,
+            legacy_get_contact_response,
+            contact_dispatch.get,
+        ),
+        (
+            "power up area item creation",
+            make_power_up_area_contacts,
+            legacy_get_item_class,
+            item_class_dispatch.get,
+        ),
+    ]:
+        for contact_count in [12, 100, 500]:
+            contacts = make_contacts(contact_count)
+            for contact_type in contacts:
+                assert legacy_func(contact_type) == dispatch_func(contact_type)
+            legacy_rate = run_workload(legacy_func, contacts)
+            dispatch_rate = run_workload(dispatch_func, contacts)
+            print(
+                f"{workload_name:<32}{contact_count:>10}{legacy_rate:>16,.0f}{dispatch_rate:>16,.0f}"
+                f"{dispatch_rate / legacy_rate:>9.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
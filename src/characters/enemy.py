@@ -1,7 +1,22 @@
 from crescent_api import *
 
+from src.characters.player_perception import PlayerPerception
 from src.level_state import LevelState
-from src.utils.task import Task, co_suspend, co_wait_seconds, co_wait_until
+from src.utils.activity_manager import ActivityManager
+from src.utils.collision import CollisionLayer, CollisionWorld
+from src.utils.frame_context import FrameContext
+from src.utils.game_clock import GameClock
+from src.utils.kinematics import Kinematics
+from src.utils.render_interpolation import RenderInterpolation
+from src.utils.signal import Signal
+from src.utils.task import (
+    Task,
+    TaskPriority,
+    TaskScheduler,
+    co_suspend,
+    co_wait_seconds,
+    co_wait_world_unpaused,
+)
 
 
 class EnemyAttackOwnerDeletionMode:
@@ -11,51 +26,137 @@ class EnemyAttackOwnerDeletionMode:
 
 
 class EnemyAttack(Node2D):
+    collision_layer = CollisionLayer.ENEMY_ATTACK
+    collision_mask = CollisionLayer.PLAYER
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self.damage = 0
         self.move_speed = 0
         self.direction = Vector2.ZERO
         self._owner: Optional["Enemy"] = None
+        self.update_task: Optional[Task] = None
         self.physics_update_task: Optional[Task] = None
         self.collider: Optional[Collider2D] = None
         self.destroy_on_touch = True
         self.owner_deletion_mode = EnemyAttackOwnerDeletionMode.NONE
+        # Set by 'NodePool', pooled attacks are parked when despawned instead of deleted
+        self.pool = None
+        self.is_parked = False
 
-    def _fixed_update(self, delta_time: float) -> None:
-        if self._owner and not self._owner.is_destroyed:
-            self.time_dilation = self._owner.time_dilation
-        if self.physics_update_task:
-            self.physics_update_task.resume()
-        if self.direction == Vector2.ZERO:
-            return None
-        self.add_to_position(
-            Vector2(
-                self.direction.x * self.move_speed * delta_time,
-                self.direction.y * self.move_speed * delta_time,
+    def _start(self) -> None:
+        # Follows the enemies' time dilation instead of copying its owner's
+        GameClock.join_group(self, "enemies")
+        if self.collider:
+            CollisionWorld.register_collider(
+                self.collider, self.collision_layer, self.collision_mask, is_swept=True
             )
+        if self.is_parked:
+            if self.collider:
+                CollisionWorld.set_collider_enabled(self.collider, False)
+        else:
+            self._on_spawned()
+
+    def _end(self) -> None:
+        self.set_owner(None)
+
+    def _on_spawned(self) -> None:
+        """
+        Called once the attack enters play, either when first added to the scene or when taken out of its pool.
+        """
+        RenderInterpolation.add_node(self)
+        Kinematics.add_body(
+            self,
+            Vector2(
+                self.direction.x * self.move_speed, self.direction.y * self.move_speed
+            ),
+        )
+        # Recycled instead of going dormant once far off screen
+        ActivityManager.add_node(self, on_left_zone=EnemyAttack.despawn)
+        self.update_task = TaskScheduler().add_node_task(
+            self, Task(coroutine=self._update_task())
         )
 
-    def set_owner(self, enemy: "Enemy") -> None:
+    def unpark(self) -> None:
+        self.is_parked = False
+        if self.collider:
+            CollisionWorld.set_collider_enabled(self.collider, True)
+        self._on_spawned()
+
+    def park(self, position: Vector2) -> None:
+        # Attacks that despawn themselves from their physics update task (resumed by the update task) park while
+        # both are running, those aren't closed and return once 'despawn' does
+        for task in [self.update_task, self.physics_update_task]:
+            if task and not task.is_running():
+                task.close()
+        self.update_task = None
+        self.physics_update_task = None
+        self.set_owner(None)
+        self.direction = Vector2.ZERO
+        self.is_parked = True
+        if self.collider:
+            CollisionWorld.set_collider_enabled(self.collider, False)
+        RenderInterpolation.remove_node(self)
+        Kinematics.remove_body(self)
+        ActivityManager.remove_node(self)
+        self.position = position
+
+    def despawn(self) -> None:
+        """
+        Removes the attack once it has hit or expired, pooled attacks go back to their pool instead of being deleted.
+        """
+        if self.pool:
+            self.pool.release(self)
+        else:
+            self.queue_deletion()
+
+    def set_owner(self, enemy: Optional["Enemy"]) -> None:
+        if self._owner:
+            self._get_owner_deletion_signal(self._owner).unsubscribe(
+                self._on_owner_destroyed
+            )
         self._owner = enemy
+        if self._owner:
+            self._get_owner_deletion_signal(self._owner).subscribe(
+                self._on_owner_destroyed
+            )
+
+    def _get_owner_deletion_signal(self, enemy: "Enemy") -> Signal:
         if (
             self.owner_deletion_mode
             == EnemyAttackOwnerDeletionMode.DELETE_WHEN_OWNER_IS_DESTROYED
         ):
-            deletion_event = "destroyed"
-        else:
-            deletion_event = "scene_exited"
-        self._owner.subscribe_to_event(
-            deletion_event, self, lambda args: self._on_owner_destroyed()
-        )
+            return enemy.destroyed
+        return enemy.despawned
 
-    def _on_owner_destroyed(self) -> None:
-        self._owner = None
+    def _on_owner_destroyed(self, enemy: "Enemy") -> None:
+        self.set_owner(None)
         if self.owner_deletion_mode != EnemyAttackOwnerDeletionMode.NONE:
-            self.queue_deletion()
+            self.despawn()
+
+    # --- TASKS --- #
+    async def _update_task(self) -> None:
+        try:
+            while True:
+                if self.physics_update_task:
+                    self.physics_update_task.resume()
+                    # Parked by its own physics update task, which has returned
+                    if self.is_parked:
+                        break
+                await co_suspend()
+        except GeneratorExit:
+            pass
 
 
 class Enemy(Node2D):
+    collision_layer = CollisionLayer.ENEMY
+    collision_mask = CollisionLayer.PLAYER | CollisionLayer.PLAYER_ATTACK
+    # Animation played when a pooled enemy is spawned again
+    spawn_animation_name: Optional[str] = None
+    # Enemies far off screen have their tasks suspended by 'ActivityManager'
+    can_go_dormant = True
+    shader_path = "shaders/enemy.shader"
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self.base_hp = 0
@@ -67,6 +168,7 @@ class Enemy(Node2D):
         self.shakes_required_for_detach = 3
         self.is_destroyed = False
         self.anim_sprite: Optional[AnimatedSprite] = None
+        self.collider: Optional[Collider2D] = None
         self.physics_update_task: Optional[Task] = None
         self.take_damage_task: Optional[Task] = None
         self.destroyed_task: Optional[Task] = None
@@ -75,27 +177,119 @@ class Enemy(Node2D):
         self.split_on_death = True
         self.split_range = MinMax(0.6, 0.6)
         self.split_amount = 0.05
+        self._base_split_range = MinMax(0.6, 0.6)
+        # Set by 'EnemyPool', pooled enemies are parked when despawned instead of deleted
+        self.pool = None
+        self.is_parked = False
+        # Speed a dormant enemy moves toward the player at, set by enemies that chase the player so they still follow
+        # it back on screen while dormant
+        self.dormant_seek_speed: Optional[float] = None
+        # Emitted with the enemy, for attacks that are removed along with their owner
+        self.destroyed = Signal()
+        self.despawned = Signal()
 
     def _start(self) -> None:
         self.anim_sprite: AnimatedSprite = self.get_child("AnimatedSprite")
-        self.anim_sprite.shader_instance = ShaderUtil.compile_shader(
-            "shaders/enemy.shader"
+        self.anim_sprite.shader_instance = ShaderUtil.compile_shader(self.shader_path)
+        self.collider = self.get_child("Collider2D")
+        CollisionWorld.register_collider(
+            self.collider, self.collision_layer, self.collision_mask
         )
+        self._base_split_range = MinMax(self.split_range.min, self.split_range.max)
+        GameClock.join_group(self, "enemies")
+        if self.is_parked:
+            CollisionWorld.set_collider_enabled(self.collider, False)
+        else:
+            self._on_spawned()
 
-    def _fixed_update(self, delta_time: float) -> None:
-        if not self.is_destroyed:
-            if self.physics_update_task:
-                self.physics_update_task.resume()
+    def _on_spawned(self) -> None:
+        """
+        Called once the enemy enters play, either when first added to the scene or when taken out of its pool.
+        """
+        RenderInterpolation.add_node(self)
+        PlayerPerception.add_node(self)
+        if self.can_go_dormant:
+            ActivityManager.add_node(self, seek_player_speed=self.dormant_seek_speed)
+        if self.physics_update_task:
+            self._schedule_task(self.physics_update_task)
+
+    def reset(self) -> None:
+        """
+        Restores the state an enemy is spawned with so a pooled enemy can be spawned again.  Subclasses reset their
+        own state and call this.
+        """
+        self.hp = self.base_hp
+        self.is_destroyed = False
+        self.is_attached_to_player = False
+        self.current_attached_shakes = 0
+        self.split_range = MinMax(
+            self._base_split_range.min, self._base_split_range.max
+        )
+        self.anim_sprite.flip_h = False
+        self.anim_sprite.modulate = Color.WHITE
+        shader_instance = self.anim_sprite.shader_instance
+        shader_instance.set_float_param("flash_amount", 0.0)
+        shader_instance.set_float_param("split_min", -1.0)
+        shader_instance.set_float_param("split_max", -1.0)
+        if self.spawn_animation_name:
+            self.anim_sprite.play(self.spawn_animation_name)
+        # Physics update tasks are always created from '_physics_update_task'.  The old one is closed first as
+        # prewarmed enemies are never parked, so theirs was never started
+        if self.physics_update_task:
+            self.physics_update_task.close()
+            self.physics_update_task = Task(coroutine=self._physics_update_task())
+
+    def unpark(self) -> None:
+        self.reset()
+        self.is_parked = False
+        CollisionWorld.set_collider_enabled(self.collider, True)
+        self._on_spawned()
+
+    def park(self, position: Vector2) -> None:
+        """
+        Takes the enemy out of play without removing it from the scene, its tasks are stopped and its collider is
+        disabled.  Enemies are usually parked by their own death task, which isn't closed and returns once 'despawn'
+        does.
+        """
+        for task in [
+            self.physics_update_task,
+            self.take_damage_task,
+            self.destroyed_task,
+            self.destroyed_split_task,
+        ]:
+            if task and not task.is_running():
+                task.close()
+        self.take_damage_task = None
+        self.destroyed_task = None
+        self.destroyed_split_task = None
+        self.is_parked = True
+        CollisionWorld.set_collider_enabled(self.collider, False)
+        RenderInterpolation.remove_node(self)
+        PlayerPerception.remove_node(self)
+        Kinematics.remove_body(self)
+        ActivityManager.remove_node(self)
+        self.position = position
+
+    def despawn(self) -> None:
+        """
+        Removes the enemy once its death has played out, pooled enemies go back to their pool instead of being deleted.
+        """
+        self.despawned.emit(self)
+        if self.pool:
+            self.pool.release(self)
         else:
-            if self.destroyed_task:
-                self.destroyed_task.resume()
-            else:
-                if not self.is_queued_for_deletion:
-                    print(f"ERROR: Should be destroyed task for {self}")
-            if self.destroyed_split_task:
-                self.destroyed_split_task.resume()
-        if self.take_damage_task:
-            self.take_damage_task.resume()
+            self.queue_deletion()
+
+    def _schedule_task(self, task: Task) -> Task:
+        return TaskScheduler().add_node_task(self, task)
+
+    def _set_destroyed_task(self, task: Task) -> None:
+        """
+        Stops the physics update task and schedules the task that plays out the enemy's death.
+        """
+        if self.physics_update_task and not self.physics_update_task.is_running():
+            self.physics_update_task.close()
+        self.destroyed_task = self._schedule_task(task)
 
     def take_damage(self, damage: int) -> None:
         if self.take_damage_task:
@@ -104,19 +298,36 @@ class Enemy(Node2D):
         self.hp = max(self.hp - damage, 0)
         if self.hp == 0:
             self.is_destroyed = True  # Maybe we want a callback here for enemies?
-            self.destroyed_task = Task(coroutine=self._destroyed_task())
+            self._set_destroyed_task(Task(coroutine=self._destroyed_task()))
             if self.split_on_death:
-                self.destroyed_split_task = Task(coroutine=self._destroyed_split_task())
-            self.broadcast_event("destroyed", self)
+                self.destroyed_split_task = self._schedule_task(
+                    Task(
+                        coroutine=self._destroyed_split_task(),
+                        priority=TaskPriority.COSMETIC,
+                    )
+                )
+            self._broadcast_destroyed()
         else:
-            self.take_damage_task = Task(coroutine=self._take_damage_task())
+            self.take_damage_task = self._schedule_task(
+                Task(coroutine=self._take_damage_task())
+            )
         self.anim_sprite.shader_instance.set_float_param("flash_amount", 0.5)
 
     def destroy(self) -> None:
         if not self.is_destroyed:
             self.is_destroyed = True
-            self.broadcast_event("destroyed", self)
-            self.queue_deletion()
+            # Enemies that destroy themselves from their physics update task return from it right after
+            if self.physics_update_task and not self.physics_update_task.is_running():
+                self.physics_update_task.close()
+            self._broadcast_destroyed()
+            self.despawn()
+
+    def _broadcast_destroyed(self) -> None:
+        # Death tasks play out wherever the enemy is
+        Kinematics.remove_body(self)
+        ActivityManager.remove_node(self)
+        self.broadcast_event("destroyed", self)
+        self.destroyed.emit(self)
 
     def destroy_from_shake(self) -> None:
         self.destroy()
@@ -129,7 +340,7 @@ class Enemy(Node2D):
         self.hp = hp
 
     def _find_player(self) -> Node2D:
-        return SceneTree.get_root().get_child("Player")
+        return FrameContext.player or SceneTree.get_root().get_child("Player")
 
     def _is_outside_of_level_boundary(self, padding=Vector2(64.0, 64.0)) -> bool:
         level_boundary = LevelState().boundary
@@ -143,11 +354,11 @@ class Enemy(Node2D):
 
     def _is_outside_of_camera_viewport(self, padding=Vector2(64.0, 64.0)) -> bool:
         position = self.position
-        camera_pos = Camera2D.get_position()
-        game_props = GameProperties()
+        camera_pos = FrameContext.get_camera_position()
+        game_resolution = FrameContext.get_game_resolution()
         camera_dimension = Size2D(
-            game_props.game_resolution.w + camera_pos.x,
-            game_props.game_resolution.h + camera_pos.y,
+            game_resolution.w + camera_pos.x,
+            game_resolution.h + camera_pos.y,
         )
         return (
             position.x < camera_pos.x - padding.x
@@ -182,14 +393,14 @@ class Enemy(Node2D):
                 )
                 for i in range(2):
                     self.position += knock_back_velocity
-                    await co_wait_until(lambda: World.get_time_dilation() > 0.0)
+                    await co_wait_world_unpaused()
             shader_instance = self.anim_sprite.shader_instance
             shader_instance.set_float_param("flash_amount", 0.75)
             await co_suspend()
             self.anim_sprite.modulate = Color(255, 255, 255, 200)
             shader_instance.set_float_param("flash_amount", 0.5)
-            await co_wait_seconds(1.0)
-            self.queue_deletion()
+            await co_wait_seconds(1.0, clock=GameClock.enemy)
+            self.despawn()
         except GeneratorExit:
             pass
 
@@ -207,6 +418,6 @@ class Enemy(Node2D):
             # Split enemy in half
             for i in range(50):
                 increment_split()
-                await co_wait_until(lambda: World.get_time_dilation() > 0.0)
+                await co_wait_world_unpaused()
         except GeneratorExit:
             pass
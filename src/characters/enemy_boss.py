@@ -1,11 +1,17 @@
 import random
+from functools import partial
 
 from crescent_api import *
 
 from src.characters.enemy import Enemy, EnemyAttack, EnemyAttackOwnerDeletionMode
 from src.characters.player import Player, PlayerStance
+from src.characters.player_perception import PlayerPerception
 from src.level_state import LevelState
+from src.utils.game_clock import GameClock
+from src.utils.kinematics import Kinematics
 from src.utils.game_math import Easer, Ease, map_to_range, clamp
+from src.utils.node_pool import NodePool
+from src.utils.state_machine import StateMachine
 from src.utils.task import *
 from src.utils.timer import Timer
 
@@ -65,7 +71,6 @@ class EnemyBossProjectile(EnemyAttack):
         )
 
     def _start(self) -> None:
-        self.move_speed = 40
         size = Size2D(4, 4)
         self.collider = Collider2D.new()
         self.collider.extents = size
@@ -93,35 +98,43 @@ class EnemyBossProjectile(EnemyAttack):
         self.anim_sprite.position = Vector2(-2, -2)
         self.add_child(self.anim_sprite)
         self.anim_sprite.play("main")
+        super()._start()
 
+    def _on_spawned(self) -> None:
+        self.move_speed = 40
         self.physics_update_task = Task(coroutine=self._physics_update_task())
+        super()._on_spawned()
 
     # --- TASKS --- #
     async def _physics_update_task(self) -> None:
         try:
             # Go a certain amount frames at half speed to telegraph projectile
             frames_to_telegraph_attack = 6
-            full_move_speed = self.move_speed
-            self.move_speed /= 2.0
+            Kinematics.set_speed_scale(self, 0.5)
             for i in range(frames_to_telegraph_attack):
                 await co_suspend()
-            self.move_speed = full_move_speed
+            Kinematics.set_speed_scale(self, 1.0)
 
-            life_timer = Timer(15.0)
+            life_timer = Timer(15.0, clock=GameClock.get_node_clock(self))
             while life_timer.time_remaining > 0.0:
-                life_timer.tick(self.get_full_time_dilation_with_physics_delta())
+                life_timer.tick()
                 await co_suspend()
-            self.queue_deletion()
+            self.despawn()
         except GeneratorExit:
             self.physics_update_task = None
 
 
 class EnemyBoss(Enemy):
+    # Enters from above the camera and stays in the boss area
+    can_go_dormant = False
+    projectile_pool = NodePool("EnemyBossProjectile", EnemyBossProjectile.new, size=4)
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self._set_base_hp(32)
         self.move_dir = Vector2.RIGHT
         self.state = EnemyBossState.OLD_MOVE_TASK
+        self.state_machine: Optional[StateMachine] = None
         self.physics_update_task = Task(coroutine=self._physics_update_task())
         self.split_amount = 0.01
         self.do_entrance_stuff = True
@@ -136,6 +149,7 @@ class EnemyBoss(Enemy):
         self.health_bar_ui.position = Vector2(53, 101)
         self.health_bar_ui.z_index = 10
         SceneTree.get_root().add_child(self.health_bar_ui)
+        EnemyBoss.projectile_pool.prewarm()
         if self.do_entrance_stuff:
             self.position += Vector2(0, -101)
         else:
@@ -149,26 +163,24 @@ class EnemyBoss(Enemy):
         self.health_bar_ui.update(self.base_hp, self.hp)
         if self.hp == 0:
             self.is_destroyed = True  # Maybe we want a callback here for enemies?
-            self.destroyed_task = Task(coroutine=self._destroyed_task())
-            self.broadcast_event("destroyed", self)
+            self._set_destroyed_task(Task(coroutine=self._destroyed_task()))
+            self._broadcast_destroyed()
         else:
-            self.take_damage_task = Task(coroutine=self._take_damage_task())
+            self.take_damage_task = self._schedule_task(
+                Task(coroutine=self._take_damage_task())
+            )
             self.anim_sprite.shader_instance.set_float_param("flash_amount", 0.5)
 
     def _end(self) -> None:
         if self.health_bar_ui:
             self.health_bar_ui.queue_deletion()
 
-    def _face_player(self, player) -> None:
-        if player.position.x > self.position.x:
-            self.anim_sprite.flip_h = False
-            self.move_dir = Vector2.RIGHT
-        else:
-            self.anim_sprite.flip_h = True
-            self.move_dir = Vector2.LEFT
+    def _face_player(self) -> None:
+        self.move_dir = PlayerPerception.get_horizontal_direction(self)
+        self.anim_sprite.flip_h = self.move_dir == Vector2.LEFT
 
     def _spawn_projectile(self) -> EnemyBossProjectile:
-        attack = EnemyBossProjectile.new()
+        attack: EnemyBossProjectile = EnemyBoss.projectile_pool.acquire()
         attack.set_owner(self)
         attack.direction = self.move_dir
         attack.z_index = self.z_index + 1
@@ -195,27 +207,24 @@ class EnemyBoss(Enemy):
             level_state = LevelState()
             level_state.is_paused_from_boss = False
 
-            prev_state: Optional[str] = None
-            state_task: Optional[Task] = None
-            while True:
-                if self.state != prev_state:
-                    if state_task:
-                        state_task.close()
-                    if self.state == EnemyBossState.OLD_MOVE_TASK:
-                        state_task = Task(coroutine=self._old_move_state_task(player))
-                    elif self.state == EnemyBossState.JUMP_AND_ATTACK:
-                        state_task = Task(
-                            coroutine=self._jump_and_attack_state_task(player)
-                        )
-                    elif self.state == EnemyBossState.PROJECTILE_ATTACKS:
-                        state_task = Task(
-                            coroutine=self._projectile_attacks_state_task(player)
-                        )
-                    else:
-                        print(f"ERROR: invalid boss state {self.state}")
-                prev_state = self.state
-                state_task.resume()
-                await co_suspend()
+            self.state_machine = StateMachine(
+                {
+                    EnemyBossState.OLD_MOVE_TASK: partial(
+                        self._old_move_state_task, player
+                    ),
+                    EnemyBossState.JUMP_AND_ATTACK: partial(
+                        self._jump_and_attack_state_task, player
+                    ),
+                    EnemyBossState.PROJECTILE_ATTACKS: partial(
+                        self._projectile_attacks_state_task, player
+                    ),
+                }
+            )
+            # The state task is closed along with this task (boss destroyed or removed)
+            with self.state_machine as state_machine:
+                while True:
+                    state_machine.update(self.state)
+                    await co_suspend()
         except GeneratorExit:
             pass
 
@@ -223,13 +232,13 @@ class EnemyBoss(Enemy):
         try:
             level_state = LevelState()
             move_speed = 25
-            self._face_player(player)
+            self._face_player()
             move_state_timer = Timer(random.uniform(1.5, 3.0))
             self.anim_sprite.play("move")
             while True:
                 if self._is_outside_of_camera_viewport(Vector2.ZERO):
-                    self._face_player(player)
-                delta_time = self.get_full_time_dilation_with_physics_delta()
+                    self._face_player()
+                delta_time = GameClock.get_node_clock(self).delta_time
                 moved_pos = self.position + self.move_dir * Vector2(
                     move_speed * delta_time, move_speed * delta_time
                 )
@@ -248,7 +257,7 @@ class EnemyBoss(Enemy):
     async def _jump_and_attack_state_task(self, player: Player) -> None:
         try:
             level_state = LevelState()
-            self._face_player(player)
+            self._face_player()
             is_ascending = True
             jump_height = random.randint(35, 50)
             jump_speed = Vector2(random.randint(25, 50), -50)
@@ -257,7 +266,7 @@ class EnemyBoss(Enemy):
             # ASCEND
             self.anim_sprite.play("fly_up")
             while is_ascending:
-                delta_time = self.get_full_time_dilation_with_physics_delta()
+                delta_time = GameClock.get_node_clock(self).delta_time
                 jump_vector = jump_speed * Vector2(delta_time, delta_time)
                 new_pos = self.position + jump_vector
                 new_pos.y = max(new_pos.y, level_state.floor_y - jump_height)
@@ -267,19 +276,19 @@ class EnemyBoss(Enemy):
                 await co_suspend()
             # ATTACK
             self.anim_sprite.play("attack")
-            await co_wait_seconds(0.25)
+            await co_wait_seconds(0.25, clock=GameClock.enemy)
             attack = self._spawn_projectile()
             attack.position = self.position
-            attack.direction = self.position.direction_to(player.position)
+            attack.direction = PlayerPerception.get_direction(self)
             attack.move_speed = 60
-            SceneTree.get_root().add_child(attack)
-            await co_wait_seconds(0.1)
+            EnemyBoss.projectile_pool.add_to_scene(attack)
+            await co_wait_seconds(0.1, clock=GameClock.enemy)
             # DESCENT
             self.anim_sprite.play("fly_down")
             is_descending = True
             jump_speed.y *= -1
             while is_descending:
-                delta_time = self.get_full_time_dilation_with_physics_delta()
+                delta_time = GameClock.get_node_clock(self).delta_time
                 jump_vector = jump_speed * Vector2(delta_time, delta_time)
                 new_pos = self.position + jump_vector
                 new_pos.y = min(new_pos.y, level_state.floor_y)
@@ -294,21 +303,21 @@ class EnemyBoss(Enemy):
 
     async def _projectile_attacks_state_task(self, player: Player) -> None:
         try:
-            self._face_player(player)
+            self._face_player()
             self.anim_sprite.play("idle")
-            await co_wait_seconds(0.75)
+            await co_wait_seconds(0.75, clock=GameClock.enemy)
             self.anim_sprite.play("attack")
-            await co_wait_seconds(0.25)
+            await co_wait_seconds(0.25, clock=GameClock.enemy)
 
             # Random offsets either starting attack high or low (2 = low, -10 = high)
             y_offsets = random.choice([[2, -10, 2], [-10, 2, -10]])
             projectiles_to_spawn = 3
             for i in range(projectiles_to_spawn):
-                self._face_player(player)
+                self._face_player()
                 attack = self._spawn_projectile()
                 attack.position = self.position + Vector2(0, y_offsets[i])
-                SceneTree.get_root().add_child(attack)
-                await co_wait_seconds(1.0)
+                EnemyBoss.projectile_pool.add_to_scene(attack)
+                await co_wait_seconds(1.0, clock=GameClock.enemy)
             self.state = EnemyBossState.JUMP_AND_ATTACK
             await co_suspend()
         except GeneratorExit:
@@ -337,7 +346,7 @@ class EnemyBoss(Enemy):
                 Ease.Cubic.ease_out_vec2,
             )
             while True:
-                delta_time = self.get_full_time_dilation_with_physics_delta()
+                delta_time = GameClock.get_node_clock(self).delta_time
                 landing_timer.tick(delta_time)
                 if landing_timer.has_stopped():
                     self.position = landing_pos
@@ -387,15 +396,15 @@ class EnemyBoss(Enemy):
                     self.position += knock_back_velocity
                     new_pos = self.position + knock_back_velocity
                     self._get_clamped_pos(new_pos, level_state.boundary)
-                    await co_wait_until(lambda: World.get_time_dilation() > 0.0)
+                    await co_wait_world_unpaused()
             shader_instance = self.anim_sprite.shader_instance
             shader_instance.set_float_param("flash_amount", 0.75)
             await co_suspend()
             self.anim_sprite.modulate = Color(255, 255, 255, 200)
             shader_instance.set_float_param("flash_amount", 0.5)
             # Slight delay before splitting
-            await co_wait_seconds(1.0)
+            await co_wait_seconds(1.0, clock=GameClock.enemy)
             await Task(coroutine=self._destroyed_split_task())
-            self.queue_deletion()
+            self.despawn()
         except GeneratorExit:
             pass
@@ -4,7 +4,10 @@ import random
 from crescent_api import Vector2, Node2D
 
 from src.characters.enemy import Enemy
+from src.characters.player_perception import PlayerPerception
 from src.level_state import LevelState
+from src.utils.game_clock import GameClock
+from src.utils.state_machine import StateMachine
 from src.utils.task import *
 from src.utils.timer import Timer
 
@@ -19,42 +22,43 @@ HOVER_HEIGHT = 48
 
 
 class EnemyCrow(Enemy):
+    spawn_animation_name = "fly"
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self._set_base_hp(1)
         self.move_speed = 40
+        self.dormant_seek_speed = self.move_speed
         self.state = EnemyCrowState.HOVERING
+        self.state_machine = StateMachine(
+            {
+                EnemyCrowState.HOVERING: self._hovering_state_task,
+                EnemyCrowState.SWOOPING: self._swooping_state_task,
+                EnemyCrowState.BACK_TO_HOVER: self._back_to_hover_state_task,
+            }
+        )
         self.physics_update_task = Task(coroutine=self._physics_update_task())
         self.player: Optional[Node2D] = None
         self.level_state = LevelState()
 
-    def _start(self) -> None:
-        super()._start()
+    def _on_spawned(self) -> None:
+        super()._on_spawned()
         self.player = self._find_player()
         # Start at a certain height above the floor
         self.position -= Vector2(0, HOVER_HEIGHT)
 
+    def reset(self) -> None:
+        super().reset()
+        self.state = EnemyCrowState.HOVERING
+
     # --- TASKS --- #
     async def _physics_update_task(self) -> None:
         try:
-            prev_state = None
-            state_task: Optional[Task] = None
-            while True:
-                # Update state task if changed
-                if self.state != prev_state:
-                    if state_task:
-                        state_task.close()
-                    if self.state == EnemyCrowState.HOVERING:
-                        state_task = Task(coroutine=self._hovering_state_task())
-                    elif self.state == EnemyCrowState.SWOOPING:
-                        state_task = Task(coroutine=self._swooping_state_task())
-                    elif self.state == EnemyCrowState.BACK_TO_HOVER:
-                        state_task = Task(coroutine=self._back_to_hover_state_task())
-                    else:
-                        print(f"ERROR: Invalid crow state {self.state}!")
-                prev_state = self.state
-                state_task.resume()
-                await co_suspend()
+            with self.state_machine as state_machine:
+                while True:
+                    # Update state task if changed
+                    state_machine.update(self.state)
+                    await co_suspend()
         except GeneratorExit:
             pass
 
@@ -63,17 +67,17 @@ class EnemyCrow(Enemy):
             self.anim_sprite.play(name="fly")
             swoop_timer = Timer(random.uniform(5.0, 8.0))
             player_dir_update_timer = Timer(random.uniform(2.0, 4.0))
-            player_dir = self.position.direction_to(self.player.position)
+            player_dir = PlayerPerception.get_direction(self)
             while True:
                 # if self._is_outside_of_level_boundary():
                 #     self.queue_deletion()
                 #     await co_return()
 
-                delta_time = self.get_full_time_dilation_with_physics_delta()
+                delta_time = GameClock.get_node_clock(self).delta_time
                 move_vector = Vector2(
                     self.move_speed * delta_time, self.move_speed * delta_time
                 )
-                distance_from_player = self.position.distance_to(self.player.position)
+                distance_from_player = PlayerPerception.get_distance(self)
                 swoop_timer.tick(delta_time)
                 if swoop_timer.time_remaining <= 0.0 and distance_from_player < 80:
                     self.state = EnemyCrowState.SWOOPING
@@ -83,7 +87,7 @@ class EnemyCrow(Enemy):
                     player_dir_update_timer.time_remaining <= 0.0
                     or distance_from_player > 90
                 ):
-                    player_dir = self.position.direction_to(self.player.position)
+                    player_dir = PlayerPerception.get_direction(self)
                     player_dir_update_timer.time = random.uniform(2.0, 4.0)
                     player_dir_update_timer.reset()
                 if player_dir.x > 0:
@@ -101,7 +105,7 @@ class EnemyCrow(Enemy):
             self.anim_sprite.stop()
             self.anim_sprite.set_current_animation_frame(frame=0)
             swoop_speed = self.move_speed + 10
-            player_dir = self.position.direction_to(self.player.position)
+            player_dir = PlayerPerception.get_direction(self)
             if player_dir.x > 0:
                 self.anim_sprite.flip_h = False
             else:
@@ -111,7 +115,7 @@ class EnemyCrow(Enemy):
                     self.state = EnemyCrowState.BACK_TO_HOVER
                     await co_return()
 
-                delta_time = self.get_full_time_dilation_with_physics_delta()
+                delta_time = GameClock.get_node_clock(self).delta_time
                 move_vector = Vector2(
                     swoop_speed * delta_time, swoop_speed * delta_time
                 )
@@ -137,7 +141,7 @@ class EnemyCrow(Enemy):
                     self.state = EnemyCrowState.HOVERING
                     await co_return()
 
-                delta_time = self.get_full_time_dilation_with_physics_delta()
+                delta_time = GameClock.get_node_clock(self).delta_time
                 move_vector = Vector2(
                     self.move_speed * delta_time, self.move_speed * delta_time
                 )
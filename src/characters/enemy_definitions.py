@@ -1,4 +1,4 @@
-from typing import Type, List, Optional
+from typing import Dict, Type, List, Optional
 
 from src.characters.enemy_boss import EnemyBoss
 from src.characters.enemy_crow import EnemyCrow
@@ -17,9 +17,14 @@ class EnemyScenePaths:
 
 class EnemyDefinition:
     """
-    Abstract definition for enemies
+    Abstract definition for enemies.  Definitions are created once per enemy and shared (copying one returns it),
+    so they mustn't be modified.
     """
 
+    # Scene path -> definition
+    _definitions: Dict[str, "EnemyDefinition"] = {}
+    _all: List["EnemyDefinition"] = []
+
     def __init__(
         self,
         scene_path: str,
@@ -27,16 +32,33 @@ class EnemyDefinition:
         max_total_count: int,
         max_spawn_count=1,
         max_total_on_one_side: Optional[int] = None,
+        is_pooled=True,
     ):
         self.scene_path = scene_path
         self.enemy_type = enemy_type
         self.max_total_count = max_total_count
         self.max_spawn_count = max_spawn_count
         self.max_total_on_one_side = max_total_on_one_side
+        # Pooled enemies are reused instead of deleted, see 'EnemyPool'
+        self.is_pooled = is_pooled
+
+    def __copy__(self) -> "EnemyDefinition":
+        return self
+
+    def __deepcopy__(self, memo) -> "EnemyDefinition":
+        return self
+
+    @staticmethod
+    def _get_or_create(scene_path: str, **kwargs) -> "EnemyDefinition":
+        enemy_def = EnemyDefinition._definitions.get(scene_path, None)
+        if not enemy_def:
+            enemy_def = EnemyDefinition(scene_path=scene_path, **kwargs)
+            EnemyDefinition._definitions[scene_path] = enemy_def
+        return enemy_def
 
     @staticmethod
     def RABBIT() -> "EnemyDefinition":
-        return EnemyDefinition(
+        return EnemyDefinition._get_or_create(
             scene_path=EnemyScenePaths.RABBIT,
             enemy_type=EnemyRabbit,
             max_total_count=6,
@@ -45,7 +67,7 @@ class EnemyDefinition:
 
     @staticmethod
     def SNAKE() -> "EnemyDefinition":
-        return EnemyDefinition(
+        return EnemyDefinition._get_or_create(
             scene_path=EnemyScenePaths.SNAKE,
             enemy_type=EnemySnake,
             max_total_count=6,
@@ -54,7 +76,7 @@ class EnemyDefinition:
 
     @staticmethod
     def JESTER() -> "EnemyDefinition":
-        return EnemyDefinition(
+        return EnemyDefinition._get_or_create(
             scene_path=EnemyScenePaths.JESTER,
             enemy_type=EnemyJester,
             max_total_count=2,
@@ -64,7 +86,7 @@ class EnemyDefinition:
 
     @staticmethod
     def CROW() -> "EnemyDefinition":
-        return EnemyDefinition(
+        return EnemyDefinition._get_or_create(
             scene_path=EnemyScenePaths.CROW,
             enemy_type=EnemyCrow,
             max_total_count=3,
@@ -73,16 +95,23 @@ class EnemyDefinition:
 
     @staticmethod
     def BOSS() -> "EnemyDefinition":
-        return EnemyDefinition(
-            scene_path=EnemyScenePaths.BOSS, enemy_type=EnemyBoss, max_total_count=1
+        return EnemyDefinition._get_or_create(
+            scene_path=EnemyScenePaths.BOSS,
+            enemy_type=EnemyBoss,
+            max_total_count=1,
+            is_pooled=False,
         )
 
     @staticmethod
     def ALL() -> List["EnemyDefinition"]:
-        return [
-            EnemyDefinition.RABBIT(),
-            EnemyDefinition.SNAKE(),
-            EnemyDefinition.JESTER(),
-            EnemyDefinition.CROW(),
-            EnemyDefinition.BOSS(),
-        ]
+        if not EnemyDefinition._all:
+            EnemyDefinition._all.extend(
+                [
+                    EnemyDefinition.RABBIT(),
+                    EnemyDefinition.SNAKE(),
+                    EnemyDefinition.JESTER(),
+                    EnemyDefinition.CROW(),
+                    EnemyDefinition.BOSS(),
+                ]
+            )
+        return EnemyDefinition._all
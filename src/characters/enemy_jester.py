@@ -1,9 +1,15 @@
+import math
 import random
 
 from crescent_api import *
 
 from src.characters.enemy import Enemy, EnemyAttack, EnemyAttackOwnerDeletionMode
+from src.characters.player_perception import PlayerPerception
 from src.level_state import LevelState
+from src.utils.game_clock import GameClock
+from src.utils.kinematics import Kinematics
+from src.utils.node_pool import NodePool
+from src.utils.state_machine import StateMachine
 from src.utils.task import *
 from src.utils.timer import Timer
 
@@ -22,7 +28,6 @@ class EnemyJesterProjectile(EnemyAttack):
         )
 
     def _start(self) -> None:
-        self.move_speed = 40
         size = Size2D(4, 4)
         self.collider = Collider2D.new()
         self.collider.extents = size
@@ -34,52 +39,80 @@ class EnemyJesterProjectile(EnemyAttack):
         )
         self.sprite.draw_source = Rect2(0, 0, 8, 8)
         self.add_child(self.sprite)
+        super()._start()
+
+    def _on_spawned(self) -> None:
+        self.move_speed = 40
         self.physics_update_task = Task(coroutine=self._physics_update_task())
+        super()._on_spawned()
 
     # --- TASKS --- #
     async def _physics_update_task(self) -> None:
         try:
             # Go a certain amount of frames at half speed to telegraph projectile
             frames_to_telegraph_attack = 6
-            full_move_speed = self.move_speed
-            self.move_speed /= 2.0
+            Kinematics.set_speed_scale(self, 0.5)
             for i in range(frames_to_telegraph_attack):
                 await co_suspend()
-            self.move_speed = full_move_speed
+            Kinematics.set_speed_scale(self, 1.0)
 
-            life_timer = Timer(15.0)
+            life_timer = Timer(15.0, clock=GameClock.get_node_clock(self))
             while life_timer.time_remaining > 0.0:
-                life_timer.tick(self.get_full_time_dilation_with_physics_delta())
+                life_timer.tick()
                 await co_suspend()
-            self.queue_deletion()
+            self.despawn()
         except GeneratorExit:
             self.physics_update_task = None
 
 
 class EnemyJester(Enemy):
+    spawn_animation_name = "idle"
+    projectile_pool = NodePool(
+        "EnemyJesterProjectile", EnemyJesterProjectile.new, size=6
+    )
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self.anim_sprite: Optional[AnimatedSprite] = None
         self._set_base_hp(2)
         self.state = EnemyJesterState.FOLLOWING_PLAYER
+        self.state_machine = StateMachine(
+            {
+                EnemyJesterState.FOLLOWING_PLAYER: self._follow_player_task,
+                EnemyJesterState.RETREATING_FROM_PLAYER: self._retreat_from_player_task,
+                EnemyJesterState.READY_FOR_ATTACK: self._ready_for_attack_task,
+            }
+        )
         self.physics_update_task = Task(coroutine=self._physics_update_task())
         self.move_speed = 30
+        self.dormant_seek_speed = self.move_speed
         self.move_dir = Vector2.RIGHT
         self.player: Optional[Node2D] = None
         self.level_state = LevelState()
 
+    def reset(self) -> None:
+        super().reset()
+        self.state = EnemyJesterState.FOLLOWING_PLAYER
+        self.move_dir = Vector2.RIGHT
+
+    def _start(self) -> None:
+        super()._start()
+        EnemyJester.projectile_pool.prewarm()
+
     def _spawn_projectile_attack(self) -> None:
-        attack = EnemyJesterProjectile.new()
+        attack: EnemyJesterProjectile = EnemyJester.projectile_pool.acquire()
         attack.set_owner(self)
         y_offset = random.choice([2, -10])  # 2 = low, -10 = high
         attack.position = self.position + Vector2(0, y_offset)
         attack.direction = self.move_dir
         attack.z_index = self.z_index + 1
-        SceneTree.get_root().add_child(attack)
+        EnemyJester.projectile_pool.add_to_scene(attack)
 
     def _determine_state(self, attack_range=MinMax(36, 40)) -> str:
-        pos_to_check = Vector2(self.player.position.x, self.level_state.floor_y)
-        distance_to_player = self.position.distance_to(pos_to_check)
+        distance_to_player = math.hypot(
+            PlayerPerception.get_offset_x(self),
+            self.level_state.floor_y - self.position.y,
+        )
         if attack_range.is_above(distance_to_player):
             return EnemyJesterState.FOLLOWING_PLAYER
         elif attack_range.is_below(distance_to_player):
@@ -90,33 +123,18 @@ class EnemyJester(Enemy):
     async def _physics_update_task(self) -> None:
         try:
             self.player = self._find_player()
-            prev_state = None
-            state_task: Optional[Task] = None
-            if self.player.position.x > self.position.x:
-                self.move_dir = Vector2.RIGHT
-            else:
+            self.move_dir = PlayerPerception.get_horizontal_direction(self)
+            if self.move_dir == Vector2.LEFT:
                 anim_sprite = self.get_child("AnimatedSprite")
                 anim_sprite.flip_h = True
-                self.move_dir = Vector2.LEFT
-            while True:
-                # if self._is_outside_of_level_boundary():
-                #     self.queue_deletion()
-                #     await co_return()
-                # Change state task if previous state doesn't match current
-                if self.state != prev_state:
-                    if state_task:
-                        state_task.close()
-                    if self.state == EnemyJesterState.FOLLOWING_PLAYER:
-                        state_task = Task(coroutine=self._follow_player_task())
-                    elif self.state == EnemyJesterState.RETREATING_FROM_PLAYER:
-                        state_task = Task(coroutine=self._retreat_from_player_task())
-                    elif self.state == EnemyJesterState.READY_FOR_ATTACK:
-                        state_task = Task(coroutine=self._ready_for_attack_task())
-                    else:
-                        print(f"ERROR: {self.state} is in invalid state!")
-                prev_state = self.state
-                state_task.resume()
-                await co_suspend()
+            with self.state_machine as state_machine:
+                while True:
+                    # if self._is_outside_of_level_boundary():
+                    #     self.queue_deletion()
+                    #     await co_return()
+                    # Change state task if previous state doesn't match current
+                    state_machine.update(self.state)
+                    await co_suspend()
         except GeneratorExit:
             pass
 
@@ -124,7 +142,7 @@ class EnemyJester(Enemy):
         try:
             self.anim_sprite.play("walk")
             while True:
-                delta_time = self.get_full_time_dilation_with_physics_delta()
+                delta_time = GameClock.get_node_clock(self).delta_time
                 self.position += self.move_dir * Vector2(
                     self.move_speed * delta_time, self.move_speed * delta_time
                 )
@@ -138,7 +156,7 @@ class EnemyJester(Enemy):
             self.anim_sprite.play("walk")
             retreat_speed = self.move_speed - 10
             while True:
-                delta_time = self.get_full_time_dilation_with_physics_delta()
+                delta_time = GameClock.get_node_clock(self).delta_time
                 self.position -= self.move_dir * Vector2(
                     retreat_speed * delta_time, retreat_speed * delta_time
                 )
@@ -157,17 +175,17 @@ class EnemyJester(Enemy):
             has_attacked_once = False
             attack_timer = Timer(random.uniform(0.25, 2.0))
             while True:
-                attack_timer.tick(self.get_full_time_dilation_with_physics_delta())
+                attack_timer.tick(GameClock.get_node_clock(self).delta_time)
                 if attack_timer.time_remaining <= 0.0:
                     # TODO: Temp telegraph, maybe make an anim later...
                     self.anim_sprite.modulate = Color(1000, 1000, 1000)
-                    await co_wait_seconds(0.2)
+                    await co_wait_seconds(0.2, clock=GameClock.enemy)
                     self._spawn_projectile_attack()
                     attack_timer.time = random.uniform(0.25, 3.0)
                     attack_timer.reset()
                     self.anim_sprite.modulate = Color.WHITE
                     # Slight cooldown after attacking
-                    await co_wait_seconds(0.25)
+                    await co_wait_seconds(0.25, clock=GameClock.enemy)
                     has_attacked_once = True
                 if has_attacked_once:
                     self.state = self._determine_state()
@@ -0,0 +1,36 @@
+from typing import Callable, Optional
+
+from crescent_api import *
+
+from src.characters.enemy import Enemy
+from src.characters.enemy_definitions import EnemyDefinition
+from src.utils.node_pool import NodePool
+from src.utils.scene_cache import SceneCache
+
+
+class EnemyPool(NodePool):
+    """
+    Pool for an enemy definition's instances, pre-warming creates instances up to the definition's 'max_total_count'
+    so their scene instantiation and shader compilation happen ahead of time instead of in the tick a wave is spawned.
+    Parked enemies have their tasks stopped and their collider disabled.
+    """
+
+    def __init__(
+        self,
+        enemy_def: EnemyDefinition,
+        on_enemy_added: Optional[Callable[[Enemy], None]] = None,
+    ):
+        super().__init__(
+            name=enemy_def.enemy_type.__name__,
+            create_node=lambda: SceneCache.get(enemy_def.scene_path).create_instance(),
+            size=enemy_def.max_total_count,
+            on_node_added=on_enemy_added,
+        )
+        self.enemy_def = enemy_def
+
+    def spawn(self, position: Vector2, z_index: int) -> Enemy:
+        enemy: Enemy = self.acquire()
+        enemy.position = position
+        enemy.z_index = z_index
+        self.add_to_scene(enemy)
+        return enemy
@@ -1,11 +1,16 @@
 from crescent_api import Vector2
 
 from src.characters.enemy import Enemy
+from src.characters.player_perception import PlayerPerception
+from src.utils.game_clock import GameClock
+from src.utils.kinematics import Kinematics
 from src.utils.task import *
 from src.utils.timer import Timer
 
 
 class EnemyRabbit(Enemy):
+    spawn_animation_name = "walk"
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self._set_base_hp(1)
@@ -15,9 +20,9 @@ class EnemyRabbit(Enemy):
     def destroy_from_shake(self) -> None:
         if not self.is_destroyed:
             self.is_destroyed = True
-            self.broadcast_event("destroyed", self)
+            self._broadcast_destroyed()
             self.anim_sprite.stop()
-            self.destroyed_task = Task(coroutine=self._destroy_from_shake_task())
+            self._set_destroyed_task(Task(coroutine=self._destroy_from_shake_task()))
 
     # --- TASKS --- #
     async def _destroy_from_shake_task(self) -> None:
@@ -30,7 +35,7 @@ class EnemyRabbit(Enemy):
                 fly_dir = Vector2(-1, -1)
             fly_timer = Timer(5.0)
             while True:
-                delta_time = self.get_full_time_dilation_with_physics_delta()
+                delta_time = GameClock.get_node_clock(self).delta_time
                 fly_timer.tick(delta_time)
                 if fly_timer.has_stopped():
                     break
@@ -38,25 +43,17 @@ class EnemyRabbit(Enemy):
                     fly_speed * delta_time, fly_speed * delta_time
                 )
                 await co_suspend()
-            self.queue_deletion()
+            self.despawn()
         except GeneratorExit:
             pass
 
     async def _physics_update_task(self) -> None:
         try:
-            player = self._find_player()
             move_speed = 30
-            if player.position.x > self.position.x:
-                move_dir = Vector2.RIGHT
-            else:
+            move_dir = PlayerPerception.get_horizontal_direction(self)
+            if move_dir == Vector2.LEFT:
                 self.anim_sprite.flip_h = True
-                move_dir = Vector2.LEFT
-            while True:
-                if not self.is_attached_to_player:
-                    delta_time = self.get_full_time_dilation_with_physics_delta()
-                    self.position += move_dir * Vector2(
-                        move_speed * delta_time, move_speed * delta_time
-                    )
-                await co_suspend()
+            # Moved until the player removes the body once attached
+            Kinematics.add_body(self, move_dir * Vector2(move_speed, move_speed))
         except GeneratorExit:
             pass
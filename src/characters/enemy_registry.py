@@ -0,0 +1,88 @@
+from typing import Dict, Iterator, List, Set, Tuple, Type
+
+from src.characters.enemy import Enemy
+from src.characters.player_perception import PlayerPerception
+
+LEFT_SIDE = 0
+RIGHT_SIDE = 1
+
+
+class EnemyRegistry:
+    """
+    Live enemies indexed by type, with counts of each type's enemies to the left and right of the player.  Counts
+    are kept up to date as enemies are added and removed, so looking them up doesn't depend on the number of enemies.
+    'refresh_sides' is O(n) over the live enemies, but takes their offsets to the player from 'PlayerPerception'
+    (computed once per step for every enemy) instead of reading each enemy's position from the engine, and only
+    updates the counts of enemies that crossed over to the other side of the player.
+    Enemies are indexed by their exact type.
+    """
+
+    def __init__(self):
+        self._enemies_by_type: Dict[Type, Set[Enemy]] = {}
+        # Enemy type -> [left count, right count]
+        self._side_counts: Dict[Type, List[int]] = {}
+        self._enemy_sides: Dict[Enemy, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._enemy_sides)
+
+    def __iter__(self) -> Iterator[Enemy]:
+        return iter(list(self._enemy_sides))
+
+    def __contains__(self, enemy: Enemy) -> bool:
+        return enemy in self._enemy_sides
+
+    @staticmethod
+    def get_side(position_x: float, player_x: float) -> int:
+        return RIGHT_SIDE if position_x > player_x else LEFT_SIDE
+
+    def add(self, enemy: Enemy, player_x: float) -> None:
+        if enemy in self._enemy_sides:
+            return None
+        enemy_type = type(enemy)
+        self._enemies_by_type.setdefault(enemy_type, set()).add(enemy)
+        side = EnemyRegistry.get_side(enemy.position.x, player_x)
+        self._enemy_sides[enemy] = side
+        self._side_counts.setdefault(enemy_type, [0, 0])[side] += 1
+
+    def remove(self, enemy: Enemy) -> bool:
+        side = self._enemy_sides.pop(enemy, None)
+        if side is None:
+            return False
+        enemy_type = type(enemy)
+        self._enemies_by_type[enemy_type].discard(enemy)
+        self._side_counts[enemy_type][side] -= 1
+        return True
+
+    def clear(self) -> None:
+        self._enemies_by_type.clear()
+        self._side_counts.clear()
+        self._enemy_sides.clear()
+
+    def get_count(self, enemy_type: Type) -> int:
+        enemies = self._enemies_by_type.get(enemy_type, None)
+        return len(enemies) if enemies else 0
+
+    def get_side_counts(self, enemy_type: Type) -> Tuple[int, int]:
+        """
+        Returns the (left, right) counts of the type's enemies as of the last refresh.
+        """
+        side_counts = self._side_counts.get(enemy_type, None)
+        if not side_counts:
+            return 0, 0
+        return side_counts[LEFT_SIDE], side_counts[RIGHT_SIDE]
+
+    def refresh_sides(self) -> None:
+        if PlayerPerception.player_position is None:
+            return None
+        enemy_sides = self._enemy_sides
+        for enemy, side in enemy_sides.items():
+            # Offset is positive when the player is to the right of the enemy
+            new_side = (
+                RIGHT_SIDE if PlayerPerception.get_offset_x(enemy) < 0.0 else LEFT_SIDE
+            )
+            if new_side != side:
+                enemy_sides[enemy] = new_side
+                side_counts = self._side_counts[type(enemy)]
+                side_counts[side] -= 1
+                side_counts[new_side] += 1
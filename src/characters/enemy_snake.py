@@ -1,11 +1,16 @@
 from crescent_api import Vector2, MinMax
 
 from src.characters.enemy import Enemy
+from src.characters.player_perception import PlayerPerception
+from src.utils.game_clock import GameClock
+from src.utils.kinematics import Kinematics
 from src.utils.task import *
 from src.utils.timer import Timer
 
 
 class EnemySnake(Enemy):
+    spawn_animation_name = "walk"
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self._set_base_hp(1)
@@ -14,19 +19,16 @@ class EnemySnake(Enemy):
         self.split_range = MinMax(0.9, 0.9)
         self.split_amount = 0.02
 
-    def _get_move_dir(self, player) -> Vector2:
-        if player.position.x > self.position.x:
-            return Vector2.RIGHT
-        else:
-            return Vector2.LEFT
+    def _get_move_dir(self) -> Vector2:
+        return PlayerPerception.get_horizontal_direction(self)
 
     def destroy_from_contact(self) -> None:
         # TODO: Fix rotation position with camera in engine.
         if not self.is_destroyed:
             self.is_destroyed = True
-            self.broadcast_event("destroyed", self)
+            self._broadcast_destroyed()
             self.anim_sprite.play("death")
-            self.destroyed_task = Task(coroutine=self._destroy_from_contact_task())
+            self._set_destroyed_task(Task(coroutine=self._destroy_from_contact_task()))
 
     # --- TASKS --- #
     async def _destroy_from_contact_task(self) -> None:
@@ -39,7 +41,7 @@ class EnemySnake(Enemy):
             # Ascend
             ascend_timer = Timer(0.25)
             while True:
-                delta_time = self.get_full_time_dilation_with_physics_delta()
+                delta_time = GameClock.get_node_clock(self).delta_time
                 ascend_timer.tick(delta_time)
                 if ascend_timer.has_stopped():
                     break
@@ -52,7 +54,7 @@ class EnemySnake(Enemy):
             fly_dir = Vector2(0, 1)
             descend_timer = Timer(4.5)
             while True:
-                delta_time = self.get_full_time_dilation_with_physics_delta()
+                delta_time = GameClock.get_node_clock(self).delta_time
                 descend_timer.tick(delta_time)
                 if descend_timer.has_stopped():
                     break
@@ -60,30 +62,26 @@ class EnemySnake(Enemy):
                     fly_speed * delta_time, fly_speed * delta_time
                 )
                 await co_suspend()
-            self.queue_deletion()
+            self.despawn()
         except GeneratorExit:
             pass
 
     async def _physics_update_task(self) -> None:
         try:
-            player = self._find_player()
             move_speed = 30
             has_passed_player = False
-            move_dir = self._get_move_dir(player)
+            move_dir = self._get_move_dir()
             if move_dir == Vector2.LEFT:
                 self.anim_sprite.flip_h = True
+            Kinematics.add_body(self, move_dir * Vector2(move_speed, move_speed))
             while True:
                 if has_passed_player and self._is_outside_of_camera_viewport():
                     self.destroy()
                     await co_return()
                 else:
-                    dir_to_player = self._get_move_dir(player)
+                    dir_to_player = self._get_move_dir()
                     if move_dir != dir_to_player:
                         has_passed_player = True
-                delta_time = self.get_full_time_dilation_with_physics_delta()
-                self.position += move_dir * Vector2(
-                    move_speed * delta_time, move_speed * delta_time
-                )
                 await co_suspend()
         except GeneratorExit:
             pass
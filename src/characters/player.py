@@ -2,6 +2,7 @@ import random
 
 from src.characters.enemy import Enemy, EnemyAttack
 from src.characters.player_attack import (
+    PlayerAttack,
     PlayerMeleeAttack,
     PlayerSpecialAttack,
     PlayerDualSpecialAttack,
@@ -11,9 +12,17 @@ from src.environment.bridge_gate import BridgeGate
 from src.items import *
 from src.level_area_type import LevelAreaType
 from src.level_state import LevelState
+from src.utils.collision import CollisionLayer, CollisionWorld, ContactTracker
+from src.utils.frame_context import FrameContext
+from src.utils.game_clock import GameClock
+from src.utils.state_machine import StateMachine
 from src.utils.game_math import clamp, Easer, Ease
+from src.utils.kinematics import Kinematics
+from src.utils.node_pool import NodePool
+from src.utils.render_interpolation import RenderInterpolation
 from src.utils.task import *
 from src.utils.timer import Timer
+from src.utils.type_dispatch import TypeDispatch
 
 
 class PlayerStance:
@@ -29,6 +38,12 @@ class PlayerAbility:
 
 
 class Player(Node2D):
+    collision_layer = CollisionLayer.PLAYER
+    # Items are added to the mask in areas that have them
+    collision_mask = (
+        CollisionLayer.ENEMY | CollisionLayer.ENEMY_ATTACK | CollisionLayer.BRIDGE_GATE
+    )
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self.anim_sprite: Optional[AnimatedSprite] = None
@@ -55,10 +70,40 @@ class Player(Node2D):
         self.enemy_collision_invincible = False
         self.in_attack_damage_cooldown = False
         self.damage_cooldown_time = 1.5
+        self._contact_damage_cooldown_task: Optional[Task] = None
+        self.contact_tracker: Optional[ContactTracker] = None
+        self._touched_items: List[Item] = []
         self.block_energy_gain_from_attacks = False
+        # Attacks are pooled, pools are sized for the most attacks that can be in play at once
+        self.melee_attack_pool = NodePool(
+            "PlayerMeleeAttack",
+            PlayerMeleeAttack.new,
+            size=2,
+            on_node_added=self._on_attack_added,
+        )
+        self.special_attack_pool = NodePool(
+            "PlayerSpecialAttack",
+            PlayerSpecialAttack.new,
+            size=4,
+            on_node_added=self._on_attack_added,
+        )
+        self.dual_special_attack_pool = NodePool(
+            "PlayerDualSpecialAttack",
+            PlayerDualSpecialAttack.new,
+            size=2,
+            on_node_added=self._on_attack_added,
+        )
+        self.stance_state_machine = StateMachine(
+            {
+                PlayerStance.STANDING: self._stand_stance_task,
+                PlayerStance.CROUCHING: self._crouch_stance_task,
+                PlayerStance.IN_AIR: self._in_air_stance_task,
+            }
+        )
         self.physics_update_task = Task(coroutine=self._physics_update_task())
+        # Tasks that run alongside the stance task (collision, abilities, health restore, etc...)
+        self.physics_task_group = TaskGroup()
         self.ability_task: Optional[Task] = None
-        self.health_restore_task: Optional[Task] = None
         self.attack_slash_audio_source = AudioManager.get_audio_source(
             "assets/audio/sfx/attack_slash.wav"
         )
@@ -77,6 +122,9 @@ class Player(Node2D):
         self.pause_game_toggle_audio_source = AudioManager.get_audio_source(
             "assets/audio/sfx/pause_game_toggle.wav"
         )
+        self.player_hurt_audio_source = AudioManager.get_audio_source(
+            "assets/audio/sfx/player_hurt.wav"
+        )
         self._current_animation_name = ""  # TODO: Add function to engine instead
         self.item_handler: Optional[PlayerItemHandler] = None
         self.input_enabled = True
@@ -88,16 +136,39 @@ class Player(Node2D):
         )
 
         self.collider = self.get_child("Collider2D")
+        CollisionWorld.register_collider(
+            self.collider, self.collision_layer, self.collision_mask
+        )
+        self.contact_tracker = ContactTracker(self.collider)
+        self.contact_tracker.contact_entered.subscribe(self._on_contact_entered)
+        self.contact_tracker.contact_stay.subscribe(self._on_contact_stay)
+        self.contact_tracker.contact_exited.subscribe(self._on_contact_exited)
+        RenderInterpolation.add_node(self)
         self.stats.refresh_bar_nodes()
         Camera2D.follow_node(self)
+        FrameContext.set_player(self)
+        GameClock.join_group(self, "player")
 
         # Start with 0 energy
         self.stats.energy = 0
         self.item_handler = PlayerItemHandler()
+        TaskScheduler().add_node_task(self, self.physics_update_task)
+
+        self.melee_attack_pool.prewarm(self)
+        self.special_attack_pool.prewarm()
+        self.dual_special_attack_pool.prewarm()
+
+    def set_item_collisions_enabled(self, enabled: bool) -> None:
+        if enabled:
+            self.collision_mask |= CollisionLayer.ITEM
+        else:
+            self.collision_mask &= ~CollisionLayer.ITEM
+        if self.collider:
+            CollisionWorld.set_collider_mask(self.collider, self.collision_mask)
 
     @staticmethod
     def find_player() -> Optional["Player"]:
-        player: Player = SceneTree.get_root().get_child("Player")
+        player: Player = FrameContext.player or SceneTree.get_root().get_child("Player")
         return player
 
     def _update(self, delta_time: float) -> None:
@@ -124,16 +195,16 @@ class Player(Node2D):
                 elif Input.is_action_just_pressed("special"):
                     if self.stats.energy >= self.stats.base_energy:
                         if self._ability == PlayerAbility.SLOW_TIME:
-                            self.ability_task = Task(
-                                coroutine=self._ability_slow_time_task()
+                            self._start_ability_task(
+                                Task(coroutine=self._ability_slow_time_task())
                             )
                         elif self._ability == PlayerAbility.DUAL_SPECIAL:
-                            self.ability_task = Task(
-                                coroutine=self._ability_dual_special_task()
+                            self._start_ability_task(
+                                Task(coroutine=self._ability_dual_special_task())
                             )
                         elif self._ability == PlayerAbility.HOOD_FORM:
-                            self.ability_task = Task(
-                                coroutine=self._ability_hood_form_task()
+                            self._start_ability_task(
+                                Task(coroutine=self._ability_hood_form_task())
                             )
             else:
                 if (
@@ -146,8 +217,9 @@ class Player(Node2D):
                 ):
                     self._shake_attached_enemies()
 
-    def _fixed_update(self, delta_time: float) -> None:
-        self.physics_update_task.resume()
+    def _start_ability_task(self, task: Task) -> None:
+        self.physics_task_group.cancel_task(self.ability_task)
+        self.ability_task = self.physics_task_group.add_task(task)
 
     def play_animation(self, anim_name: str) -> None:
         self._current_animation_name = anim_name
@@ -186,41 +258,80 @@ class Player(Node2D):
     def _activate_item(self, item: Item) -> None:
         item.on_activation()
         self.item_handler.hide_description()
+        self._show_touched_item_description()
         if item.can_be_collected:
             item.collect()
             if item.play_collected_sfx:
                 AudioManager.play_sound(self.collect_item_audio_source)
             # Item specific
             item_type = type(item)
-            if issubclass(item_type, HealthRestoreItem):
-                health_item: HealthRestoreItem = item
-                self.health_restore_task = Task(
-                    coroutine=self._health_restore_task(health_item.restore_amount)
-                )
-            elif issubclass(item_type, EnergyRestoredFromAttacksIncreaseItem):
-                self.stats.energy_restored_from_attacks += (
-                    self.stats.energy_restored_from_attacks * 0.33
-                )
-            elif issubclass(item_type, DamageDecreaseItem):
-                self.stats.damage_taken_from_attacks_multiple -= 0.25
-            elif issubclass(item_type, SpecialAttackDoubledItem):
-                self.stats.double_special_attack_chance += 25
-            elif issubclass(item_type, SpecialAttackTimeDecreaseItem):
-                self.stats.special_attack_charge_time -= 1
-            elif issubclass(item_type, SaveChargeItem):
-                self.stats.save_charge_chance += 25
-            elif issubclass(item_type, DamageDeflectWhenChargedItem):
-                self.deflect_damage_when_charged = True
-            elif issubclass(item_type, AbilitySlowTimeItem):
-                self.set_ability(PlayerAbility.SLOW_TIME)
-            elif issubclass(item_type, AbilityDualSpecialItem):
-                self.set_ability(PlayerAbility.DUAL_SPECIAL)
-            elif issubclass(item_type, AbilityHoodFormItem):
-                self.set_ability(PlayerAbility.HOOD_FORM)
+            item_activation_handler = Player.item_activation_handlers.get(item_type)
+            if item_activation_handler:
+                item_activation_handler(self, item)
 
             if item.is_unique:
                 self.item_handler.held_unique_items.append(item_type)
 
+    def _on_health_restore_item_activated(self, item: HealthRestoreItem) -> None:
+        self.physics_task_group.add_task(
+            Task(coroutine=self._health_restore_task(item.restore_amount))
+        )
+
+    def _on_energy_restored_from_attacks_increase_item_activated(
+        self, item: EnergyRestoredFromAttacksIncreaseItem
+    ) -> None:
+        self.stats.energy_restored_from_attacks += (
+            self.stats.energy_restored_from_attacks * 0.33
+        )
+
+    def _on_damage_decrease_item_activated(self, item: DamageDecreaseItem) -> None:
+        self.stats.damage_taken_from_attacks_multiple -= 0.25
+
+    def _on_special_attack_doubled_item_activated(
+        self, item: SpecialAttackDoubledItem
+    ) -> None:
+        self.stats.double_special_attack_chance += 25
+
+    def _on_special_attack_time_decrease_item_activated(
+        self, item: SpecialAttackTimeDecreaseItem
+    ) -> None:
+        self.stats.special_attack_charge_time -= 1
+
+    def _on_save_charge_item_activated(self, item: SaveChargeItem) -> None:
+        self.stats.save_charge_chance += 25
+
+    def _on_damage_deflect_when_charged_item_activated(
+        self, item: DamageDeflectWhenChargedItem
+    ) -> None:
+        self.deflect_damage_when_charged = True
+
+    def _on_ability_slow_time_item_activated(self, item: AbilitySlowTimeItem) -> None:
+        self.set_ability(PlayerAbility.SLOW_TIME)
+
+    def _on_ability_dual_special_item_activated(
+        self, item: AbilityDualSpecialItem
+    ) -> None:
+        self.set_ability(PlayerAbility.DUAL_SPECIAL)
+
+    def _on_ability_hood_form_item_activated(self, item: AbilityHoodFormItem) -> None:
+        self.set_ability(PlayerAbility.HOOD_FORM)
+
+    # Item type -> effect applied when the item is collected
+    item_activation_handlers = TypeDispatch(
+        {
+            HealthRestoreItem: _on_health_restore_item_activated,
+            EnergyRestoredFromAttacksIncreaseItem: _on_energy_restored_from_attacks_increase_item_activated,
+            DamageDecreaseItem: _on_damage_decrease_item_activated,
+            SpecialAttackDoubledItem: _on_special_attack_doubled_item_activated,
+            SpecialAttackTimeDecreaseItem: _on_special_attack_time_decrease_item_activated,
+            SaveChargeItem: _on_save_charge_item_activated,
+            DamageDeflectWhenChargedItem: _on_damage_deflect_when_charged_item_activated,
+            AbilitySlowTimeItem: _on_ability_slow_time_item_activated,
+            AbilityDualSpecialItem: _on_ability_dual_special_item_activated,
+            AbilityHoodFormItem: _on_ability_hood_form_item_activated,
+        }
+    )
+
     def _are_enemies_attached(self) -> bool:
         return (
             len(self.enemies_attached_to_left) > 0
@@ -250,8 +361,7 @@ class Player(Node2D):
             attack_dir = Vector2.RIGHT
         attack_z_index = self.z_index + 1
         if self.can_do_special_attack:
-            main_node = SceneTree.get_root()
-            special_attack = PlayerSpecialAttack.new()
+            special_attack: PlayerSpecialAttack = self.special_attack_pool.acquire()
             special_attack.z_index = attack_z_index
             special_attack.direction = attack_dir
             special_attack.flip_h = flip_h
@@ -259,15 +369,12 @@ class Player(Node2D):
                 is_crouching=self.stance == PlayerStance.CROUCHING,
                 base_pos=self.position,
             )
-            special_attack.subscribe_to_event(
-                event_id="hit_enemy",
-                scoped_node=self,
-                callback_func=lambda enemy: self._on_attack_hit_enemy(enemy),
-            )
-            main_node.add_child(special_attack)
+            self.special_attack_pool.add_to_scene(special_attack)
             # Check to see if we can double the special attack
             if random.randint(1, 100) <= self.stats.double_special_attack_chance:
-                second_special_attack = PlayerSpecialAttack.new()
+                second_special_attack: PlayerSpecialAttack = (
+                    self.special_attack_pool.acquire()
+                )
                 second_special_attack.z_index = attack_z_index
                 second_special_attack.direction = attack_dir
                 second_special_attack.flip_h = flip_h
@@ -275,12 +382,7 @@ class Player(Node2D):
                     is_crouching=self.stance == PlayerStance.CROUCHING,
                     base_pos=self.position + (attack_dir * Vector2(20, 0)),
                 )
-                second_special_attack.subscribe_to_event(
-                    event_id="hit_enemy",
-                    scoped_node=self,
-                    callback_func=lambda enemy: self._on_attack_hit_enemy(enemy),
-                )
-                main_node.add_child(second_special_attack)
+                self.special_attack_pool.add_to_scene(second_special_attack)
 
             # Save charge chance
             can_save_charge = random.randint(1, 100) <= self.stats.save_charge_chance
@@ -289,23 +391,26 @@ class Player(Node2D):
 
             AudioManager.play_sound(source=self.special_attack_slash_audio_source)
         else:
-            melee_attack = PlayerMeleeAttack.new()
-            melee_attack.subscribe_to_event(
-                event_id="hit_enemy",
-                scoped_node=self,
-                callback_func=lambda enemy: self._on_attack_hit_enemy(enemy),
-            )
+            melee_attack: PlayerMeleeAttack = self.melee_attack_pool.acquire()
             melee_attack.z_index = attack_z_index
             melee_attack.flip_h = flip_h
             melee_attack.update_attack_offset(
                 is_crouching=self.stance == PlayerStance.CROUCHING
             )
-            self.add_child(melee_attack)
+            self.melee_attack_pool.add_to_scene(melee_attack, self)
             self.reset_special_attack_time = True
 
             self.attack_slash_audio_source.pitch = random.choice([0.8, 1.0, 1.2])
             AudioManager.play_sound(source=self.attack_slash_audio_source)
 
+    def _on_attack_added(self, attack: PlayerAttack) -> None:
+        # Pooled attacks are reused, so only subscribe once per attack
+        attack.subscribe_to_event(
+            event_id="hit_enemy",
+            scoped_node=self,
+            callback_func=lambda enemy: self._on_attack_hit_enemy(enemy),
+        )
+
     def _on_attack_hit_enemy(self, enemy: Enemy) -> None:
         if not self.block_energy_gain_from_attacks:
             self.stats.set_energy(
@@ -319,6 +424,111 @@ class Player(Node2D):
         self.attack_hit_audio_source.pitch = random.choice([0.9, 1.0, 1.1])
         AudioManager.play_sound(source=self.attack_hit_audio_source)
 
+    def _start_contact_damage_cooldown(self) -> None:
+        self.in_attack_damage_cooldown = True
+        AudioManager.play_sound(self.player_hurt_audio_source)
+        self._contact_damage_cooldown_task = Task(
+            coroutine=self._damage_cooldown_task()
+        )
+
+    def _on_enemy_contact(self, enemy: Enemy) -> None:
+        if self.enemy_collision_invincible or enemy.is_destroyed:
+            return None
+        if enemy.can_attach_to_player:
+            if not enemy.is_attached_to_player:
+                enemy.is_attached_to_player = True
+                Kinematics.remove_body(enemy)
+                if enemy.position.x > self.position.x:
+                    num_on_right = len(self.enemies_attached_to_right)
+                    floor_y = LevelState().floor_y
+                    enemy.position = Vector2(self.position.x, floor_y) + Vector2(
+                        4 * (num_on_right + 1), 0
+                    )
+                    self.enemies_attached_to_right.append(enemy)
+                else:
+                    num_on_left = len(self.enemies_attached_to_left)
+                    floor_y = LevelState().floor_y
+                    enemy.position = (
+                        Vector2(self.position.x, floor_y)
+                        + Vector2(-2, 0)
+                        + Vector2(-4 * (num_on_left + 1), 0)
+                    )
+                    self.enemies_attached_to_left.append(enemy)
+        elif not self.in_attack_damage_cooldown:
+            if enemy.destroy_on_touch:
+                enemy.destroy_from_contact()
+            self._start_contact_damage_cooldown()
+
+    def _on_enemy_attack_contact(self, enemy_attack: EnemyAttack) -> None:
+        if not self.enemy_collision_invincible and not self.in_attack_damage_cooldown:
+            enemy_attack.despawn()
+            self._start_contact_damage_cooldown()
+
+    def _show_touched_item_description(self) -> None:
+        for item in self._touched_items:
+            self.item_handler.show_description(item)
+
+    def _on_item_contact_entered(self, item: Item) -> None:
+        self._touched_items.append(item)
+        self.item_handler.show_description(item)
+
+    def _on_item_contact_exited(self, item: Item) -> None:
+        self._touched_items.remove(item)
+        if self.item_handler.get_hovered_item() is item:
+            self.item_handler.hide_description()
+            self._show_touched_item_description()
+
+    def _on_bridge_gate_contact_entered(self, bridge_gate: BridgeGate) -> None:
+        # The gate can open while the player is already standing in it
+        bridge_gate.opened.subscribe(self._on_touched_bridge_gate_opened)
+        self._on_touched_bridge_gate_opened(bridge_gate)
+
+    def _on_bridge_gate_contact_exited(self, bridge_gate: BridgeGate) -> None:
+        bridge_gate.opened.unsubscribe(self._on_touched_bridge_gate_opened)
+
+    def _on_touched_bridge_gate_opened(self, bridge_gate: BridgeGate) -> None:
+        if bridge_gate.is_opened and not bridge_gate.has_player_ever_stepped_through:
+            bridge_gate.has_player_ever_stepped_through = True
+            LevelState().queue_gate_transition()
+
+    # Contact node type -> response to the player touching it.  Enemies and their attacks are also checked while
+    # contact stays as damage and attaching are skipped during invincibility and damage cooldown.
+    contact_entered_handlers = TypeDispatch(
+        {
+            Enemy: _on_enemy_contact,
+            EnemyAttack: _on_enemy_attack_contact,
+            Item: _on_item_contact_entered,
+            BridgeGate: _on_bridge_gate_contact_entered,
+        }
+    )
+    contact_stay_handlers = TypeDispatch(
+        {
+            Enemy: _on_enemy_contact,
+            EnemyAttack: _on_enemy_attack_contact,
+        }
+    )
+    contact_exited_handlers = TypeDispatch(
+        {
+            Item: _on_item_contact_exited,
+            BridgeGate: _on_bridge_gate_contact_exited,
+        }
+    )
+
+    def _on_contact_entered(self, node: Node) -> None:
+        contact_handler = Player.contact_entered_handlers.get(type(node))
+        if contact_handler:
+            contact_handler(self, node)
+
+    def _on_contact_stay(self, node: Node) -> None:
+        contact_handler = Player.contact_stay_handlers.get(type(node))
+        if contact_handler:
+            contact_handler(self, node)
+
+    def _on_contact_exited(self, node: Node) -> None:
+        contact_handler = Player.contact_exited_handlers.get(type(node))
+        if contact_handler:
+            contact_handler(self, node)
+
     def _set_transformed(self, is_transformed: bool) -> None:
         if self.is_transformed != is_transformed:
             self.is_transformed = is_transformed
@@ -336,54 +546,37 @@ class Player(Node2D):
     # --- TASKS --- #
     async def _physics_update_task(self):
         level_state = LevelState()
-        collision_task = Task(coroutine=self._collision_check_task())
-        manage_special_attack_state_task = Task(
-            coroutine=self._manage_special_attack_state_task()
-        )
-        manage_ability_ui_task = Task(coroutine=self._manage_ability_ui_task())
-        prev_stance = None
-        current_stance_task: Optional[Task] = None
-
-        def get_new_stance_task() -> Optional[Task]:
-            if self.stance == PlayerStance.STANDING:
-                return Task(coroutine=self._stand_stance_task())
-            elif self.stance == PlayerStance.CROUCHING:
-                return Task(coroutine=self._crouch_stance_task())
-            elif self.stance == PlayerStance.IN_AIR:
-                return Task(coroutine=self._in_air_stance_task())
-            return None
-
         try:
-            while True:
+            # Closing this task closes the group's tasks and the stance task
+            with self.physics_task_group as task_group, self.stance_state_machine as stance_state_machine:
                 # Run take damage (collision) task first
-                collision_task.resume()
-                # Transformation task
-                if self.ability_task:
-                    self.ability_task.resume()
-                    if self.stats.energy == 0:
-                        self._set_transformed(False)
-                        self.ability_task.close()
-                        self.ability_task = None
-                # Health restore task
-                if self.health_restore_task:
-                    self.health_restore_task.resume()
+                task_group.add_task(Task(coroutine=self._collision_check_task()))
                 # Special attack management task
-                manage_special_attack_state_task.resume()
+                task_group.add_task(
+                    Task(coroutine=self._manage_special_attack_state_task())
+                )
                 # Will flash ability bar if full
-                manage_ability_ui_task.resume()
-                # Change stance if different from last frame
-                if prev_stance != self.stance:
-                    if current_stance_task:
-                        current_stance_task.close()
-                    current_stance_task = get_new_stance_task()
-                prev_stance = self.stance
-                # Now run current stance task
-                if current_stance_task and not level_state.is_game_state_paused():
-                    current_stance_task.resume()
-                await co_suspend()
+                task_group.add_task(
+                    Task(
+                        coroutine=self._manage_ability_ui_task(),
+                        priority=TaskPriority.COSMETIC,
+                    )
+                )
+                while True:
+                    # Ability and health restore tasks are added to the group once activated
+                    task_group.resume()
+                    if self.stats.energy == 0 and self.ability_task in task_group:
+                        self._set_transformed(False)
+                        task_group.cancel_task(self.ability_task)
+                        self.ability_task = None
+                    # Change stance if different from last frame
+                    stance_state_machine.set_state(self.stance)
+                    # Now run current stance task
+                    if not level_state.is_game_state_paused():
+                        stance_state_machine.resume()
+                    await co_suspend()
         except GeneratorExit:
-            if current_stance_task:
-                current_stance_task.close()
+            pass
 
     async def _manage_special_attack_state_task(self):
         try:
@@ -396,7 +589,7 @@ class Player(Node2D):
                     charge_timer.reset()
                     self.reset_special_attack_time = False
                 if not level_state.is_currently_transitioning_within_level:
-                    charge_timer.tick(self.get_full_time_dilation_with_physics_delta())
+                    charge_timer.tick(GameClock.get_node_clock(self).delta_time)
                 if charge_timer.has_stopped():
                     self.can_do_special_attack = True
                     shader_instance.set_float_param("outline_width", 1.4)
@@ -410,7 +603,7 @@ class Player(Node2D):
                         self.can_do_special_attack
                         and not self.reset_special_attack_time
                     ):
-                        if World.get_time_dilation() > 0.0:
+                        if GameClock.world.time_dilation > 0.0:
                             shader_instance.set_float_param(
                                 "outline_width", charged_outline_width
                             )
@@ -435,10 +628,11 @@ class Player(Node2D):
             fully_charged_color = Color(240, 247, 243)
             current_color = default_color
             while True:
-                await co_wait_until(lambda: self.stats.energy >= self.stats.base_energy)
+                while self.stats.energy < self.stats.base_energy:
+                    await co_wait_signal(self.stats.energy_changed)
                 toggle_timer = Timer(0.5)
                 while self.stats.energy >= self.stats.base_energy:
-                    toggle_timer.tick(self.get_full_time_dilation_with_physics_delta())
+                    toggle_timer.tick(GameClock.get_node_clock(self).delta_time)
                     if toggle_timer.has_stopped():
                         if current_color == default_color:
                             current_color = fully_charged_color
@@ -491,10 +685,10 @@ class Player(Node2D):
             bar_ui.color = Color(240, 247, 243)
             if modulate_color:
                 self.anim_sprite.modulate = Color(255, 255, 255, 100)
-            cooldown_timer.tick(self.get_full_time_dilation_with_physics_delta())
+            cooldown_timer.tick(GameClock.get_node_clock(self).delta_time)
             await co_suspend()
             while True:
-                delta_time = self.get_full_time_dilation_with_physics_delta()
+                delta_time = GameClock.get_node_clock(self).delta_time
                 cooldown_timer.tick(delta_time)
                 if cooldown_timer.time_remaining > 0.0:
                     if not has_subtracted_health:
@@ -536,91 +730,15 @@ class Player(Node2D):
 
     async def _collision_check_task(self):
         try:
-            damage_cooldown_task: Optional[Task] = None
             attached_damage_cooldown_task: Optional[Task] = None
-            level_state = LevelState()
-            player_hurt_audio_source = AudioManager.get_audio_source(
-                "assets/audio/sfx/player_hurt.wav"
-            )
             while True:
-                collisions = CollisionHandler.process_collisions(self.collider)
-                show_item_description = False
-                for collider in collisions:
-                    collider_parent = collider.get_parent()
-                    collider_parent_type = type(collider_parent)
-                    if collider_parent.is_queued_for_deletion:
-                        continue
-                    # Enemy Collision
-                    if (
-                        issubclass(collider_parent_type, Enemy)
-                        and not self.enemy_collision_invincible
-                        and not collider_parent.is_destroyed
-                    ):
-                        if collider_parent.can_attach_to_player:
-                            if not collider_parent.is_attached_to_player:
-                                collider_parent.is_attached_to_player = True
-                                if collider_parent.position.x > self.position.x:
-                                    num_on_right = len(self.enemies_attached_to_right)
-                                    floor_y = LevelState().floor_y
-                                    collider_parent.position = Vector2(
-                                        self.position.x, floor_y
-                                    ) + Vector2(4 * (num_on_right + 1), 0)
-                                    self.enemies_attached_to_right.append(
-                                        collider_parent
-                                    )
-                                else:
-                                    num_on_left = len(self.enemies_attached_to_left)
-                                    floor_y = LevelState().floor_y
-                                    collider_parent.position = (
-                                        Vector2(self.position.x, floor_y)
-                                        + Vector2(-2, 0)
-                                        + Vector2(-4 * (num_on_left + 1), 0)
-                                    )
-                                    self.enemies_attached_to_left.append(
-                                        collider_parent
-                                    )
-                        elif (
-                            not self.enemy_collision_invincible
-                            and not self.in_attack_damage_cooldown
-                        ):
-                            if collider_parent.destroy_on_touch:
-                                collider_parent.destroy_from_contact()
-                            self.in_attack_damage_cooldown = True
-                            AudioManager.play_sound(player_hurt_audio_source)
-                            damage_cooldown_task = Task(
-                                coroutine=self._damage_cooldown_task()
-                            )
-                    # Enemy Attack Collision
-                    elif (
-                        issubclass(collider_parent_type, EnemyAttack)
-                        and not self.enemy_collision_invincible
-                        and not self.in_attack_damage_cooldown
-                    ):
-                        collider_parent.queue_deletion()
-                        self.in_attack_damage_cooldown = True
-                        AudioManager.play_sound(player_hurt_audio_source)
-                        damage_cooldown_task = Task(
-                            coroutine=self._damage_cooldown_task()
-                        )
-                    # Power Up
-                    elif issubclass(collider_parent_type, Item):
-                        self.item_handler.show_description(collider_parent)
-                        show_item_description = True
-                    elif issubclass(collider_parent_type, BridgeGate):
-                        bridge_gate: BridgeGate = collider_parent
-                        if (
-                            bridge_gate.is_opened
-                            and not bridge_gate.has_player_ever_stepped_through
-                        ):
-                            bridge_gate.has_player_ever_stepped_through = True
-                            level_state.queue_gate_transition()
-                            break
-                if damage_cooldown_task:
-                    if damage_cooldown_task.valid:
-                        damage_cooldown_task.resume()
+                self.contact_tracker.update()
+                if self._contact_damage_cooldown_task:
+                    if self._contact_damage_cooldown_task.valid:
+                        self._contact_damage_cooldown_task.resume()
                     else:
                         self.in_attack_damage_cooldown = False
-                        damage_cooldown_task = None
+                        self._contact_damage_cooldown_task = None
                 # Check for attached damage
                 num_of_attached = self._get_attached_count()
                 if num_of_attached > 0:
@@ -644,11 +762,9 @@ class Player(Node2D):
                         if attached_damage_cooldown_task.valid:
                             attached_damage_cooldown_task.close()
                         attached_damage_cooldown_task = None
-                if not show_item_description:
-                    self.item_handler.hide_description()
                 await co_suspend()
         except GeneratorExit:
-            pass
+            self._contact_damage_cooldown_task = None
 
     async def _attack_task(self):
         try:
@@ -660,7 +776,7 @@ class Player(Node2D):
                 frame_count += 1
                 if frame_count >= 2:
                     self.enemy_collision_invincible = False
-                delta_time = self.get_full_time_dilation_with_physics_delta()
+                delta_time = GameClock.get_node_clock(self).delta_time
                 attack_timer.tick(delta_time)
                 if attack_timer.time_remaining <= 0.0:
                     break
@@ -689,11 +805,12 @@ class Player(Node2D):
 
     async def _ability_dual_special_task(self):
         try:
-            main_node = SceneTree.get_root()
             attack_z_index = self.z_index + 1
             base_attack_pos = self.position + Vector2(0, 2)
             # Right
-            right_special_attack = PlayerDualSpecialAttack.new()
+            right_special_attack: PlayerDualSpecialAttack = (
+                self.dual_special_attack_pool.acquire()
+            )
             right_special_attack.z_index = attack_z_index
             right_special_attack.direction = Vector2.RIGHT.copy()
             right_special_attack.flip_h = False
@@ -701,14 +818,11 @@ class Player(Node2D):
                 is_crouching=False,
                 base_pos=base_attack_pos,
             )
-            right_special_attack.subscribe_to_event(
-                event_id="hit_enemy",
-                scoped_node=self,
-                callback_func=lambda enemy: self._on_attack_hit_enemy(enemy),
-            )
-            main_node.add_child(right_special_attack)
+            self.dual_special_attack_pool.add_to_scene(right_special_attack)
             # Left
-            left_special_attack = PlayerDualSpecialAttack.new()
+            left_special_attack: PlayerDualSpecialAttack = (
+                self.dual_special_attack_pool.acquire()
+            )
             left_special_attack.z_index = attack_z_index
             left_special_attack.direction = Vector2.LEFT.copy()
             left_special_attack.flip_h = True
@@ -716,12 +830,7 @@ class Player(Node2D):
                 is_crouching=False,
                 base_pos=base_attack_pos,
             )
-            left_special_attack.subscribe_to_event(
-                event_id="hit_enemy",
-                scoped_node=self,
-                callback_func=lambda enemy: self._on_attack_hit_enemy(enemy),
-            )
-            main_node.add_child(left_special_attack)
+            self.dual_special_attack_pool.add_to_scene(left_special_attack)
 
             self.stats.energy = 0
 
@@ -772,7 +881,7 @@ class Player(Node2D):
             self.collider.extents = Size2D(12, 16)
             level_state = LevelState()
             while True:
-                delta_time = self.get_full_time_dilation_with_physics_delta()
+                delta_time = GameClock.get_node_clock(self).delta_time
                 if self.attack_requested:
                     self.play_animation("stand_attack")
                     await self._attack_task()
@@ -866,7 +975,7 @@ class Player(Node2D):
             ascent_timer_skips = 0
             is_ascending = True
             while True:
-                delta_time = self.get_full_time_dilation_with_physics_delta()
+                delta_time = GameClock.get_node_clock(self).delta_time
                 if self.attack_requested and not attack_task:
                     attack_task = Task(coroutine=self._attack_task())
                     self.play_animation("stand_attack")
@@ -1002,7 +1111,7 @@ class Player(Node2D):
                 await co_suspend()
 
             while True:
-                delta_time = Engine.get_global_physics_delta_time()
+                delta_time = GameClock.unscaled.delta_time
                 player_beam_timer.tick(delta_time)
                 if player_beam_timer.time_remaining > 0.0:
                     new_beam_pos = player_beam_easer.ease(delta_time)
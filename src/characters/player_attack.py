@@ -1,9 +1,17 @@
 from crescent_api import *
 
 from src.characters.enemy import Enemy
+from src.utils.collision import CollisionLayer, CollisionWorld
+from src.utils.game_clock import GameClock
+from src.utils.kinematics import Kinematics
+from src.utils.render_interpolation import RenderInterpolation
+from src.utils.task import Task, TaskScheduler, co_suspend
 
 
 class PlayerAttack(Node2D):
+    collision_layer = CollisionLayer.PLAYER_ATTACK
+    collision_mask = CollisionLayer.ENEMY
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self.damage = 1
@@ -13,21 +21,69 @@ class PlayerAttack(Node2D):
         self.direction: Optional[Vector2] = None
         self.damaged_enemies = []
         self.flip_h = False
+        self.update_task: Optional[Task] = None
+        self._base_life_time = self.life_time
+        # Set by 'NodePool', pooled attacks are parked when despawned instead of deleted
+        self.pool = None
+        self.is_parked = False
 
     def _start(self) -> None:
         self.collider = Collider2D.new()
         collider_size = self.size - Size2D(0, 1)
         self.collider.extents = collider_size
         self.add_child(self.collider)
+        CollisionWorld.register_collider(
+            self.collider, self.collision_layer, self.collision_mask, is_swept=True
+        )
+        self._base_life_time = self.life_time
+        if self.is_parked:
+            CollisionWorld.set_collider_enabled(self.collider, False)
+        else:
+            self._on_spawned()
+
+    def _on_spawned(self) -> None:
+        """
+        Called once the attack enters play, either when first added to the scene or when taken out of its pool.
+        """
+        self.update_task = TaskScheduler().add_node_task(
+            self, Task(coroutine=self._update_task())
+        )
 
-    def _fixed_update(self, delta_time: float) -> None:
-        # Check collision first
-        collisions = CollisionHandler.process_collisions(self.collider)
+    def unpark(self) -> None:
+        self.is_parked = False
+        self.life_time = self._base_life_time
+        self.damaged_enemies.clear()
+        CollisionWorld.set_collider_enabled(self.collider, True)
+        self._on_spawned()
+
+    def park(self, position: Vector2) -> None:
+        # Attacks despawn themselves from their update task, which isn't closed and returns once 'despawn' does
+        if self.update_task:
+            if not self.update_task.is_running():
+                self.update_task.close()
+            self.update_task = None
+        self.is_parked = True
+        CollisionWorld.set_collider_enabled(self.collider, False)
+        RenderInterpolation.remove_node(self)
+        Kinematics.remove_body(self)
+        self.position = position
+
+    def despawn(self) -> None:
+        """
+        Removes the attack once its life time is over, pooled attacks go back to their pool instead of being deleted.
+        """
+        if self.pool:
+            self.pool.release(self)
+        else:
+            self.queue_deletion()
+
+    def _physics_update(self, delta_time: float) -> None:
+        # Check collision first, only enemies are in the attack's collision mask
+        collisions = CollisionWorld.process_collisions(self.collider)
         for collider in collisions:
-            collider_parent = collider.get_parent()
+            collider_parent: Enemy = collider.get_parent()
             if (
-                issubclass(type(collider_parent), Enemy)
-                and not collider_parent.is_destroyed
+                not collider_parent.is_destroyed
                 and collider_parent not in self.damaged_enemies
             ):
                 self.broadcast_event("hit_enemy", collider_parent)
@@ -36,7 +92,20 @@ class PlayerAttack(Node2D):
 
         self.life_time -= delta_time
         if self.life_time <= 0.0:
-            self.queue_deletion()
+            self.despawn()
+
+    # --- TASKS --- #
+    async def _update_task(self) -> None:
+        try:
+            clock = GameClock.get_node_clock(self)
+            while True:
+                self._physics_update(clock.delta_time)
+                # Parked once its life time is over
+                if self.is_parked:
+                    break
+                await co_suspend()
+        except GeneratorExit:
+            pass
 
 
 class PlayerMeleeAttack(PlayerAttack):
@@ -54,6 +123,11 @@ class PlayerMeleeAttack(PlayerAttack):
         self.sprite.flip_h = self.flip_h
         self.add_child(self.sprite)
 
+    def _on_spawned(self) -> None:
+        super()._on_spawned()
+        if self.sprite:
+            self.sprite.flip_h = self.flip_h
+
     def set_attack_range(self, extra_range: int) -> None:
         # self.size += Size2D(extra_range, 0)
         pass
@@ -79,6 +153,8 @@ class PlayerSpecialAttack(PlayerAttack):
         self.texture_path = "assets/images/demi/demi_attack_slash.png"
 
     def _start(self) -> None:
+        # Added to the scene root, melee attacks follow the player's dilation as its children instead
+        GameClock.join_group(self, "player")
         super()._start()
         self.anim_sprite = AnimatedSprite.new()
         animation = Animation(
@@ -97,15 +173,15 @@ class PlayerSpecialAttack(PlayerAttack):
         self.anim_sprite.flip_h = self.flip_h
         self.add_child(self.anim_sprite)
 
-    def _fixed_update(self, delta_time: float) -> None:
+    def _on_spawned(self) -> None:
+        super()._on_spawned()
+        RenderInterpolation.add_node(self)
         move_speed = 80
-        self.add_to_position(
-            Vector2(
-                self.direction.x * move_speed * delta_time,
-                self.direction.y * move_speed * delta_time,
-            )
+        Kinematics.add_body(
+            self, Vector2(self.direction.x * move_speed, self.direction.y * move_speed)
         )
-        super()._fixed_update(delta_time)
+        if self.anim_sprite:
+            self.anim_sprite.flip_h = self.flip_h
 
     def update_attack_offset(self, is_crouching: bool, base_pos: Vector2) -> None:
         if is_crouching:
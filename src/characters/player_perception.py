@@ -0,0 +1,162 @@
+import math
+from typing import Dict, List, Optional, Set
+
+from crescent_api import Node2D, SceneTree, Vector2
+
+from src.utils.frame_context import FrameContext
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class PlayerPerception:
+    """
+    What enemies know about the player, shared by every enemy instead of each one querying the player itself.  The
+    player's position, stance and facing are snapshot once per fixed step by 'update'.  Offsets, distances and
+    directions to the player are computed for every registered node together the first time one of them is asked for
+    in a step (with NumPy once there are at least 'numpy_node_threshold' nodes, if it's installed), results use the
+    node positions at that time.  Nodes that aren't registered get their results computed on their own.
+    Nodes are removed once they exit the scene.
+    """
+
+    numpy_node_threshold = 16
+    player_position: Optional[Vector2] = None
+    player_stance: Optional[str] = None
+    # Vector2.LEFT or Vector2.RIGHT
+    player_facing = Vector2.RIGHT
+    # Entity id -> node
+    _nodes: Dict[int, Node2D] = {}
+    _exit_subscribed_nodes: Set[int] = set()
+    # Entity id -> [offset x, offset y, distance], computed lazily each step
+    _results: Dict[int, List[float]] = {}
+    _is_dirty = True
+
+    @staticmethod
+    def add_node(node: Node2D) -> None:
+        entity_id = node.entity_id
+        PlayerPerception._nodes[entity_id] = node
+        if entity_id not in PlayerPerception._exit_subscribed_nodes:
+            PlayerPerception._exit_subscribed_nodes.add(entity_id)
+            node.subscribe_to_event(
+                "scene_exited",
+                SceneTree.get_root(),
+                lambda args: PlayerPerception._on_node_exited(node),
+            )
+
+    @staticmethod
+    def remove_node(node: Node2D) -> None:
+        PlayerPerception._nodes.pop(node.entity_id, None)
+        PlayerPerception._results.pop(node.entity_id, None)
+
+    @staticmethod
+    def clear() -> None:
+        PlayerPerception.player_position = None
+        PlayerPerception.player_stance = None
+        PlayerPerception.player_facing = Vector2.RIGHT
+        PlayerPerception._nodes.clear()
+        PlayerPerception._exit_subscribed_nodes.clear()
+        PlayerPerception._results.clear()
+        PlayerPerception._is_dirty = True
+
+    @staticmethod
+    def update() -> None:
+        """
+        Snapshots the player, called once per fixed step after the frame context has been filled.
+        """
+        player = FrameContext.player
+        PlayerPerception._is_dirty = True
+        if not player:
+            PlayerPerception.player_position = None
+            return None
+        PlayerPerception.player_position = FrameContext.player_position
+        PlayerPerception.player_stance = player.stance
+        PlayerPerception.player_facing = (
+            Vector2.LEFT if player.anim_sprite.flip_h else Vector2.RIGHT
+        )
+
+    @staticmethod
+    def get_offset_x(node: Node2D) -> float:
+        """
+        Horizontal offset from the node to the player, positive when the player is to the right.
+        """
+        return PlayerPerception._get_result(node)[0]
+
+    @staticmethod
+    def get_offset(node: Node2D) -> Vector2:
+        result = PlayerPerception._get_result(node)
+        return Vector2(result[0], result[1])
+
+    @staticmethod
+    def get_distance(node: Node2D) -> float:
+        return PlayerPerception._get_result(node)[2]
+
+    @staticmethod
+    def get_direction(node: Node2D) -> Vector2:
+        offset_x, offset_y, distance = PlayerPerception._get_result(node)
+        if distance <= 0.0:
+            return Vector2(0.0, 0.0)
+        return Vector2(offset_x / distance, offset_y / distance)
+
+    @staticmethod
+    def get_horizontal_direction(node: Node2D) -> Vector2:
+        """
+        Vector2.RIGHT if the player is to the right of the node, Vector2.LEFT otherwise.
+        """
+        if PlayerPerception._get_result(node)[0] > 0.0:
+            return Vector2.RIGHT
+        return Vector2.LEFT
+
+    @staticmethod
+    def _get_result(node: Node2D) -> List[float]:
+        if PlayerPerception._is_dirty:
+            PlayerPerception._compute_results()
+        result = PlayerPerception._results.get(node.entity_id, None)
+        if not result:
+            result = PlayerPerception._compute_result(node.position)
+        return result
+
+    @staticmethod
+    def _compute_result(position: Vector2) -> List[float]:
+        player_position = PlayerPerception.player_position
+        if player_position is None:
+            return [0.0, 0.0, 0.0]
+        offset_x = player_position.x - position.x
+        offset_y = player_position.y - position.y
+        return [offset_x, offset_y, math.hypot(offset_x, offset_y)]
+
+    @staticmethod
+    def _compute_results() -> None:
+        PlayerPerception._is_dirty = False
+        results = PlayerPerception._results
+        results.clear()
+        nodes = PlayerPerception._nodes
+        player_position = PlayerPerception.player_position
+        if not nodes or player_position is None:
+            return None
+        if numpy is not None and len(nodes) >= PlayerPerception.numpy_node_threshold:
+            entity_ids = list(nodes)
+            node_positions = [node.position for node in nodes.values()]
+            positions = numpy.array(
+                [(position.x, position.y) for position in node_positions],
+                dtype=numpy.float64,
+            )
+            offsets = numpy.array((player_position.x, player_position.y)) - positions
+            distances = numpy.hypot(offsets[:, 0], offsets[:, 1])
+            for entity_id, offset_x, offset_y, distance in zip(
+                entity_ids,
+                offsets[:, 0].tolist(),
+                offsets[:, 1].tolist(),
+                distances.tolist(),
+            ):
+                results[entity_id] = [offset_x, offset_y, distance]
+        else:
+            for entity_id, node in nodes.items():
+                results[entity_id] = PlayerPerception._compute_result(node.position)
+
+    @staticmethod
+    def _on_node_exited(node: Node2D) -> None:
+        PlayerPerception._nodes.pop(node.entity_id, None)
+        PlayerPerception._results.pop(node.entity_id, None)
+        PlayerPerception._exit_subscribed_nodes.discard(node.entity_id)
@@ -3,6 +3,7 @@ from typing import Optional
 from crescent_api import Size2D, ColorRect, SceneTree
 
 from src.utils.game_math import clamp, map_to_range
+from src.utils.signal import Signal
 
 
 class PlayerStats:
@@ -35,6 +36,9 @@ class PlayerStats:
         self.damage_taken_from_attacks_multiple = 1.0
         # Applied after 'damage_taken_from_attacks_multiple' is
         self.energy_damage_taken_from_attacks_multiple = 0.5
+        # Emitted with the new value
+        self.hp_changed = Signal()
+        self.energy_changed = Signal()
 
     def refresh_bar_nodes(self) -> None:
         main_node = SceneTree.get_root()
@@ -82,6 +86,7 @@ class PlayerStats:
         self._energy_restored_from_attacks = value
 
     def set_hp(self, hp: float) -> None:
+        prev_hp = self._hp
         self._hp = clamp(hp, 0.0, self._base_hp)
         new_hp_bar_width = map_to_range(
             self._hp, 0.0, self._base_hp, 0.0, self.base_health_bar_ui_size.w
@@ -89,8 +94,11 @@ class PlayerStats:
         self.health_bar_ui.size = Size2D(
             new_hp_bar_width, self.base_health_bar_ui_size.h
         )
+        if self._hp != prev_hp:
+            self.hp_changed.emit(self._hp)
 
     def set_energy(self, energy: float) -> None:
+        prev_energy = self._energy
         self._energy = clamp(energy, 0, self._base_energy)
         new_energy_bar_width = map_to_range(
             self._energy,
@@ -102,6 +110,8 @@ class PlayerStats:
         self.energy_bar_ui.size = Size2D(
             new_energy_bar_width, self.base_energy_bar_ui_size.h
         )
+        if self._energy != prev_energy:
+            self.energy_changed.emit(self._energy)
 
     def reset_move_speed(self) -> None:
         self._move_speed = self._base_move_speed
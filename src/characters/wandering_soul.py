@@ -1,5 +1,8 @@
 from crescent_api import *
 
+from src.utils.kinematics import Kinematics
+from src.utils.render_interpolation import RenderInterpolation
+
 
 class WanderingSoul(Node2D):
     def __init__(self, entity_id: int):
@@ -12,12 +15,8 @@ class WanderingSoul(Node2D):
         self.anim_sprite = self.get_child("AnimatedSprite")
         if self.anim_sprite:
             self.anim_sprite.flip_h = self.flip_h
-
-    def _fixed_update(self, delta_time: float) -> None:
+        RenderInterpolation.add_node(self)
         move_speed = 20
-        self.add_to_position(
-            Vector2(
-                self.move_dir.x * move_speed * delta_time,
-                self.move_dir.y * move_speed * delta_time,
-            )
+        Kinematics.add_body(
+            self, Vector2(self.move_dir.x * move_speed, self.move_dir.y * move_speed)
         )
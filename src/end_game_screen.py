@@ -2,7 +2,8 @@ from crescent_api import *
 
 from src.level_state import LevelState
 from src.option_box_manager import OptionBoxManager
-from src.utils.task import Task, co_suspend
+from src.utils.game_clock import GameClock
+from src.utils.task import Task, TaskScheduler, co_suspend
 
 
 class EndGameScreen(Node2D):
@@ -29,8 +30,10 @@ class EndGameScreen(Node2D):
             option_arrow_top_sprite,
             ["Retry", "Title", "Exit"],
         )
+        TaskScheduler().add_node_task(self, self.update_task)
 
     def _end(self) -> None:
+        TaskScheduler().kill_tasks()
         LevelState.reset_instance()
         level_state = LevelState()
         level_state.screen_shader_instance = ShaderUtil.get_current_screen_shader()
@@ -43,7 +46,8 @@ class EndGameScreen(Node2D):
                 self.option_box_manager.is_enabled = False
 
     def _fixed_update(self, delta_time: float) -> None:
-        self.update_task.resume()
+        GameClock.tick()
+        TaskScheduler().update()
         self.option_box_manager.update_tasks()
 
     # --- TASKS --- #
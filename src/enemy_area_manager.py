@@ -1,49 +1,59 @@
 import random
-from typing import Type, Dict
+from typing import Dict
 
 from crescent_api import *
 
 from src.characters.enemy import Enemy
 from src.characters.enemy_definitions import EnemyDefinition
+from src.characters.enemy_pool import EnemyPool
+from src.characters.enemy_registry import EnemyRegistry
 from src.characters.player import Player
 from src.level_area import LevelArea, LevelSection
 from src.level_area_type import LevelAreaType
 from src.level_state import LevelState
 from src.utils import game_math
-from src.utils.task import co_suspend, co_return, Task, co_wait_seconds
+from src.utils.frame_context import FrameContext
+from src.utils.game_clock import GameClock
+from src.utils.scene_cache import SceneCache
+from src.utils.task import (
+    co_suspend,
+    co_return,
+    Task,
+    TaskPriority,
+    co_wait_seconds,
+    co_race,
+    co_tick,
+    co_wait_node_event,
+    co_wait_signal,
+)
+from src.utils.signal import Signal
 from src.utils.timer import Timer
 
 
 class EnemyAreaManager:
     def __init__(self):
-        self._spawned_enemies: List[Enemy] = []
-        self._enemy_scene_cache: Dict[str, PackedScene] = {}
+        self._spawned_enemies = EnemyRegistry()
+        # Emitted when a spawned enemy is destroyed
+        self._spawned_enemy_destroyed = Signal()
+        # Scene path -> pool, for pooled enemy definitions.  Scenes are loaded by the scene cache when first needed
+        self._enemy_pools: Dict[str, EnemyPool] = {}
+        # Scene path -> instances created ahead of time for enemy definitions that aren't pooled
+        self._preloaded_enemies: Dict[str, List[Enemy]] = {}
         for enemy_def in EnemyDefinition.ALL():
-            self._enemy_scene_cache[enemy_def.scene_path] = SceneUtil.load_scene(
-                enemy_def.scene_path
-            )
-        LevelState().subscribe_to_enemy_time_dilation_change(
-            self._on_level_state_enemy_time_dilation_changed
-        )
-
-    def _get_spawned_enemies_by_type(self, enemy_type: Type) -> list:
-        enemies = []
-        for enemy in self._spawned_enemies:
-            if isinstance(enemy, enemy_type):
-                enemies.append(enemy)
-        return enemies
+            if enemy_def.is_pooled:
+                self._enemy_pools[enemy_def.scene_path] = EnemyPool(
+                    enemy_def, self._on_pooled_enemy_added
+                )
 
     def _on_enemy_destroyed(self, enemy: Enemy) -> None:
-        try:
-            self._spawned_enemies.remove(enemy)
-        except ValueError as e:
-            pass
+        if self._spawned_enemies.remove(enemy):
+            self._spawned_enemy_destroyed.emit(enemy)
 
-    def _on_level_state_enemy_time_dilation_changed(
-        self, new_time_dilation: float
-    ) -> None:
-        for enemy in self._spawned_enemies:
-            enemy.time_dilation = new_time_dilation
+    def _on_pooled_enemy_added(self, enemy: Enemy) -> None:
+        # Pooled enemies are reused, so only subscribe once per instance
+        enemy.subscribe_to_event(
+            "destroyed", SceneTree.get_root(), self._on_enemy_destroyed
+        )
 
     def _get_section_by_position(
         self, position: Vector2, area: LevelArea
@@ -59,11 +69,20 @@ class EnemyAreaManager:
         return area.sections[section_index]
 
     def _spawn_enemy_from_def(self, enemy_def: EnemyDefinition) -> Enemy:
-        spawned_enemy: Enemy = self._enemy_scene_cache[
-            enemy_def.scene_path
-        ].create_instance()
+        preloaded_enemies = self._preloaded_enemies.get(enemy_def.scene_path, None)
+        if preloaded_enemies:
+            return preloaded_enemies.pop()
+        spawned_enemy: Enemy = SceneCache.get(enemy_def.scene_path).create_instance()
         return spawned_enemy
 
+    def preload_enemy(self, enemy_def: EnemyDefinition) -> None:
+        """
+        Creates an instance of an enemy that isn't pooled ahead of time, it's used the next time the enemy is spawned.
+        """
+        self._preloaded_enemies.setdefault(enemy_def.scene_path, []).append(
+            SceneCache.get(enemy_def.scene_path).create_instance()
+        )
+
     def _attempt_spawn_enemies(
         self, base_spawn_pos: Vector2, section: LevelSection, total_sections: int
     ) -> None:
@@ -71,19 +90,16 @@ class EnemyAreaManager:
         x_range = MinMax(-96, 96)
         spawn_attempt_finished = False
         player = Player.find_player()
-        main_node = SceneTree.get_root()
         is_in_first_section = section.index == 0
         is_in_last_section = section.index == total_sections - 1
-        level_state = LevelState()
+        self._spawned_enemies.refresh_sides()
         while not spawn_attempt_finished:
             if not enemy_defs:
                 break
             random_enemy_def: EnemyDefinition = random.choice(enemy_defs)
             enemy_defs.remove(random_enemy_def)
-            enemies_of_type_in_level = self._get_spawned_enemies_by_type(
-                random_enemy_def.enemy_type
-            )
-            enemy_count = len(enemies_of_type_in_level)
+            enemy_type = random_enemy_def.enemy_type
+            enemy_count = self._spawned_enemies.get_count(enemy_type)
             max_enemies_to_spawn = random_enemy_def.max_total_count - enemy_count
             max_enemies_to_spawn = game_math.clamp(
                 max_enemies_to_spawn, 0, random_enemy_def.max_spawn_count
@@ -107,14 +123,8 @@ class EnemyAreaManager:
                         x_modifier = random.choice([x_range.min, x_range.max])
                 # Enemy count is higher than one, so try to balance the sides of enemies
                 else:
-                    left_side_count = 0
-                    right_side_count = 0
-                    player_pos = Player.find_player().position
-                    for enemy in enemies_of_type_in_level:
-                        if enemy.position.x > player_pos.x:
-                            right_side_count += 1
-                        else:
-                            left_side_count += 1
+                    side_counts = self._spawned_enemies.get_side_counts(enemy_type)
+                    left_side_count, right_side_count = side_counts
                     if is_in_first_section:
                         if (
                             right_side_count + num_of_enemies_to_spawn
@@ -152,18 +162,14 @@ class EnemyAreaManager:
                             # We don't check for max total on 'one side at this point', but it's probably fine...
                             x_modifier = random.choice([x_range.min, x_range.max])
                 base_spawn_pos.x += x_modifier
+                enemy_pool = self._enemy_pools[random_enemy_def.scene_path]
+                player_x = player.position.x
                 for i in range(num_of_enemies_to_spawn):
-                    spawned_enemy = self._spawn_enemy_from_def(random_enemy_def)
-                    spawned_enemy.position = base_spawn_pos + Vector2(
-                        i * (x_modifier / 4), 0.0
-                    )
-                    spawned_enemy.z_index = player.z_index
-                    spawned_enemy.time_dilation = level_state.get_enemy_time_dilation()
-                    main_node.add_child(spawned_enemy)
-                    spawned_enemy.subscribe_to_event(
-                        "destroyed", main_node, self._on_enemy_destroyed
+                    spawned_enemy = enemy_pool.spawn(
+                        position=base_spawn_pos + Vector2(i * (x_modifier / 4), 0.0),
+                        z_index=player.z_index,
                     )
-                    self._spawned_enemies.append(spawned_enemy)
+                    self._spawned_enemies.add(spawned_enemy, player_x)
                 spawn_attempt_finished = True
 
     async def _lightning_flash_task(self, flash_time_range=MinMax(2.0, 8.0)):
@@ -171,10 +177,12 @@ class EnemyAreaManager:
         bg_color_rect: ColorRect = main_node.get_child("BGColorRect")
         initial_color = bg_color_rect.color
         flash_color = Color(240, 247, 243)
-        flash_timer = Timer(random.uniform(flash_time_range.min, flash_time_range.max))
+        flash_timer = Timer(
+            random.uniform(flash_time_range.min, flash_time_range.max),
+            clock=GameClock.unscaled,
+        )
         try:
             while True:
-                flash_timer.tick(World.get_delta_time())
                 if flash_timer.has_stopped():
                     flash_timer.time = random.uniform(
                         flash_time_range.min, flash_time_range.max
@@ -183,7 +191,7 @@ class EnemyAreaManager:
                     bg_color_rect.color = flash_color
                     await co_suspend()
                     bg_color_rect.color = initial_color
-                await co_suspend()
+                flash_timer.tick(await co_tick())
         except GeneratorExit:
             bg_color_rect.color = initial_color
 
@@ -199,6 +207,23 @@ class EnemyAreaManager:
         except GeneratorExit:
             bg_color_rect.color = initial_color
 
+    async def _wait_for_spawned_enemies_destroyed(self):
+        while self._spawned_enemies:
+            await co_wait_signal(self._spawned_enemy_destroyed)
+
+    async def prewarm_enemy_pools(self, area: LevelArea):
+        """
+        Fills the pools of the area's enemies up to their max total count, one instance per frame.
+        """
+        try:
+            for section in area.sections:
+                for enemy_def in section.enemy_defs:
+                    enemy_pool = self._enemy_pools.get(enemy_def.scene_path, None)
+                    while enemy_pool and enemy_pool.prewarm_one():
+                        await co_suspend()
+        except GeneratorExit:
+            pass
+
     async def manage_area(self, area: LevelArea):
         try:
             level_state = LevelState()
@@ -210,13 +235,12 @@ class EnemyAreaManager:
                 if not sections:
                     await co_return()
                 section_count = len(sections)
-                update_timer = Timer(5.0)
+                update_timer = Timer(5.0, clock=GameClock.unscaled)
                 while True:
-                    delta_time = World.get_delta_time()
-                    if update_timer.tick(delta_time).has_stopped():
+                    if update_timer.tick().has_stopped():
                         update_timer.reset()
 
-                        spawn_pos_x = Camera2D.get_position().x + 80
+                        spawn_pos_x = FrameContext.get_camera_position().x + 80
                         current_section = self._get_section_by_position(
                             player.position, area
                         )
@@ -227,8 +251,7 @@ class EnemyAreaManager:
                         if area.is_section_last(current_section):
                             break
                     await co_suspend()
-                while self._spawned_enemies:
-                    await co_suspend()
+                await self._wait_for_spawned_enemies_destroyed()
             # Boss logic
             else:
                 # Stop main theme
@@ -254,18 +277,22 @@ class EnemyAreaManager:
                 boss_enemy = self._spawn_enemy_from_def(boss_enemy_def)
                 boss_enemy.position = boss_spawn_pos
                 boss_enemy.z_index = player.z_index
-                boss_enemy.time_dilation = level_state.get_enemy_time_dilation()
                 main_node.add_child(boss_enemy)
                 boss_enemy.subscribe_to_event(
                     "destroyed", main_node, self._on_enemy_destroyed
                 )
-                self._spawned_enemies.append(boss_enemy)
+                self._spawned_enemies.add(boss_enemy, player.position.x)
 
-                lightning_flash_task = Task(coroutine=self._lightning_flash_task())
-                while self._spawned_enemies:
-                    lightning_flash_task.resume()
-                    await co_suspend()
-                lightning_flash_task.close()
+                # Flash lightning until the boss is defeated
+                await co_race(
+                    Task(
+                        coroutine=self._lightning_flash_task(),
+                        tick_divisor=2,
+                        tick_clock=GameClock.unscaled,
+                        priority=TaskPriority.COSMETIC,
+                    ),
+                    Task(coroutine=self._wait_for_spawned_enemies_destroyed()),
+                )
                 AudioManager.stop_sound(source=boss_theme_audio_source)
 
                 # Enemy defeated now flash lightning
@@ -276,17 +303,7 @@ class EnemyAreaManager:
                 player.input_enabled = True
                 boss_enemy.can_destroy_self = True
 
-                enemy_is_finished = False
-
-                def on_enemy_boss_scene_exited():
-                    nonlocal enemy_is_finished
-                    enemy_is_finished = True
-
-                boss_enemy.subscribe_to_event(
-                    "scene_exited", main_node, lambda args: on_enemy_boss_scene_exited()
-                )
-                while not enemy_is_finished:
-                    await co_suspend()
+                await co_wait_node_event(boss_enemy, "scene_exited", main_node)
 
             # Small delay in case of knock back
             await co_wait_seconds(1.0)
@@ -1,12 +1,19 @@
 from crescent_api import *
 
+from src.utils.collision import CollisionLayer, CollisionWorld
+from src.utils.signal import Signal
+
 
 class BridgeGate(Sprite):
+    collision_layer = CollisionLayer.BRIDGE_GATE
+    collision_mask = CollisionLayer.PLAYER
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self._collider: Optional[Collider2D] = None
         self._foreground: Optional[Sprite] = None
         self.size = BridgeGate.get_default_size()
+        self.opened = Signal()
         self.is_opened = False
         self.has_player_ever_stepped_through = False
 
@@ -21,6 +28,9 @@ class BridgeGate(Sprite):
         self._collider.position = Vector2(collider_size.w * 0.5, 0)
         self._collider.extents = collider_size
         self.add_child(self._collider)
+        CollisionWorld.register_collider(
+            self._collider, self.collision_layer, self.collision_mask
+        )
         # Foreground Texture
         self._foreground = Sprite.new()
         self._foreground.texture = Texture(
@@ -36,6 +46,7 @@ class BridgeGate(Sprite):
     def set_opened(self) -> None:
         self.draw_source = Rect2(self.size.w, 0, self.size.w, self.size.h)
         self.is_opened = True
+        self.opened.emit(self)
 
     def set_closed(self) -> None:
         self.draw_source = Rect2(0, 0, self.size.w, self.size.h)
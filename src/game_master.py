@@ -3,6 +3,7 @@ from crescent_api import *
 from src.characters.player import Player
 from src.level_area_manager import LevelAreaManager
 from src.level_state import LevelState, GameTimer
+from src.utils.game_clock import GameClock
 from src.utils.task import *
 
 
@@ -11,12 +12,12 @@ class GameMaster:
     def __init__(self, main_node):
         self.main = main_node
         self.player: Optional[Player] = None
-        self.main_task = Task(coroutine=self._update_task())
+        # Drives level flow (areas, transitions, game end) so it runs before everything else
+        self.main_task = Task(
+            coroutine=self._update_task(), priority=TaskPriority.CRITICAL
+        )
         self.bridge_transition_task: Optional[Task] = None
 
-    def update(self) -> None:
-        self.main_task.resume()
-
     # --- TASKS --- #
     async def _update_task(self):
         player_start_pos = Vector2(20, 78)
@@ -43,9 +44,17 @@ class GameMaster:
             self.player.position = player_start_pos
             self.main.add_child(self.player)
 
+            # Display only changes once a second, so the timer runs at a reduced rate with the accumulated time
+            TaskScheduler().add_node_task(
+                self.main,
+                Task(
+                    coroutine=level_state.game_timer.update_task(),
+                    tick_frequency=10.0,
+                    tick_clock=GameClock.unscaled,
+                ),
+            )
             while True:
                 level_area_manager.update()
-                level_state.game_timer.update()
                 await co_suspend()
         except GeneratorExit:
             pass
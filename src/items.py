@@ -3,9 +3,17 @@ from typing import Type
 from crescent_api import *
 
 from src.characters.player_stats import PlayerStats
+from src.utils.collision import CollisionLayer, CollisionWorld
+from src.utils.type_dispatch import TypeDispatch
 
 
 class Item(Node2D):
+    collision_layer = CollisionLayer.ITEM
+    collision_mask = CollisionLayer.PLAYER
+    # Assets loaded by '_default_initialize', class level so they can be preloaded before an item is created
+    sprite_texture_path: Optional[str] = None
+    outline_shader_path = "shaders/outline.shader"
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self.sprite: Optional[Sprite] = None
@@ -32,10 +40,13 @@ class Item(Node2D):
         self.collider = Collider2D.new()
         self.collider.extents = size
         self.add_child(self.collider)
+        CollisionWorld.register_collider(
+            self.collider, self.collision_layer, self.collision_mask
+        )
 
         # Item outline
         self.sprite.shader_instance = ShaderUtil.compile_shader(
-            "shaders/outline.shader"
+            self.outline_shader_path
         )
         outline_color = Vector4(163.0 / 255.0, 163.0 / 255.0, 163.0 / 255.0, 1.0)
         self.sprite.shader_instance.set_float4_param("outline_color", outline_color)
@@ -106,26 +117,30 @@ class Item(Node2D):
 
 
 class ScrollItem(Item):
+    sprite_texture_path = "assets/images/items/item_scroll.png"
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self.description = "Help the souls!"
 
     def _start(self):
         self._default_initialize(
-            sprite_texture_path="assets/images/items/item_scroll.png",
+            sprite_texture_path=self.sprite_texture_path,
             size=Size2D(12, 12),
         )
         self.position += Vector2(40, 0)
 
 
 class LeverItem(Item):
+    sprite_texture_path = "assets/images/items/item_lever.png"
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self.can_be_collected = False
 
     def _start(self):
         self._default_initialize(
-            sprite_texture_path="assets/images/items/item_lever.png",
+            sprite_texture_path=self.sprite_texture_path,
             size=Size2D(14, 14),
         )
         self.position += Vector2(40, -1)
@@ -136,6 +151,8 @@ class LeverItem(Item):
 
 
 class HealthRestoreItem(Item):
+    sprite_texture_path = "assets/images/items/item_heart.png"
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self.description = "Restores health"
@@ -143,7 +160,7 @@ class HealthRestoreItem(Item):
 
     def _start(self):
         self._default_initialize(
-            sprite_texture_path="assets/images/items/item_heart.png",
+            sprite_texture_path=self.sprite_texture_path,
             size=Size2D(12, 12),
         )
 
@@ -152,66 +169,80 @@ class HealthRestoreItem(Item):
 
 
 class EnergyRestoredFromAttacksIncreaseItem(Item):
+    sprite_texture_path = (
+        "assets/images/items/item_energy_restored_from_attacks_increase.png"
+    )
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self.description = "Increase energy from attacks"
 
     def _start(self):
         self._default_initialize(
-            sprite_texture_path="assets/images/items/item_energy_restored_from_attacks_increase.png",
+            sprite_texture_path=self.sprite_texture_path,
             size=Size2D(12, 12),
         )
 
 
 class DamageDecreaseItem(Item):
+    sprite_texture_path = "assets/images/items/item_damage_decrease.png"
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self.description = "Reduces damage taken"
 
     def _start(self):
         self._default_initialize(
-            sprite_texture_path="assets/images/items/item_damage_decrease.png",
+            sprite_texture_path=self.sprite_texture_path,
             size=Size2D(12, 12),
         )
 
 
 class SpecialAttackDoubledItem(Item):
+    sprite_texture_path = "assets/images/items/item_special_attack_double.png"
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self.description = "Chance to double special attack"
 
     def _start(self):
         self._default_initialize(
-            sprite_texture_path="assets/images/items/item_special_attack_double.png",
+            sprite_texture_path=self.sprite_texture_path,
             size=Size2D(12, 12),
         )
 
 
 class SpecialAttackTimeDecreaseItem(Item):
+    sprite_texture_path = "assets/images/items/item_special_attack_time_decrease.png"
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self.description = "Decrease special attack charge time"
 
     def _start(self):
         self._default_initialize(
-            sprite_texture_path="assets/images/items/item_special_attack_time_decrease.png",
+            sprite_texture_path=self.sprite_texture_path,
             size=Size2D(12, 12),
         )
 
 
 class SaveChargeItem(Item):
+    sprite_texture_path = "assets/images/items/item_save_charge.png"
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self.description = "Increase keep charge chance"
 
     def _start(self):
         self._default_initialize(
-            sprite_texture_path="assets/images/items/item_save_charge.png",
+            sprite_texture_path=self.sprite_texture_path,
             size=Size2D(12, 12),
         )
 
 
 class DamageDeflectWhenChargedItem(Item):
+    sprite_texture_path = "assets/images/items/item_damage_deflect_when_charged.png"
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self.description = "Will deflect damage when charged"
@@ -219,12 +250,14 @@ class DamageDeflectWhenChargedItem(Item):
 
     def _start(self):
         self._default_initialize(
-            sprite_texture_path="assets/images/items/item_damage_deflect_when_charged.png",
+            sprite_texture_path=self.sprite_texture_path,
             size=Size2D(12, 12),
         )
 
 
 class AbilitySlowTimeItem(Item):
+    sprite_texture_path = "assets/images/items/item_slow_time.png"
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self.description = "Will slow down time"
@@ -232,12 +265,14 @@ class AbilitySlowTimeItem(Item):
 
     def _start(self):
         self._default_initialize(
-            sprite_texture_path="assets/images/items/item_slow_time.png",
+            sprite_texture_path=self.sprite_texture_path,
             size=Size2D(12, 12),
         )
 
 
 class AbilityDualSpecialItem(Item):
+    sprite_texture_path = "assets/images/items/item_dual_special.png"
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self.description = "Will spawn projectiles"
@@ -245,12 +280,14 @@ class AbilityDualSpecialItem(Item):
 
     def _start(self):
         self._default_initialize(
-            sprite_texture_path="assets/images/items/item_dual_special.png",
+            sprite_texture_path=self.sprite_texture_path,
             size=Size2D(12, 12),
         )
 
 
 class AbilityHoodFormItem(Item):
+    sprite_texture_path = "assets/images/items/item_hood_form.png"
+
     def __init__(self, entity_id: int):
         super().__init__(entity_id)
         self.description = "Won't take hp damage when active"
@@ -258,40 +295,40 @@ class AbilityHoodFormItem(Item):
 
     def _start(self):
         self._default_initialize(
-            sprite_texture_path="assets/images/items/item_hood_form.png",
+            sprite_texture_path=self.sprite_texture_path,
             size=Size2D(12, 12),
         )
 
 
 class ItemUtils:
+    # Subclasses of a listed item class create the listed class
+    _item_classes = TypeDispatch(
+        {
+            item_class: item_class
+            for item_class in [
+                HealthRestoreItem,
+                ScrollItem,
+                LeverItem,
+                EnergyRestoredFromAttacksIncreaseItem,
+                DamageDecreaseItem,
+                SpecialAttackDoubledItem,
+                SpecialAttackTimeDecreaseItem,
+                SaveChargeItem,
+                DamageDeflectWhenChargedItem,
+                AbilitySlowTimeItem,
+                AbilityDualSpecialItem,
+                AbilityHoodFormItem,
+            ]
+        }
+    )
+
     @staticmethod
     def get_item_from_type(
         item_type: Type,
     ) -> HealthRestoreItem | ScrollItem | LeverItem | EnergyRestoredFromAttacksIncreaseItem | DamageDecreaseItem | SpecialAttackDoubledItem | SpecialAttackTimeDecreaseItem | SaveChargeItem | DamageDeflectWhenChargedItem | AbilitySlowTimeItem | AbilityDualSpecialItem | AbilityHoodFormItem | None:
-        if issubclass(item_type, HealthRestoreItem):
-            return HealthRestoreItem.new()
-        elif issubclass(item_type, ScrollItem):
-            return ScrollItem.new()
-        elif issubclass(item_type, LeverItem):
-            return LeverItem.new()
-        elif issubclass(item_type, EnergyRestoredFromAttacksIncreaseItem):
-            return EnergyRestoredFromAttacksIncreaseItem.new()
-        elif issubclass(item_type, DamageDecreaseItem):
-            return DamageDecreaseItem.new()
-        elif issubclass(item_type, SpecialAttackDoubledItem):
-            return SpecialAttackDoubledItem.new()
-        elif issubclass(item_type, SpecialAttackTimeDecreaseItem):
-            return SpecialAttackTimeDecreaseItem.new()
-        elif issubclass(item_type, SaveChargeItem):
-            return SaveChargeItem.new()
-        elif issubclass(item_type, DamageDeflectWhenChargedItem):
-            return DamageDeflectWhenChargedItem.new()
-        elif issubclass(item_type, AbilitySlowTimeItem):
-            return AbilitySlowTimeItem.new()
-        elif issubclass(item_type, AbilityDualSpecialItem):
-            return AbilityDualSpecialItem.new()
-        elif issubclass(item_type, AbilityHoodFormItem):
-            return AbilityHoodFormItem.new()
+        item_class = ItemUtils._item_classes.get(item_type)
+        if item_class:
+            return item_class.new()
         print("ERROR: doesn't have item type in 'ItemUtils.get_item_from_type'!")
         return None
 
@@ -4,13 +4,23 @@ from src.characters.player import Player, PlayerStance
 from src.characters.wandering_soul import WanderingSoul
 from src.enemy_area_manager import EnemyAreaManager
 from src.environment.bridge_gate import BridgeGate
-from src.items import ItemUtils, Item, LeverItem
+from src.items import Item, LeverItem
 from src.level_area import LevelAreaDefinitions, LevelArea
+from src.level_area_preloader import LevelAreaPreloader
 from src.level_area_type import LevelAreaType
 from src.level_clouds import LevelCloudManager
 from src.level_state import LevelState
+from src.utils.game_clock import GameClock
 from src.utils.game_math import Easer, Ease
-from src.utils.task import co_suspend, co_wait_seconds, Task, co_return
+from src.utils.scene_cache import SceneCache
+from src.utils.task import (
+    co_suspend,
+    co_wait_seconds,
+    Task,
+    co_return,
+    TaskPriority,
+    TaskScheduler,
+)
 from src.utils.timer import Timer
 
 
@@ -19,6 +29,8 @@ class LevelAreaManager:
         self.current_area_index = 1
         self.level_cloud_manager = LevelCloudManager()
         self.enemy_area_manager = EnemyAreaManager()
+        self.area_preloader = LevelAreaPreloader(self.enemy_area_manager)
+        self._preload_area_task: Optional[Task] = None
         self._manage_level_areas_task = Task(coroutine=self.manage_level_areas())
         self._manage_enemy_area_task: Optional[Task] = None
         self._current_area: Optional[LevelArea] = None
@@ -47,25 +59,44 @@ class LevelAreaManager:
         self._current_area = area
         self._has_processed_current_area_completion = False
 
-    def _setup_area_type(self, area: LevelArea, level_state: LevelState) -> None:
-        level_state.current_level_area_type = area.area_type
+    def _get_area_item_types(self, area: LevelArea) -> List[Type]:
         if (
             area.area_type == LevelAreaType.POWER_UP
             or area.area_type == LevelAreaType.INTRO
         ):
-            main_node = SceneTree.get_root()
             player = Player.find_player()
             player_stats = None
             player_item_handler = None
             if player:
                 player_stats = player.stats
                 player_item_handler = player.item_handler
-            random_item_types = area.get_random_item_types(
-                player_stats, player_item_handler
+            return area.get_random_item_types(player_stats, player_item_handler)
+        elif area.area_type == LevelAreaType.END:
+            return [LeverItem]
+        return []
+
+    def _setup_area_type(self, area: LevelArea, level_state: LevelState) -> None:
+        level_state.current_level_area_type = area.area_type
+        player = Player.find_player()
+        if player:
+            # Only areas with items need the player to test against the item layer
+            player.set_item_collisions_enabled(
+                area.area_type
+                in (LevelAreaType.POWER_UP, LevelAreaType.INTRO, LevelAreaType.END)
             )
+        if (
+            area.area_type == LevelAreaType.POWER_UP
+            or area.area_type == LevelAreaType.INTRO
+        ):
+            main_node = SceneTree.get_root()
+            # Items were chosen when the area was preloaded, unless it's the first area
+            if self.area_preloader.area == area:
+                random_item_types = self.area_preloader.item_types
+            else:
+                random_item_types = self._get_area_item_types(area)
             item_offset = Vector2.ZERO
             for i, item_type in enumerate(random_item_types):
-                power_up_item = ItemUtils.get_item_from_type(item_type)
+                power_up_item = self.area_preloader.take_item(item_type)
                 # Only expected to collect one item per power up area, which completes the area
                 power_up_item.subscribe_to_event(
                     event_id="activated",
@@ -98,7 +129,7 @@ class LevelAreaManager:
         # Temp wandering soul spawn
         elif area.area_type == LevelAreaType.END:
             main_node = SceneTree.get_root()
-            lever_item = LeverItem.new()
+            lever_item = self.area_preloader.take_item(LeverItem)
             lever_item.subscribe_to_event(
                 event_id="activated",
                 scoped_node=main_node,
@@ -157,8 +188,6 @@ class LevelAreaManager:
                 if manage_bridge_transition_task:
                     manage_bridge_transition_task.resume()
 
-                self.level_cloud_manager.update()
-
                 if (
                     self._current_area
                     and self._current_area.is_completed
@@ -184,6 +213,7 @@ class LevelAreaManager:
     async def beam_player_down(self, player_start_pos: Vector2):
         player_teleport_beam: Optional[Sprite] = None
         try:
+            self.level_cloud_manager.start()
             player_teleport_beam = Sprite.new()
             player_teleport_beam.texture = Texture(
                 file_path="assets/images/demi/demi_teleport.png"
@@ -200,9 +230,8 @@ class LevelAreaManager:
                 Ease.Cubic.ease_in_vec2,
             )
             while True:
-                delta_time = World.get_delta_time()
+                delta_time = GameClock.unscaled.delta_time
                 player_beam_timer.tick(delta_time)
-                self.level_cloud_manager.update()
                 if player_beam_timer.time_remaining > 0.0:
                     new_beam_pos = player_beam_easer.ease(delta_time)
                     player_teleport_beam.position = new_beam_pos
@@ -268,11 +297,11 @@ class LevelAreaManager:
             player = Player.find_player()
             self.current_area_index += 1
             next_level_area = LevelAreaDefinitions.get_def(self.current_area_index)
+            LevelAreaPreloader.evict_unneeded_scenes(self.current_area_index)
             level_state = LevelState()
 
-            main_node = SceneTree.get_root()
-            prev_time_dilation = main_node.time_dilation
-            main_node.time_dilation = 0.0
+            prev_time_dilation = GameClock.scene.time_dilation
+            GameClock.set_scene_time_dilation(0.0)
             level_state.boundary.w += next_level_area.width
             Camera2D.unfollow_node(player)
             Camera2D.set_boundary(level_state.boundary)
@@ -298,7 +327,7 @@ class LevelAreaManager:
             )
 
             await co_wait_seconds(1.0)
-            main_node.time_dilation = prev_time_dilation
+            GameClock.set_scene_time_dilation(prev_time_dilation)
             if player.stance == PlayerStance.STANDING:
                 player.play_animation("walk")
 
@@ -307,8 +336,21 @@ class LevelAreaManager:
             next_bridge_gate.set_closed()
             next_bridge_gate.position = self._get_next_bridge_gate_position()
 
+            # Load and create what the next area needs while the camera pans over.  Scheduled on its own so it finishes
+            # even if the pan ends first, anything used before it's preloaded is created when used
+            if self._preload_area_task:
+                self._preload_area_task.close()
+            self._preload_area_task = TaskScheduler().add_node_task(
+                SceneTree.get_root(),
+                Task(
+                    coroutine=self.area_preloader.preload(
+                        next_level_area, self._get_area_item_types(next_level_area)
+                    ),
+                    priority=TaskPriority.COSMETIC,
+                ),
+            )
             while True:
-                delta_time = World.get_delta_time()
+                delta_time = GameClock.unscaled.delta_time
                 transition_timer.tick(delta_time)
                 if transition_timer.time_remaining <= 0.0:
                     Camera2D.set_position(dest_camera_pos)
@@ -329,6 +371,7 @@ class LevelAreaManager:
 
             level_state.is_currently_transitioning_within_level = False
             self._setup_area_type(next_level_area, level_state)
+            self.area_preloader.set_area_started()
 
             self._set_current_area(next_level_area)
             self._manage_enemy_area_task = Task(
@@ -357,8 +400,8 @@ class LevelAreaManager:
             base_soul_pos = Vector2(
                 level_state.boundary.w - 16, level_state.floor_y - 1
             )
-            wandering_soul_scene = SceneUtil.load_scene(
-                "scenes/characters/wandering_soul.cscn"
+            wandering_soul_scene = SceneCache.get(
+                LevelAreaPreloader.WANDERING_SOUL_SCENE_PATH
             )
 
             text_window = main_node.get_child("BottomUI").get_child("TextWindow")
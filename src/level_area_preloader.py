@@ -0,0 +1,196 @@
+import json
+import threading
+
+from crescent_api import *
+
+from src.characters.enemy_definitions import EnemyDefinition
+from src.enemy_area_manager import EnemyAreaManager
+from src.items import Item, ItemUtils
+from src.level_area import LevelArea, LevelAreaDefinitions
+from src.level_area_type import LevelAreaType
+from src.utils.scene_cache import SceneCache
+from src.utils.task import co_suspend, Task
+
+
+class LevelAreaPreloader:
+    """
+    Warms everything the next level area needs while the camera pans over to it during a bridge transition, so
+    entering the area doesn't load and create it all in its first frames.  The engine's api is only safe to call from
+    the main thread, so a worker thread only reads the area's asset files (to have them in the OS file cache) and
+    parses its scene files for the textures they reference.  Textures, shaders and scenes are then loaded and the
+    area's items, boss and pooled enemies are created from the 'preload' coroutine, one per frame.  The coroutine
+    keeps running if the area starts before it's done, but no longer creates items or the boss as those are created
+    when used by then.
+    References to loaded textures and shaders are kept until the next area is preloaded so the engine keeps them
+    cached, scenes are kept in the scene cache until no remaining area needs them.
+    """
+
+    WANDERING_SOUL_SCENE_PATH = "scenes/characters/wandering_soul.cscn"
+    # Seconds the main thread waits on the file read thread each frame, which also releases the GIL so the thread
+    # runs even if the engine never does
+    file_read_wait_per_frame = 0.001
+
+    def __init__(self, enemy_area_manager: EnemyAreaManager):
+        self.enemy_area_manager = enemy_area_manager
+        self.area: Optional[LevelArea] = None
+        self.item_types: List[Type] = []
+        self.has_area_started = False
+        self._items: List[Item] = []
+        self._textures: Dict[str, Texture] = {}
+        self._shaders: Dict[str, ShaderInstance] = {}
+        self._file_read_thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def get_area_asset_paths(
+        area: LevelArea, item_types: List[Type]
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Returns the texture, shader and scene paths known to be needed by the area, without the textures referenced
+        by the scenes.
+        """
+        texture_paths = []
+        shader_paths = []
+        scene_paths = []
+        for item_type in item_types:
+            if item_type.sprite_texture_path not in texture_paths:
+                texture_paths.append(item_type.sprite_texture_path)
+            if item_type.outline_shader_path not in shader_paths:
+                shader_paths.append(item_type.outline_shader_path)
+        enemy_defs = [
+            enemy_def for section in area.sections for enemy_def in section.enemy_defs
+        ]
+        if area.area_type == LevelAreaType.BOSS:
+            enemy_defs.append(EnemyDefinition.BOSS())
+        for enemy_def in enemy_defs:
+            if enemy_def.scene_path not in scene_paths:
+                scene_paths.append(enemy_def.scene_path)
+            if enemy_def.enemy_type.shader_path not in shader_paths:
+                shader_paths.append(enemy_def.enemy_type.shader_path)
+        if area.area_type == LevelAreaType.END:
+            scene_paths.append(LevelAreaPreloader.WANDERING_SOUL_SCENE_PATH)
+        return texture_paths, shader_paths, scene_paths
+
+    def clear(self) -> None:
+        self.area = None
+        self.item_types = []
+        self.has_area_started = False
+        self._items.clear()
+        self._textures.clear()
+        self._shaders.clear()
+
+    def set_area_started(self) -> None:
+        self.has_area_started = True
+
+    def take_item(self, item_type: Type) -> Item:
+        """
+        Returns the preloaded item of the type if there is one, a new item otherwise.
+        """
+        for i, item in enumerate(self._items):
+            if type(item) is item_type:
+                return self._items.pop(i)
+        return ItemUtils.get_item_from_type(item_type)
+
+    @staticmethod
+    def evict_unneeded_scenes(area_num: int) -> None:
+        """
+        Evicts cached scenes that aren't needed by the area or any area after it.
+        """
+        scene_paths = set()
+        while LevelAreaDefinitions.is_valid_area_index(area_num):
+            area = LevelAreaDefinitions.get_def(area_num)
+            scene_paths.update(LevelAreaPreloader.get_area_asset_paths(area, [])[2])
+            area_num += 1
+        SceneCache.evict_all_except(scene_paths)
+
+    async def preload(self, area: LevelArea, item_types: List[Type]):
+        """
+        Preloads the area and creates an item for each of the item types, which are kept in 'item_types' so the area
+        can be set up with the same ones.
+        """
+        try:
+            self.clear()
+            self.area = area
+            self.item_types = item_types
+            texture_paths, shader_paths, scene_paths = (
+                LevelAreaPreloader.get_area_asset_paths(area, item_types)
+            )
+            # Filled by the file read thread, only read once it's finished
+            scene_texture_paths = []
+            self._file_read_thread = threading.Thread(
+                target=LevelAreaPreloader._read_asset_files,
+                args=(texture_paths + shader_paths + scene_paths, scene_texture_paths),
+                daemon=True,
+            )
+            self._file_read_thread.start()
+            while True:
+                self._file_read_thread.join(
+                    timeout=LevelAreaPreloader.file_read_wait_per_frame
+                )
+                if not self._file_read_thread.is_alive():
+                    break
+                await co_suspend()
+            self._file_read_thread = None
+
+            for texture_path in texture_paths + scene_texture_paths:
+                if texture_path not in self._textures:
+                    self._textures[texture_path] = Texture(texture_path)
+                    await co_suspend()
+            for shader_path in shader_paths:
+                self._shaders[shader_path] = ShaderUtil.compile_shader(shader_path)
+                await co_suspend()
+            for scene_path in scene_paths:
+                if SceneCache.preload(scene_path):
+                    await co_suspend()
+            for item_type in item_types:
+                if self.has_area_started:
+                    break
+                self._items.append(ItemUtils.get_item_from_type(item_type))
+                await co_suspend()
+            if area.area_type == LevelAreaType.BOSS and not self.has_area_started:
+                self.enemy_area_manager.preload_enemy(EnemyDefinition.BOSS())
+                await co_suspend()
+            await Task(coroutine=self.enemy_area_manager.prewarm_enemy_pools(area))
+        except GeneratorExit:
+            # The file read thread is left to finish on its own, it doesn't touch anything else
+            self._file_read_thread = None
+
+    @staticmethod
+    def _read_asset_files(file_paths: List[str], scene_texture_paths: List[str]):
+        """
+        Runs on the file read thread, mustn't call into the engine.
+        """
+        for file_path in file_paths:
+            data = LevelAreaPreloader._read_file(file_path)
+            if data and file_path.endswith(".cscn"):
+                try:
+                    scene_data = json.loads(data)
+                except ValueError:
+                    continue
+                for texture_path in LevelAreaPreloader._find_texture_paths(scene_data):
+                    if texture_path not in scene_texture_paths:
+                        scene_texture_paths.append(texture_path)
+                        LevelAreaPreloader._read_file(texture_path)
+
+    @staticmethod
+    def _read_file(file_path: str) -> Optional[bytes]:
+        try:
+            with open(file_path, "rb") as file:
+                return file.read()
+        except OSError:
+            return None
+
+    @staticmethod
+    def _find_texture_paths(scene_data) -> List[str]:
+        texture_paths = []
+        nodes = [scene_data]
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if key == "texture_path" and isinstance(value, str):
+                        texture_paths.append(value)
+                    else:
+                        nodes.append(value)
+            elif isinstance(node, list):
+                nodes.extend(node)
+        return texture_paths
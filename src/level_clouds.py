@@ -3,8 +3,16 @@ import random
 from crescent_api import *
 from crescent_api import Vector2
 
+from src.utils.frame_context import FrameContext
+from src.utils.game_clock import GameClock
 from src.utils.game_math import Ease
-from src.utils.task import co_wait_seconds, Task
+from src.utils.task import (
+    co_wait_seconds,
+    co_suspend,
+    Task,
+    TaskPriority,
+    TaskScheduler,
+)
 
 CLOUD_TEXTURES = [
     Texture(file_path="assets/images/environment/cloud_variation1.png"),
@@ -23,10 +31,15 @@ class LevelCloud(Sprite):
         self.move_dir = Vector2.RIGHT
         self._elapsed_time = 0.0
 
+    def _start(self) -> None:
+        TaskScheduler().add_node_task(
+            self, Task(coroutine=self._move_task(), priority=TaskPriority.COSMETIC)
+        )
+
     def set_random_texture(self) -> None:
         self.texture = random.choice(CLOUD_TEXTURES)
 
-    def _fixed_update(self, delta_time: float) -> None:
+    def _move(self, delta_time: float) -> None:
         self._elapsed_time += delta_time
         current_pos = self.position
         new_pos = (
@@ -49,11 +62,11 @@ class LevelCloud(Sprite):
     def _attempt_reposition(
         self, position: Vector2, padding=96
     ) -> tuple[Vector2, bool]:
-        camera_pos = Camera2D.get_position()
-        game_props = GameProperties()
+        camera_pos = FrameContext.get_camera_position()
+        game_resolution = FrameContext.get_game_resolution()
         camera_dimension = Size2D(
-            game_props.game_resolution.w + camera_pos.x,
-            game_props.game_resolution.h + camera_pos.y,
+            game_resolution.w + camera_pos.x,
+            game_resolution.h + camera_pos.y,
         )
         # Check if too far to left
         has_repositioned = False
@@ -65,14 +78,33 @@ class LevelCloud(Sprite):
             has_repositioned = True
         return position, has_repositioned
 
+    # --- TASKS --- #
+    async def _move_task(self):
+        try:
+            clock = GameClock.get_node_clock(self)
+            while True:
+                self._move(clock.delta_time)
+                await co_suspend()
+        except GeneratorExit:
+            pass
+
 
 class LevelCloudManager:
     def __init__(self):
-        self.manage_clouds_task_handle = Task(coroutine=self._manage_clouds_task())
+        self.manage_clouds_task_handle: Optional[Task] = None
         self.spawned_clouds: List[LevelCloud] = []
 
-    def update(self) -> None:
-        self.manage_clouds_task_handle.resume()
+    def start(self) -> None:
+        if not self.manage_clouds_task_handle:
+            # Only spawns clouds every few seconds, doesn't need to run every fixed step
+            self.manage_clouds_task_handle = TaskScheduler().add_node_task(
+                SceneTree.get_root(),
+                Task(
+                    coroutine=self._manage_clouds_task(),
+                    tick_frequency=4.0,
+                    priority=TaskPriority.COSMETIC,
+                ),
+            )
 
     async def _manage_clouds_task(self):
         try:
@@ -81,7 +113,7 @@ class LevelCloudManager:
             self.spawned_clouds.clear()
             # Spawn initial clouds
             clouds_to_spawn = max_clouds - len(self.spawned_clouds)
-            camera_pos = Camera2D.get_position()
+            camera_pos = FrameContext.get_camera_position()
             main_node = SceneTree.get_root()
             for i in range(clouds_to_spawn):
                 cloud = LevelCloud.new()
@@ -95,7 +127,7 @@ class LevelCloudManager:
                 main_node.add_child(cloud)
             while True:
                 clouds_to_spawn = max_clouds - len(self.spawned_clouds)
-                camera_pos = Camera2D.get_position()
+                camera_pos = FrameContext.get_camera_position()
                 for i in range(clouds_to_spawn):
                     cloud = LevelCloud.new()
                     cloud.set_random_texture()
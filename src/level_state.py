@@ -1,7 +1,9 @@
 from crescent_api import *
 
 from src.environment.bridge_gate import BridgeGate
-from src.utils.task import co_suspend
+from src.utils.game_clock import GameClock
+from src.utils.signal import Signal
+from src.utils.task import co_suspend, co_tick
 
 
 class BridgeGateHelper:
@@ -68,13 +70,21 @@ class GameTimer:
                 seconds_string = f"{left_over_seconds}"
             return f"{minutes_string}:{seconds_string}"
 
-    def update(self) -> None:
-        delta_time = World.get_delta_time()
-        prev_time = self._time
+    def update(self, delta_time: Optional[float] = None) -> None:
+        if delta_time is None:
+            delta_time = GameClock.unscaled.delta_time
+        prev_time_seconds = int(self._time)
         self._time += delta_time
-        if prev_time != self._time:
+        if prev_time_seconds != int(self._time):
             self.time_label.text = self.get_formatted_time()
 
+    async def update_task(self):
+        try:
+            while True:
+                self.update(await co_tick())
+        except GeneratorExit:
+            pass
+
 
 class LevelState:
     """
@@ -98,7 +108,9 @@ class LevelState:
             cls.queued_new_enemy_time_dilation: Optional[float] = None
             cls.current_level_area_type: Optional[str] = None
             cls._enemy_time_dilation = 1.0
-            cls._time_dilation_change_subscribers: List[Callable] = []
+            # Emitted with the new enemy time dilation
+            cls.enemy_time_dilation_changed = Signal()
+            GameClock.set_enemy_time_dilation(cls._enemy_time_dilation)
         return cls._instance
 
     def is_game_state_paused(self) -> bool:
@@ -111,14 +123,14 @@ class LevelState:
     def set_enemy_time_dilation(self, time_dilation: float) -> None:
         if self._enemy_time_dilation != time_dilation:
             self._enemy_time_dilation = time_dilation
-            for subscriber_func in self._time_dilation_change_subscribers:
-                subscriber_func(self._enemy_time_dilation)
+            GameClock.set_enemy_time_dilation(time_dilation)
+            self.enemy_time_dilation_changed.emit(self._enemy_time_dilation)
 
     def get_enemy_time_dilation(self) -> float:
         return self._enemy_time_dilation
 
     def subscribe_to_enemy_time_dilation_change(self, func: Callable) -> None:
-        self._time_dilation_change_subscribers.append(func)
+        self.enemy_time_dilation_changed.subscribe(func)
 
     @classmethod
     def reset_instance(cls) -> None:
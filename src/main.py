@@ -1,29 +1,75 @@
 from crescent_api import *
 
+from src.characters.player_perception import PlayerPerception
 from src.game_master import GameMaster
-from src.utils.task import Task, co_suspend
+from src.utils.activity_manager import ActivityManager
+from src.utils.collision import CollisionWorld
+from src.utils.frame_context import FrameContext
+from src.utils.game_clock import GameClock
+from src.utils.kinematics import Kinematics
+from src.utils.node_pool import NodePool
+from src.utils.render_interpolation import RenderInterpolation
+from src.utils.scene_cache import SceneCache
+from src.utils.task import Task, TaskPriority, TaskScheduler, co_suspend
+from src.utils.task_profiler import TaskProfiler
 
 
 class Main(Node2D):
     def __init__(self, entity_id: int):
         super().__init__(entity_id=entity_id)
+        # Set before child nodes start so they can register for render interpolation
+        GameClock.set_physics_rate_from_environment()
         self.game_master = GameMaster(self)
         self.ground_scroll_task: Optional[Task] = None
 
     def _start(self) -> None:
+        TaskProfiler.enable_from_environment()
         bg_ground: Sprite = self.get_child("ParallaxBack").get_child("Ground")
-        self.ground_scroll_task = Task(coroutine=self._ground_scroll_task(bg_ground))
+        task_scheduler = TaskScheduler()
+        task_scheduler.add_node_task(self, self.game_master.main_task)
+        self.ground_scroll_task = task_scheduler.add_node_task(
+            self,
+            Task(
+                coroutine=self._ground_scroll_task(bg_ground),
+                priority=TaskPriority.COSMETIC,
+            ),
+        )
+
+    def _end(self) -> None:
+        TaskProfiler.flush()
+        TaskScheduler().kill_tasks()
+        GameClock.clear_node_clocks()
+        # The next scene's root starts undilated
+        GameClock.scene.set_time_dilation(1.0)
+        CollisionWorld.clear()
+        RenderInterpolation.clear()
+        NodePool.clear_pools()
+        ActivityManager.clear()
+        FrameContext.clear()
+        PlayerPerception.clear()
+        Kinematics.clear()
+        SceneCache.clear()
+        GameClock.set_physics_rate(None)
 
     def _fixed_update(self, delta_time: float) -> None:
-        self.game_master.update()
-        if self.ground_scroll_task:
-            self.ground_scroll_task.resume()
+        # Single engine callback that steps every scheduled task in the scene
+        if GameClock.tick():
+            RenderInterpolation.begin_step()
+            CollisionWorld.new_step()
+            FrameContext.begin_step()
+            PlayerPerception.update()
+            ActivityManager.update()
+            TaskScheduler().update()
+            Kinematics.step()
+            RenderInterpolation.end_step()
+        else:
+            RenderInterpolation.update()
 
     async def _ground_scroll_task(self, bg_ground: Sprite):
         try:
             move_speed = 2
             while True:
-                delta_time = World.get_time_dilation() * World.get_delta_time()
+                delta_time = GameClock.world.delta_time
                 new_pos = bg_ground.position
                 new_pos += Vector2.RIGHT * Vector2(delta_time * move_speed, 0)
                 # Prevent from running out of image
@@ -2,8 +2,9 @@ from crescent_api import *
 
 from src.level_state import LevelState
 from src.option_box_manager import OptionBoxManager
+from src.utils.game_clock import GameClock
 from src.utils.game_math import Easer, Ease
-from src.utils.task import Task, co_suspend, co_wait_seconds
+from src.utils.task import Task, TaskScheduler, co_suspend, co_wait_seconds
 from src.utils.timer import Timer
 
 
@@ -56,6 +57,10 @@ class TitleScreen(Node2D):
             self.option_arrow_top_sprite,
             ["Start", "Exit"],
         )
+        TaskScheduler().add_node_task(self, self.update_task)
+
+    def _end(self) -> None:
+        TaskScheduler().kill_tasks()
 
     def _update(self, delta_time: float) -> None:
         if Input.is_action_just_pressed("ui_confirm"):
@@ -69,7 +74,8 @@ class TitleScreen(Node2D):
             self.option_box_manager.process_inputs()
 
     def _fixed_update(self, delta_time: float) -> None:
-        self.update_task.resume()
+        GameClock.tick()
+        TaskScheduler().update()
         self.option_box_manager.update_tasks()
 
     # --- TASKS --- #
@@ -0,0 +1,155 @@
+from typing import Callable, Dict, Optional, Set
+
+from crescent_api import Node2D, SceneTree, Vector2
+
+from src.utils.frame_context import FrameContext
+from src.utils.game_clock import GameClock
+from src.utils.task import TaskScheduler
+
+
+class ActivityManager:
+    """
+    Puts nodes that are far outside of the camera into a dormant mode so their AI doesn't run while they can't be
+    seen.  Once per fixed step 'update' checks every registered node against the camera rect in one pass.  Nodes
+    further than 'sleep_margin' from the camera rect have their tasks suspended in the task scheduler and are woken
+    once they're back within 'wake_margin' (smaller, so nodes on the edge don't toggle every step).  Nodes registered
+    with an 'on_left_zone' callback (projectiles) have it called instead of going dormant, so they can be recycled.
+    Dormant nodes registered with a 'seek_player_speed' (enemies that chase the player) still get a coarse horizontal
+    move toward the player each step, so they follow it back into the wake zone instead of waiting for it to return.
+    Margins are kept larger than the 64 pixels of padding enemies use for their own off screen checks.
+    Nodes are removed once they exit the scene.
+    """
+
+    sleep_margin = 128.0
+    wake_margin = 96.0
+    # Entity id -> node, awake and dormant
+    _nodes: Dict[int, Node2D] = {}
+    _on_left_zone_callbacks: Dict[int, Callable[[Node2D], None]] = {}
+    _seek_player_speeds: Dict[int, float] = {}
+    _dormant_nodes: Set[int] = set()
+    _exit_subscribed_nodes: Set[int] = set()
+
+    @staticmethod
+    def add_node(
+        node: Node2D,
+        on_left_zone: Optional[Callable[[Node2D], None]] = None,
+        seek_player_speed: Optional[float] = None,
+    ) -> None:
+        entity_id = node.entity_id
+        ActivityManager._nodes[entity_id] = node
+        if on_left_zone:
+            ActivityManager._on_left_zone_callbacks[entity_id] = on_left_zone
+        if seek_player_speed:
+            ActivityManager._seek_player_speeds[entity_id] = seek_player_speed
+        if entity_id not in ActivityManager._exit_subscribed_nodes:
+            ActivityManager._exit_subscribed_nodes.add(entity_id)
+            node.subscribe_to_event(
+                "scene_exited",
+                SceneTree.get_root(),
+                lambda args: ActivityManager._on_node_exited(node),
+            )
+
+    @staticmethod
+    def remove_node(node: Node2D) -> None:
+        """
+        Stops managing the node, dormant nodes are woken first.
+        """
+        entity_id = node.entity_id
+        if entity_id in ActivityManager._dormant_nodes:
+            ActivityManager._wake(node)
+        ActivityManager._nodes.pop(entity_id, None)
+        ActivityManager._on_left_zone_callbacks.pop(entity_id, None)
+        ActivityManager._seek_player_speeds.pop(entity_id, None)
+
+    @staticmethod
+    def is_dormant(node: Node2D) -> bool:
+        return node.entity_id in ActivityManager._dormant_nodes
+
+    @staticmethod
+    def get_dormant_count() -> int:
+        return len(ActivityManager._dormant_nodes)
+
+    @staticmethod
+    def clear() -> None:
+        ActivityManager._nodes.clear()
+        ActivityManager._on_left_zone_callbacks.clear()
+        ActivityManager._seek_player_speeds.clear()
+        ActivityManager._dormant_nodes.clear()
+        ActivityManager._exit_subscribed_nodes.clear()
+
+    @staticmethod
+    def update() -> None:
+        if not ActivityManager._nodes:
+            return None
+        camera_pos = FrameContext.get_camera_position()
+        game_resolution = FrameContext.get_game_resolution()
+        sleep_margin = ActivityManager.sleep_margin
+        wake_margin = ActivityManager.wake_margin
+        # Camera rect expanded by each margin
+        sleep_left = camera_pos.x - sleep_margin
+        sleep_top = camera_pos.y - sleep_margin
+        sleep_right = camera_pos.x + game_resolution.w + sleep_margin
+        sleep_bottom = camera_pos.y + game_resolution.h + sleep_margin
+        wake_left = camera_pos.x - wake_margin
+        wake_top = camera_pos.y - wake_margin
+        wake_right = camera_pos.x + game_resolution.w + wake_margin
+        wake_bottom = camera_pos.y + game_resolution.h + wake_margin
+        dormant_nodes = ActivityManager._dormant_nodes
+        on_left_zone_callbacks = ActivityManager._on_left_zone_callbacks
+        seek_player_speeds = ActivityManager._seek_player_speeds
+        player_position = FrameContext.get_player_position()
+        # Copied as callbacks can remove nodes
+        for entity_id, node in list(ActivityManager._nodes.items()):
+            position = node.position
+            if entity_id in dormant_nodes:
+                seek_player_speed = seek_player_speeds.get(entity_id, None)
+                if seek_player_speed and player_position is not None:
+                    position = ActivityManager._seek_player(
+                        node, position, player_position.x, seek_player_speed
+                    )
+                if (
+                    wake_left <= position.x <= wake_right
+                    and wake_top <= position.y <= wake_bottom
+                ):
+                    ActivityManager._wake(node)
+            elif (
+                position.x < sleep_left
+                or position.x > sleep_right
+                or position.y < sleep_top
+                or position.y > sleep_bottom
+            ):
+                on_left_zone = on_left_zone_callbacks.get(entity_id, None)
+                if on_left_zone:
+                    on_left_zone(node)
+                else:
+                    dormant_nodes.add(entity_id)
+                    TaskScheduler().suspend_node_tasks(node)
+
+    @staticmethod
+    def _seek_player(
+        node: Node2D, position: Vector2, player_x: float, speed: float
+    ) -> Vector2:
+        offset_x = player_x - position.x
+        move_x = speed * GameClock.get_node_clock(node).delta_time
+        if move_x <= 0.0 or offset_x == 0.0:
+            return position
+        position = Vector2(
+            position.x + min(move_x, abs(offset_x)) * (1.0 if offset_x > 0.0 else -1.0),
+            position.y,
+        )
+        node.position = position
+        return position
+
+    @staticmethod
+    def _wake(node: Node2D) -> None:
+        ActivityManager._dormant_nodes.discard(node.entity_id)
+        TaskScheduler().resume_node_tasks(node)
+
+    @staticmethod
+    def _on_node_exited(node: Node2D) -> None:
+        entity_id = node.entity_id
+        ActivityManager._nodes.pop(entity_id, None)
+        ActivityManager._on_left_zone_callbacks.pop(entity_id, None)
+        ActivityManager._seek_player_speeds.pop(entity_id, None)
+        ActivityManager._dormant_nodes.discard(entity_id)
+        ActivityManager._exit_subscribed_nodes.discard(entity_id)
@@ -0,0 +1,362 @@
+from typing import Dict, Hashable, List, Set, Tuple
+
+from crescent_api import *
+
+from src.utils.signal import Signal
+
+# (left, top, right, bottom)
+Bounds = Tuple[float, float, float, float]
+
+
+def bounds_overlap(a: Bounds, b: Bounds) -> bool:
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def merge_bounds(a: Bounds, b: Bounds) -> Bounds:
+    return min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
+
+
+def swept_bounds_overlap(
+    previous_a: Bounds, a: Bounds, previous_b: Bounds, b: Bounds
+) -> bool:
+    """
+    Returns whether 'a' and 'b' overlapped at any point while moving from their previous bounds to their current
+    bounds, both are assumed to move in a straight line over the step.
+    """
+    # Move 'a' relative to 'b' and test it against 'b' where it started
+    move_x = (a[0] - previous_a[0]) - (b[0] - previous_b[0])
+    move_y = (a[1] - previous_a[1]) - (b[1] - previous_b[1])
+    enter_time = 0.0
+    exit_time = 1.0
+    for axis, move in ((0, move_x), (1, move_y)):
+        a_min = previous_a[axis]
+        a_max = previous_a[axis + 2]
+        b_min = previous_b[axis]
+        b_max = previous_b[axis + 2]
+        if move == 0.0:
+            if a_max <= b_min or b_max <= a_min:
+                return False
+            continue
+        axis_enter_time = (b_min - a_max) / move
+        axis_exit_time = (b_max - a_min) / move
+        if axis_enter_time > axis_exit_time:
+            axis_enter_time, axis_exit_time = axis_exit_time, axis_enter_time
+        enter_time = max(enter_time, axis_enter_time)
+        exit_time = min(exit_time, axis_exit_time)
+        if enter_time >= exit_time:
+            return False
+    return True
+
+
+class SpatialHash:
+    """
+    Uniform grid that buckets items by the cells their bounds touch.  Queries only return items that share a cell
+    with the queried bounds, so they still need an exact overlap test.
+    """
+
+    def __init__(self, cell_size=32.0):
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[Hashable]] = {}
+
+    def clear(self) -> None:
+        self._cells.clear()
+
+    def _get_cell_range(self, bounds: Bounds) -> Tuple[int, int, int, int]:
+        cell_size = self.cell_size
+        return (
+            int(bounds[0] // cell_size),
+            int(bounds[1] // cell_size),
+            int(bounds[2] // cell_size),
+            int(bounds[3] // cell_size),
+        )
+
+    def insert(self, item: Hashable, bounds: Bounds) -> None:
+        min_x, min_y, max_x, max_y = self._get_cell_range(bounds)
+        cells = self._cells
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                cell = cells.get((cell_x, cell_y), None)
+                if cell is None:
+                    cells[(cell_x, cell_y)] = [item]
+                else:
+                    cell.append(item)
+
+    def query(self, bounds: Bounds) -> Set[Hashable]:
+        min_x, min_y, max_x, max_y = self._get_cell_range(bounds)
+        cells = self._cells
+        candidates = set()
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                cell = cells.get((cell_x, cell_y), None)
+                if cell:
+                    candidates.update(cell)
+        return candidates
+
+
+class CollisionLayer:
+    """
+    Bit flags for collision layers and masks.  A collider is on a single layer and its mask is the layers its
+    collision queries test against.
+    """
+
+    NONE = 0
+    PLAYER = 1 << 0
+    PLAYER_ATTACK = 1 << 1
+    ENEMY = 1 << 2
+    ENEMY_ATTACK = 1 << 3
+    ITEM = 1 << 4
+    BRIDGE_GATE = 1 << 5
+    ALL = (1 << 6) - 1
+
+
+class CollisionWorld:
+    """
+    Broadphase in front of the engine's collision check.  Nodes register their 'Collider2D' and
+    'CollisionWorld.process_collisions(collider)' is used in place of 'CollisionHandler.process_collisions', only
+    colliders sharing a spatial hash cell get the exact AABB test.  The spatial hash is rebuilt from collider
+    positions on the first query of a fixed step and results are cached until 'new_step' is called (once per fixed
+    step by the current scene's root node), so repeated queries in the same frame are free.
+    Swept colliders (fast moving attacks) are tested along the path they moved since the previous step so they
+    can't tunnel through thin colliders when the physics rate is lowered.
+    Colliders are registered with a layer and a mask, each layer has its own spatial hash and a query only searches
+    the hashes for layers in the collider's mask so other layers are filtered out before the exact test.
+    Disabled colliders (pooled nodes parked out of play) are left out of the broadphase and never collide.
+    Colliders are unregistered once they exit the scene.
+    """
+
+    use_broadphase = True
+    _colliders: Dict[int, Collider2D] = {}
+    _collider_layers: Dict[int, int] = {}
+    _collider_masks: Dict[int, int] = {}
+    _spatial_hashes: Dict[int, SpatialHash] = {}
+    _swept_colliders: Set[int] = set()
+    _disabled_colliders: Set[int] = set()
+    _bounds: Dict[int, Bounds] = {}
+    _previous_bounds: Dict[int, Bounds] = {}
+    _cached_collisions: Dict[int, List[Collider2D]] = {}
+    _is_spatial_hash_dirty = True
+    _has_step_bounds = False
+
+    @staticmethod
+    def register_collider(
+        collider: Collider2D,
+        layer=CollisionLayer.ALL,
+        mask=CollisionLayer.ALL,
+        is_swept=False,
+    ) -> None:
+        if collider.entity_id in CollisionWorld._colliders:
+            return None
+        CollisionWorld._colliders[collider.entity_id] = collider
+        if is_swept:
+            CollisionWorld._swept_colliders.add(collider.entity_id)
+        CollisionWorld._collider_layers[collider.entity_id] = layer
+        CollisionWorld._collider_masks[collider.entity_id] = mask
+        CollisionWorld._is_spatial_hash_dirty = True
+        collider.subscribe_to_event(
+            "scene_exited",
+            SceneTree.get_root(),
+            lambda args: CollisionWorld.unregister_collider(collider),
+        )
+
+    @staticmethod
+    def unregister_collider(collider: Collider2D) -> None:
+        if CollisionWorld._colliders.pop(collider.entity_id, None):
+            CollisionWorld._collider_layers.pop(collider.entity_id, None)
+            CollisionWorld._collider_masks.pop(collider.entity_id, None)
+            CollisionWorld._swept_colliders.discard(collider.entity_id)
+            CollisionWorld._disabled_colliders.discard(collider.entity_id)
+            CollisionWorld._bounds.pop(collider.entity_id, None)
+            CollisionWorld._previous_bounds.pop(collider.entity_id, None)
+            CollisionWorld._cached_collisions.pop(collider.entity_id, None)
+            CollisionWorld._is_spatial_hash_dirty = True
+
+    @staticmethod
+    def set_collider_mask(collider: Collider2D, mask: int) -> None:
+        if collider.entity_id in CollisionWorld._collider_masks:
+            CollisionWorld._collider_masks[collider.entity_id] = mask
+            CollisionWorld._cached_collisions.pop(collider.entity_id, None)
+
+    @staticmethod
+    def set_collider_enabled(collider: Collider2D, is_enabled: bool) -> None:
+        entity_id = collider.entity_id
+        if entity_id not in CollisionWorld._colliders:
+            return None
+        if is_enabled:
+            CollisionWorld._disabled_colliders.discard(entity_id)
+        else:
+            CollisionWorld._disabled_colliders.add(entity_id)
+        # Don't sweep from where the collider was before it was disabled
+        CollisionWorld._bounds.pop(entity_id, None)
+        CollisionWorld._previous_bounds.pop(entity_id, None)
+        CollisionWorld._cached_collisions.clear()
+        CollisionWorld._is_spatial_hash_dirty = True
+
+    @staticmethod
+    def is_collider_enabled(collider: Collider2D) -> bool:
+        return collider.entity_id not in CollisionWorld._disabled_colliders
+
+    @staticmethod
+    def clear() -> None:
+        CollisionWorld._colliders.clear()
+        CollisionWorld._collider_layers.clear()
+        CollisionWorld._collider_masks.clear()
+        CollisionWorld._swept_colliders.clear()
+        CollisionWorld._disabled_colliders.clear()
+        CollisionWorld._bounds.clear()
+        CollisionWorld._previous_bounds.clear()
+        CollisionWorld._cached_collisions.clear()
+        CollisionWorld._spatial_hashes.clear()
+        CollisionWorld._is_spatial_hash_dirty = True
+        CollisionWorld._has_step_bounds = False
+
+    @staticmethod
+    def new_step() -> None:
+        CollisionWorld._cached_collisions.clear()
+        CollisionWorld._is_spatial_hash_dirty = True
+        # Bounds from the last step that had queries are where swept colliders are swept from
+        if CollisionWorld._has_step_bounds:
+            CollisionWorld._previous_bounds, CollisionWorld._bounds = (
+                CollisionWorld._bounds,
+                CollisionWorld._previous_bounds,
+            )
+            CollisionWorld._has_step_bounds = False
+
+    @staticmethod
+    def get_collider_count() -> int:
+        return len(CollisionWorld._colliders)
+
+    @staticmethod
+    def get_collider_bounds(collider: Collider2D) -> Bounds:
+        position = collider.global_position
+        extents = collider.extents
+        return (
+            position.x,
+            position.y,
+            position.x + extents.w,
+            position.y + extents.h,
+        )
+
+    @staticmethod
+    def process_collisions(collider: Collider2D) -> List[Collider2D]:
+        entity_id = collider.entity_id
+        collisions = CollisionWorld._cached_collisions.get(entity_id, None)
+        if collisions is not None:
+            return collisions
+        if entity_id in CollisionWorld._disabled_colliders:
+            return []
+        mask = CollisionWorld._collider_masks.get(entity_id, CollisionLayer.ALL)
+        if not CollisionWorld.use_broadphase:
+            collider_layers = CollisionWorld._collider_layers
+            disabled_colliders = CollisionWorld._disabled_colliders
+            collisions = [
+                other_collider
+                for other_collider in CollisionHandler.process_collisions(collider)
+                if collider_layers.get(other_collider.entity_id, CollisionLayer.ALL)
+                & mask
+                and other_collider.entity_id not in disabled_colliders
+            ]
+            CollisionWorld._cached_collisions[entity_id] = collisions
+            return collisions
+        if CollisionWorld._is_spatial_hash_dirty:
+            CollisionWorld._rebuild_spatial_hash()
+        all_bounds = CollisionWorld._bounds
+        all_previous_bounds = CollisionWorld._previous_bounds
+        swept_colliders = CollisionWorld._swept_colliders
+        bounds = all_bounds.get(entity_id, None)
+        if not bounds:
+            bounds = CollisionWorld.get_collider_bounds(collider)
+        previous_bounds = all_previous_bounds.get(entity_id, bounds)
+        is_swept = entity_id in swept_colliders
+        query_bounds = merge_bounds(previous_bounds, bounds) if is_swept else bounds
+        colliders = CollisionWorld._colliders
+        collisions = []
+        for layer, spatial_hash in CollisionWorld._spatial_hashes.items():
+            if not layer & mask:
+                continue
+            for other_entity_id in spatial_hash.query(query_bounds):
+                if other_entity_id == entity_id:
+                    continue
+                other_bounds = all_bounds[other_entity_id]
+                if is_swept or other_entity_id in swept_colliders:
+                    is_colliding = swept_bounds_overlap(
+                        previous_bounds,
+                        bounds,
+                        all_previous_bounds.get(other_entity_id, other_bounds),
+                        other_bounds,
+                    )
+                else:
+                    is_colliding = bounds_overlap(bounds, other_bounds)
+                if is_colliding:
+                    collisions.append(colliders[other_entity_id])
+        CollisionWorld._cached_collisions[entity_id] = collisions
+        return collisions
+
+    @staticmethod
+    def _rebuild_spatial_hash() -> None:
+        spatial_hashes = CollisionWorld._spatial_hashes
+        for spatial_hash in spatial_hashes.values():
+            spatial_hash.clear()
+        collider_layers = CollisionWorld._collider_layers
+        swept_colliders = CollisionWorld._swept_colliders
+        disabled_colliders = CollisionWorld._disabled_colliders
+        all_bounds = CollisionWorld._bounds
+        all_bounds.clear()
+        all_previous_bounds = CollisionWorld._previous_bounds
+        for entity_id, collider in CollisionWorld._colliders.items():
+            if entity_id in disabled_colliders:
+                continue
+            bounds = CollisionWorld.get_collider_bounds(collider)
+            all_bounds[entity_id] = bounds
+            if entity_id in swept_colliders:
+                # Swept colliders fill every cell along the path they moved
+                previous_bounds = all_previous_bounds.get(entity_id, None)
+                if previous_bounds:
+                    bounds = merge_bounds(previous_bounds, bounds)
+            layer = collider_layers[entity_id]
+            spatial_hash = spatial_hashes.get(layer, None)
+            if not spatial_hash:
+                spatial_hash = SpatialHash()
+                spatial_hashes[layer] = spatial_hash
+            spatial_hash.insert(entity_id, bounds)
+        CollisionWorld._is_spatial_hash_dirty = False
+        CollisionWorld._has_step_bounds = True
+
+
+class ContactTracker:
+    """
+    Keeps a collider's contacts between fixed steps and emits signals only when they change, 'contact_entered' and
+    'contact_exited' are emitted once per contact and 'contact_stay' every step for contacts that are still touching.
+    Signals are emitted with the node the other collider is attached to.  Contacts with nodes queued for deletion
+    count as exited.  Call 'update' once per fixed step.
+    """
+
+    def __init__(self, collider: Collider2D):
+        self.collider = collider
+        self.contact_entered = Signal()
+        self.contact_stay = Signal()
+        self.contact_exited = Signal()
+        # Other collider entity id -> node the collider is attached to
+        self._contacts: Dict[int, Node] = {}
+
+    def get_contacts(self) -> List[Node]:
+        return list(self._contacts.values())
+
+    def update(self) -> None:
+        previous_contacts = self._contacts
+        current_contacts: Dict[int, Node] = {}
+        for other_collider in CollisionWorld.process_collisions(self.collider):
+            other_entity_id = other_collider.entity_id
+            node = previous_contacts.get(other_entity_id, None)
+            if node is None:
+                node = other_collider.get_parent()
+            if not node.is_queued_for_deletion:
+                current_contacts[other_entity_id] = node
+        self._contacts = current_contacts
+        for other_entity_id, node in previous_contacts.items():
+            if other_entity_id not in current_contacts:
+                self.contact_exited.emit(node)
+        for other_entity_id, node in current_contacts.items():
+            if other_entity_id in previous_contacts:
+                self.contact_stay.emit(node)
+            else:
+                self.contact_entered.emit(node)
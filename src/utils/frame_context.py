@@ -0,0 +1,129 @@
+from typing import Optional
+
+from crescent_api import Camera2D, GameProperties, Node2D, Size2D, Vector2
+
+from src.utils.game_clock import GameClock
+
+
+class FrameContext:
+    """
+    Snapshot of engine values that don't change within a fixed step, filled once by 'begin_step' at the start of each
+    step so hot code doesn't query the engine itself.  Values are as of the start of the step, so the camera and player
+    may have moved since for code that runs after them.  Returned vectors are shared and shouldn't be modified.
+    The game resolution never changes so it's only queried once.  Time dilation and the step's delta come from
+    'GameClock' which already queried them during its tick.
+    Every read is counted as an engine call saved, minus the calls 'begin_step' made to fill the snapshot.
+    """
+
+    camera_position: Optional[Vector2] = None
+    game_resolution: Optional[Size2D] = None
+    delta_time = 0.0
+    world_time_dilation = 1.0
+    enemy_time_dilation = 1.0
+    is_world_paused = False
+    player: Optional[Node2D] = None
+    player_position: Optional[Vector2] = None
+    step_count = 0
+    engine_call_count = 0
+    read_count = 0
+    max_saved_calls_per_step = 0
+    _step_engine_call_count = 0
+    _step_read_count = 0
+
+    @staticmethod
+    def begin_step() -> None:
+        FrameContext._end_step_counters()
+        FrameContext.step_count += 1
+        FrameContext.camera_position = Camera2D.get_position()
+        FrameContext._step_engine_call_count += 1
+        if FrameContext.game_resolution is None:
+            FrameContext.game_resolution = GameProperties().game_resolution
+            FrameContext._step_engine_call_count += 1
+        FrameContext.delta_time = GameClock.unscaled.delta_time
+        FrameContext.world_time_dilation = GameClock.world.time_dilation
+        FrameContext.enemy_time_dilation = GameClock.enemy.time_dilation
+        FrameContext.is_world_paused = GameClock.world.time_dilation <= 0.0
+        if FrameContext.player:
+            FrameContext.player_position = FrameContext.player.position
+            FrameContext._step_engine_call_count += 1
+
+    @staticmethod
+    def set_player(player: Optional[Node2D]) -> None:
+        FrameContext.player = player
+        FrameContext.player_position = player.position if player else None
+
+    @staticmethod
+    def get_camera_position() -> Vector2:
+        if FrameContext.camera_position is None:
+            FrameContext.camera_position = Camera2D.get_position()
+            FrameContext._step_engine_call_count += 1
+        FrameContext._step_read_count += 1
+        return FrameContext.camera_position
+
+    @staticmethod
+    def get_game_resolution() -> Size2D:
+        if FrameContext.game_resolution is None:
+            FrameContext.game_resolution = GameProperties().game_resolution
+            FrameContext._step_engine_call_count += 1
+        FrameContext._step_read_count += 1
+        return FrameContext.game_resolution
+
+    @staticmethod
+    def get_player_position() -> Optional[Vector2]:
+        if FrameContext.player_position is None and FrameContext.player:
+            FrameContext.player_position = FrameContext.player.position
+            FrameContext._step_engine_call_count += 1
+        FrameContext._step_read_count += 1
+        return FrameContext.player_position
+
+    @staticmethod
+    def get_saved_calls() -> int:
+        return (
+            FrameContext.read_count
+            + FrameContext._step_read_count
+            - FrameContext.engine_call_count
+            - FrameContext._step_engine_call_count
+        )
+
+    @staticmethod
+    def get_counters() -> dict:
+        saved_calls = FrameContext.get_saved_calls()
+        step_count = FrameContext.step_count
+        return {
+            "step_count": step_count,
+            "engine_call_count": FrameContext.engine_call_count
+            + FrameContext._step_engine_call_count,
+            "saved_call_count": saved_calls,
+            "saved_calls_per_step": saved_calls / step_count if step_count else 0.0,
+            "max_saved_calls_per_step": FrameContext.max_saved_calls_per_step,
+        }
+
+    @staticmethod
+    def reset_counters() -> None:
+        FrameContext.step_count = 0
+        FrameContext.engine_call_count = 0
+        FrameContext.read_count = 0
+        FrameContext.max_saved_calls_per_step = 0
+        FrameContext._step_engine_call_count = 0
+        FrameContext._step_read_count = 0
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Forgets the scene's snapshot, counters are kept so they can be reported across scenes.
+        """
+        FrameContext._end_step_counters()
+        FrameContext.camera_position = None
+        FrameContext.player = None
+        FrameContext.player_position = None
+
+    @staticmethod
+    def _end_step_counters() -> None:
+        FrameContext.max_saved_calls_per_step = max(
+            FrameContext.max_saved_calls_per_step,
+            FrameContext._step_read_count - FrameContext._step_engine_call_count,
+        )
+        FrameContext.engine_call_count += FrameContext._step_engine_call_count
+        FrameContext.read_count += FrameContext._step_read_count
+        FrameContext._step_engine_call_count = 0
+        FrameContext._step_read_count = 0
@@ -0,0 +1,281 @@
+import os
+from typing import Dict, Optional, Union
+
+from crescent_api import World, Engine, Node, SceneTree
+
+from src.utils.signal import Signal
+
+
+class Clock:
+    """
+    Accumulates (optionally dilated) time.  Clocks are advanced once per fixed step by 'GameClock.tick' so readers
+    don't need to query the engine themselves.
+    """
+
+    def __init__(self, parent: Optional["Clock"] = None, time_dilation=1.0):
+        self.parent = parent
+        self.time_dilation = time_dilation
+        self.time = 0.0
+        self.delta_time = 0.0
+
+    def advance(self, delta_time: float) -> None:
+        if self.parent:
+            delta_time = self.parent.delta_time
+        self.delta_time = delta_time * self.time_dilation
+        self.time += self.delta_time
+
+    def get_time(self) -> float:
+        return self.time
+
+
+class NodeClock(Clock):
+    """
+    Clock that follows a node's full time dilation (including its parents) with the physics step's delta applied.
+    """
+
+    def __init__(self, node: Node):
+        super().__init__()
+        self.node = node
+
+    def advance(self, delta_time: float) -> None:
+        self.delta_time = (
+            self.node.get_full_time_dilation_with_physics_delta()
+            * GameClock.ticks_per_step
+        )
+        self.time += self.delta_time
+
+
+class DilationGroup(Clock):
+    """
+    Named clock in a hierarchy of time dilation groups.  Nodes join a group once (see 'GameClock.join_group') instead
+    of having their time dilation set one by one, so changing a group's time dilation costs the same no matter how many
+    nodes are in it.  'version' goes up each time the group's dilation changes, members compare it against the version
+    they last applied to resolve their node's time dilation lazily.
+    'is_node_dilation' is False for groups whose dilation the engine already applies to nodes itself (the world's
+    time dilation and the scene root's).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        parent: Optional["DilationGroup"] = None,
+        time_dilation=1.0,
+        is_node_dilation=True,
+    ):
+        super().__init__(parent=parent, time_dilation=time_dilation)
+        self.name = name
+        self.is_node_dilation = is_node_dilation
+        self._version = 0
+
+    def set_time_dilation(self, time_dilation: float) -> None:
+        if self.time_dilation != time_dilation:
+            self.time_dilation = time_dilation
+            self._version += 1
+
+    def get_version(self) -> int:
+        # Versions only go up, so the sum changes whenever this group's or a parent's dilation changes
+        version = self._version
+        parent = self.parent
+        while parent:
+            version += parent._version
+            parent = parent.parent
+        return version
+
+    def get_node_time_dilation(self) -> float:
+        """
+        Time dilation to set on member nodes, the product of the groups' dilations the engine doesn't apply itself.
+        """
+        time_dilation = 1.0
+        group = self
+        while group:
+            if group.is_node_dilation:
+                time_dilation *= group.time_dilation
+            group = group.parent
+        return time_dilation
+
+
+class GroupNodeClock:
+    """
+    Clock of a node that joined a dilation group, it reads the group's clock instead of querying the node's time
+    dilation from the engine each step.  The group's dilation is applied to the node the first time the clock is read
+    after it changed.
+    """
+
+    def __init__(self, node: Node, group: DilationGroup):
+        self.node = node
+        self.group = group
+        self._version = -1
+
+    @property
+    def delta_time(self) -> float:
+        if self._version != self.group.get_version():
+            self.sync()
+        return self.group.delta_time
+
+    @property
+    def time(self) -> float:
+        return self.group.time
+
+    def get_time(self) -> float:
+        return self.group.time
+
+    def sync(self) -> None:
+        self._version = self.group.get_version()
+        self.node.time_dilation = self.group.get_node_time_dilation()
+
+
+class GameClock:
+    """
+    Global game clocks.  Should be ticked once per fixed step by the current scene's root node.  Clocks are dilation
+    groups that nodes can join by name with 'join_group':
+    'world' - Scaled by the world's time dilation (pausing, boss death freeze, etc...)
+    'scene' - World time scaled by the scene root's time dilation (set with 'set_scene_time_dilation')
+    'enemies' ('enemy') - Scene time scaled by the level state's enemy time dilation (slow time ability)
+    'player' - Scene time scaled by the player's time dilation
+    'ui' ('unscaled') - Raw physics delta, ignores all time dilation
+    'world_time_dilation_changed' is emitted with the new time dilation when the world's time dilation changes.
+    The physics rate can be lowered below the engine's fixed rate (set the 'PHYSICS_RATE' environment variable to
+    the rate in Hz, e.g. 33 or 44), clocks then only advance every 'ticks_per_step' engine ticks with the delta of all
+    of them and 'tick' returns whether a physics step is due.
+    """
+
+    PHYSICS_RATE_ENV_VAR = "PHYSICS_RATE"
+
+    unscaled = DilationGroup("ui", is_node_dilation=False)
+    world = DilationGroup("world", is_node_dilation=False)
+    scene = DilationGroup("scene", parent=world, is_node_dilation=False)
+    enemy = DilationGroup("enemies", parent=scene)
+    player = DilationGroup("player", parent=scene)
+    # Parents come before their children so they're advanced first
+    groups: Dict[str, DilationGroup] = {
+        group.name: group for group in [unscaled, world, scene, enemy, player]
+    }
+    world_time_dilation_changed = Signal()
+    _node_clocks: Dict[int, NodeClock] = {}
+    _group_node_clocks: Dict[int, GroupNodeClock] = {}
+    ticks_per_step = 1
+    _ticks_since_step = 0
+    # Engine's fixed delta, doesn't change so it's only queried once
+    _physics_delta_time: Optional[float] = None
+
+    @staticmethod
+    def set_physics_rate(physics_rate: Optional[float]) -> None:
+        """
+        Runs physics steps at roughly 'physics_rate' (Hz), None runs them at the engine's fixed rate.
+        """
+        if physics_rate:
+            physics_delta_time = GameClock.get_physics_delta_time()
+            GameClock.ticks_per_step = max(
+                1, round(1.0 / (physics_rate * physics_delta_time))
+            )
+        else:
+            GameClock.ticks_per_step = 1
+        # Step on the next tick
+        GameClock._ticks_since_step = GameClock.ticks_per_step - 1
+
+    @staticmethod
+    def set_physics_rate_from_environment() -> None:
+        physics_rate = os.environ.get(GameClock.PHYSICS_RATE_ENV_VAR, None)
+        if physics_rate:
+            GameClock.set_physics_rate(float(physics_rate))
+
+    @staticmethod
+    def get_physics_delta_time() -> float:
+        if GameClock._physics_delta_time is None:
+            GameClock._physics_delta_time = Engine.get_global_physics_delta_time()
+        return GameClock._physics_delta_time
+
+    @staticmethod
+    def get_step_delta_time() -> float:
+        return GameClock.get_physics_delta_time() * GameClock.ticks_per_step
+
+    @staticmethod
+    def get_step_alpha() -> float:
+        """
+        How far the current engine tick is between the last physics step and the next one (0.0 - 1.0).
+        """
+        return GameClock._ticks_since_step / GameClock.ticks_per_step
+
+    @staticmethod
+    def tick() -> bool:
+        GameClock._ticks_since_step += 1
+        if GameClock._ticks_since_step < GameClock.ticks_per_step:
+            return False
+        GameClock._ticks_since_step = 0
+        delta_time = GameClock.get_step_delta_time()
+        GameClock.unscaled.advance(delta_time)
+        world_time_dilation = World.get_time_dilation()
+        if GameClock.world.time_dilation != world_time_dilation:
+            GameClock.world.set_time_dilation(world_time_dilation)
+            GameClock.world_time_dilation_changed.emit(world_time_dilation)
+        for group in GameClock.groups.values():
+            if group is not GameClock.unscaled:
+                group.advance(delta_time)
+        for node_clock in GameClock._node_clocks.values():
+            node_clock.advance(delta_time)
+        return True
+
+    @staticmethod
+    def get_node_clock(node: Node) -> Union[NodeClock, GroupNodeClock]:
+        """
+        Returns the clock for a node, its group's clock if it joined one, otherwise a 'NodeClock' that is created if it
+        doesn't exist.  The clock is removed once the node exits the scene.
+        """
+        group_node_clock = GameClock._group_node_clocks.get(node.entity_id, None)
+        if group_node_clock:
+            return group_node_clock
+        node_clock = GameClock._node_clocks.get(node.entity_id, None)
+        if not node_clock:
+            node_clock = NodeClock(node)
+            GameClock._node_clocks[node.entity_id] = node_clock
+            node.subscribe_to_event(
+                "scene_exited",
+                SceneTree.get_root(),
+                lambda args: GameClock.remove_node_clock(node),
+            )
+        return node_clock
+
+    @staticmethod
+    def join_group(node: Node, group_name: str) -> GroupNodeClock:
+        """
+        Puts the node in a dilation group, its clock follows the group's from now on and the group's dilation is
+        applied to it right away.  Nodes stay in the group until they exit the scene (pooled nodes keep it while
+        parked).
+        """
+        group_node_clock = GroupNodeClock(node, GameClock.groups[group_name])
+        group_node_clock.sync()
+        if (
+            node.entity_id not in GameClock._node_clocks
+            and node.entity_id not in GameClock._group_node_clocks
+        ):
+            node.subscribe_to_event(
+                "scene_exited",
+                SceneTree.get_root(),
+                lambda args: GameClock.remove_node_clock(node),
+            )
+        # Clocks are looked up by node, so the node's old clock isn't advanced anymore
+        GameClock._node_clocks.pop(node.entity_id, None)
+        GameClock._group_node_clocks[node.entity_id] = group_node_clock
+        return group_node_clock
+
+    @staticmethod
+    def remove_node_clock(node: Node) -> None:
+        GameClock._node_clocks.pop(node.entity_id, None)
+        GameClock._group_node_clocks.pop(node.entity_id, None)
+
+    @staticmethod
+    def clear_node_clocks() -> None:
+        GameClock._node_clocks.clear()
+        GameClock._group_node_clocks.clear()
+
+    @staticmethod
+    def set_enemy_time_dilation(time_dilation: float) -> None:
+        GameClock.enemy.set_time_dilation(time_dilation)
+
+    @staticmethod
+    def set_scene_time_dilation(time_dilation: float) -> None:
+        """
+        Sets the scene root's time dilation along with the 'scene' group's, so grouped nodes follow it too.
+        """
+        SceneTree.get_root().time_dilation = time_dilation
+        GameClock.scene.set_time_dilation(time_dilation)
@@ -1,8 +1,10 @@
 import math
-from typing import Callable
+from typing import Callable, Optional
 
 from crescent_api import Vector2, Rect2
 
+from src.utils.game_clock import Clock
+
 # GENERAL
 PI = 3.141593
 
@@ -234,13 +236,26 @@ class Ease:
 
 
 class Easer:
-    def __init__(self, from_pos, to_pos, duration: float, func: Callable):
+    def __init__(
+        self,
+        from_pos,
+        to_pos,
+        duration: float,
+        func: Callable,
+        clock: Optional[Clock] = None,
+    ):
         self.from_pos = from_pos
         self.to_pos = to_pos
         self.duration = duration
         self.func = func
+        self.clock = clock
         self.elapsed_time = 0.0
 
-    def ease(self, delta: float):
+    def ease(self, delta: Optional[float] = None):
+        """
+        Advances by 'delta', or by the attached clock's delta time if not passed in.
+        """
+        if delta is None:
+            delta = self.clock.delta_time
         self.elapsed_time += delta
         return self.func(self.elapsed_time, self.from_pos, self.to_pos, self.duration)
@@ -0,0 +1,229 @@
+from typing import Dict, List, Optional, Set
+
+from crescent_api import Node2D, SceneTree, Vector2
+
+from src.utils.game_clock import Clock, GameClock
+from src.utils.task import TaskScheduler
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Kinematics:
+    """
+    Batched straight line movement.  Nodes that move at a constant velocity opt in with 'add_body' instead of moving
+    themselves.  Body positions, velocities and speed scales are kept as struct-of-arrays columns (NumPy arrays if
+    it's installed, lists otherwise) and 'step' integrates every body at once at the end of each fixed step, scaled by
+    the delta of each body's clock (the node's clock by default, so its full time dilation applies), then writes the
+    positions of bodies that moved back to their nodes in one pass.
+    The columns are the source of truth for a body's position, code that moves a body's node itself has to use
+    'set_position' or remove the body first.  Bodies of nodes with suspended tasks (dormant) don't move.  Bodies are
+    removed once their node exits the scene.
+    """
+
+    count = 0
+    _capacity = 0
+    _positions_x = None
+    _positions_y = None
+    _velocities_x = None
+    _velocities_y = None
+    _speed_scales = None
+    _nodes: List[Node2D] = []
+    _clocks: List[Clock] = []
+    _entity_ids: List[int] = []
+    # Entity id -> column index
+    _indices: Dict[int, int] = {}
+    _exit_subscribed_nodes: Set[int] = set()
+
+    @staticmethod
+    def is_vectorized() -> bool:
+        return numpy is not None
+
+    @staticmethod
+    def add_body(
+        node: Node2D,
+        velocity: Vector2,
+        speed_scale=1.0,
+        clock: Optional[Clock] = None,
+    ) -> None:
+        """
+        Starts moving the node from its current position, nodes that already have a body have it reset instead.
+        """
+        entity_id = node.entity_id
+        index = Kinematics._indices.get(entity_id, None)
+        if index is None:
+            index = Kinematics.count
+            if index >= Kinematics._capacity:
+                Kinematics._grow(max(16, Kinematics._capacity * 2))
+            Kinematics._nodes.append(node)
+            Kinematics._clocks.append(clock or GameClock.get_node_clock(node))
+            Kinematics._entity_ids.append(entity_id)
+            Kinematics._indices[entity_id] = index
+            Kinematics.count += 1
+        elif clock:
+            Kinematics._clocks[index] = clock
+        position = node.position
+        Kinematics._positions_x[index] = position.x
+        Kinematics._positions_y[index] = position.y
+        Kinematics._velocities_x[index] = velocity.x
+        Kinematics._velocities_y[index] = velocity.y
+        Kinematics._speed_scales[index] = speed_scale
+        if entity_id not in Kinematics._exit_subscribed_nodes:
+            Kinematics._exit_subscribed_nodes.add(entity_id)
+            node.subscribe_to_event(
+                "scene_exited",
+                SceneTree.get_root(),
+                lambda args: Kinematics._on_node_exited(node),
+            )
+
+    @staticmethod
+    def remove_body(node: Node2D) -> None:
+        index = Kinematics._indices.pop(node.entity_id, None)
+        if index is None:
+            return None
+        # Swap the last body into the removed body's slot so the columns stay packed
+        last_index = Kinematics.count - 1
+        if index != last_index:
+            for column in (
+                Kinematics._positions_x,
+                Kinematics._positions_y,
+                Kinematics._velocities_x,
+                Kinematics._velocities_y,
+                Kinematics._speed_scales,
+            ):
+                column[index] = column[last_index]
+            Kinematics._nodes[index] = Kinematics._nodes[last_index]
+            Kinematics._clocks[index] = Kinematics._clocks[last_index]
+            moved_entity_id = Kinematics._entity_ids[last_index]
+            Kinematics._entity_ids[index] = moved_entity_id
+            Kinematics._indices[moved_entity_id] = index
+        Kinematics._nodes.pop()
+        Kinematics._clocks.pop()
+        Kinematics._entity_ids.pop()
+        Kinematics.count -= 1
+
+    @staticmethod
+    def has_body(node: Node2D) -> bool:
+        return node.entity_id in Kinematics._indices
+
+    @staticmethod
+    def set_velocity(node: Node2D, velocity: Vector2) -> None:
+        index = Kinematics._indices.get(node.entity_id, None)
+        if index is not None:
+            Kinematics._velocities_x[index] = velocity.x
+            Kinematics._velocities_y[index] = velocity.y
+
+    @staticmethod
+    def set_speed_scale(node: Node2D, speed_scale: float) -> None:
+        index = Kinematics._indices.get(node.entity_id, None)
+        if index is not None:
+            Kinematics._speed_scales[index] = speed_scale
+
+    @staticmethod
+    def set_position(node: Node2D, position: Vector2) -> None:
+        node.position = position
+        index = Kinematics._indices.get(node.entity_id, None)
+        if index is not None:
+            Kinematics._positions_x[index] = position.x
+            Kinematics._positions_y[index] = position.y
+
+    @staticmethod
+    def clear() -> None:
+        Kinematics.count = 0
+        Kinematics._capacity = 0
+        Kinematics._positions_x = None
+        Kinematics._positions_y = None
+        Kinematics._velocities_x = None
+        Kinematics._velocities_y = None
+        Kinematics._speed_scales = None
+        Kinematics._nodes.clear()
+        Kinematics._clocks.clear()
+        Kinematics._entity_ids.clear()
+        Kinematics._indices.clear()
+        Kinematics._exit_subscribed_nodes.clear()
+
+    @staticmethod
+    def step() -> None:
+        """
+        Moves every body by its velocity over its clock's delta, called once at the end of each fixed step.
+        """
+        count = Kinematics.count
+        if count == 0:
+            return None
+        suspended_node_ids = TaskScheduler().get_suspended_node_ids()
+        if suspended_node_ids:
+            delta_times = [
+                0.0 if entity_id in suspended_node_ids else clock.delta_time
+                for entity_id, clock in zip(Kinematics._entity_ids, Kinematics._clocks)
+            ]
+        else:
+            delta_times = [clock.delta_time for clock in Kinematics._clocks]
+        if numpy is not None:
+            moved_indices = Kinematics._step_vectorized(delta_times)
+        else:
+            moved_indices = Kinematics._step_python(delta_times)
+        nodes = Kinematics._nodes
+        positions_x = Kinematics._positions_x
+        positions_y = Kinematics._positions_y
+        if numpy is not None:
+            positions_x = positions_x[:count].tolist()
+            positions_y = positions_y[:count].tolist()
+        for index in moved_indices:
+            nodes[index].position = Vector2(positions_x[index], positions_y[index])
+
+    @staticmethod
+    def _step_vectorized(delta_times: List[float]) -> List[int]:
+        count = Kinematics.count
+        scales = Kinematics._speed_scales[:count] * numpy.array(
+            delta_times, dtype=numpy.float64
+        )
+        velocities_x = Kinematics._velocities_x[:count]
+        velocities_y = Kinematics._velocities_y[:count]
+        Kinematics._positions_x[:count] += velocities_x * scales
+        Kinematics._positions_y[:count] += velocities_y * scales
+        is_moving = (scales != 0.0) & ((velocities_x != 0.0) | (velocities_y != 0.0))
+        return numpy.flatnonzero(is_moving).tolist()
+
+    @staticmethod
+    def _step_python(delta_times: List[float]) -> List[int]:
+        moved_indices = []
+        positions_x = Kinematics._positions_x
+        positions_y = Kinematics._positions_y
+        velocities_x = Kinematics._velocities_x
+        velocities_y = Kinematics._velocities_y
+        speed_scales = Kinematics._speed_scales
+        for index, delta_time in enumerate(delta_times):
+            scale = speed_scales[index] * delta_time
+            velocity_x = velocities_x[index]
+            velocity_y = velocities_y[index]
+            if scale != 0.0 and (velocity_x != 0.0 or velocity_y != 0.0):
+                positions_x[index] += velocity_x * scale
+                positions_y[index] += velocity_y * scale
+                moved_indices.append(index)
+        return moved_indices
+
+    @staticmethod
+    def _grow(capacity: int) -> None:
+        for name in (
+            "_positions_x",
+            "_positions_y",
+            "_velocities_x",
+            "_velocities_y",
+            "_speed_scales",
+        ):
+            column = getattr(Kinematics, name)
+            if numpy is not None:
+                new_column = numpy.zeros(capacity, dtype=numpy.float64)
+                if column is not None:
+                    new_column[: len(column)] = column
+            else:
+                new_column = (column or []) + [0.0] * (capacity - len(column or []))
+            setattr(Kinematics, name, new_column)
+        Kinematics._capacity = capacity
+
+    @staticmethod
+    def _on_node_exited(node: Node2D) -> None:
+        Kinematics.remove_body(node)
+        Kinematics._exit_subscribed_nodes.discard(node.entity_id)
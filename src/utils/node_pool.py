@@ -0,0 +1,113 @@
+import weakref
+from typing import Callable, Dict, List, Optional
+
+from crescent_api import Node, Node2D, SceneTree, Vector2
+
+
+class NodePool:
+    """
+    Reuses nodes instead of creating a new node each time one is needed and deleting it once it's done.  Pooled nodes
+    are added to the scene once and parked off screen while they wait to be used again, they implement 'park(position)'
+    and 'unpark()' and have 'pool' and 'is_parked' attributes.  Nodes are taken with 'acquire', set up and then put in
+    play with 'add_to_scene', nodes give themselves back with 'release'.
+    Pre-warming creates nodes up to the pool's size ahead of time.  The most nodes a pool has had in use at once is
+    kept in 'NodePool.high_water_marks' (by pool name, across scenes) so pool sizes can be tuned.
+    """
+
+    PARK_POSITION = Vector2(-10000.0, -10000.0)
+
+    high_water_marks: Dict[str, int] = {}
+    _pools = weakref.WeakSet()
+
+    def __init__(
+        self,
+        name: str,
+        create_node: Callable[[], Node2D],
+        size=0,
+        on_node_added: Optional[Callable[[Node2D], None]] = None,
+    ):
+        self.name = name
+        self.size = size
+        self._create_node = create_node
+        # Called once for each new node after it's added to the scene, so subscriptions are only made once per node
+        self._on_node_added = on_node_added
+        self._parked_nodes: List[Node2D] = []
+        self.created_count = 0
+        self.active_count = 0
+        NodePool.high_water_marks.setdefault(name, 0)
+        NodePool._pools.add(self)
+
+    @staticmethod
+    def clear_pools() -> None:
+        """
+        Forgets the parked nodes of every pool, called once the scene they were added to ends.
+        """
+        for pool in list(NodePool._pools):
+            pool.clear()
+
+    def clear(self) -> None:
+        self._parked_nodes.clear()
+        self.created_count = 0
+        self.active_count = 0
+
+    def is_warm(self) -> bool:
+        return self.created_count >= self.size
+
+    def prewarm_one(self, parent: Optional[Node] = None) -> bool:
+        """
+        Creates and parks one node if the pool isn't warm yet, returns True if a node was created.
+        """
+        if self.is_warm():
+            return False
+        node = self._new_node()
+        node.is_parked = True
+        node.position = NodePool.PARK_POSITION
+        self._add_new_node(node, parent)
+        self._parked_nodes.append(node)
+        return True
+
+    def prewarm(self, parent: Optional[Node] = None) -> None:
+        while self.prewarm_one(parent):
+            pass
+
+    def acquire(self) -> Node2D:
+        """
+        Returns a parked node, or a new one if none are parked.  Set it up and pass it to 'add_to_scene'.
+        """
+        if self._parked_nodes:
+            node = self._parked_nodes.pop()
+        else:
+            node = self._new_node()
+        self.active_count += 1
+        if self.active_count > NodePool.high_water_marks[self.name]:
+            NodePool.high_water_marks[self.name] = self.active_count
+        return node
+
+    def add_to_scene(self, node: Node2D, parent: Optional[Node] = None) -> None:
+        """
+        Puts an acquired node in play, parked nodes stay under the parent they were first added to.
+        """
+        if node.is_parked:
+            node.unpark()
+        else:
+            self._add_new_node(node, parent)
+
+    def release(self, node: Node2D) -> None:
+        if node.is_parked:
+            return None
+        node.park(NodePool.PARK_POSITION)
+        self._parked_nodes.append(node)
+        self.active_count -= 1
+
+    def _new_node(self) -> Node2D:
+        node = self._create_node()
+        node.pool = self
+        self.created_count += 1
+        return node
+
+    def _add_new_node(self, node: Node2D, parent: Optional[Node]) -> None:
+        if not parent:
+            parent = SceneTree.get_root()
+        parent.add_child(node)
+        if self._on_node_added:
+            self._on_node_added(node)
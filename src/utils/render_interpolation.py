@@ -0,0 +1,79 @@
+from typing import Dict, Set
+
+from crescent_api import Node2D, SceneTree, Vector2
+
+from src.utils.game_clock import GameClock
+
+
+class RenderInterpolation:
+    """
+    Smooths the movement of nodes when the physics rate is lower than the engine's fixed rate.  Between physics steps
+    nodes are drawn between their positions from the last two steps (so one step behind the simulation), their
+    simulated position is restored before each step.  Nodes are only tracked while the physics rate is lowered and
+    are removed once they exit the scene.
+    """
+
+    # Entity id -> [node, previous step position, current step position]
+    _nodes: Dict[int, list] = {}
+    # Nodes subscribed to 'scene_exited', so pooled nodes that are removed and added again subscribe once
+    _exit_subscribed_nodes: Set[int] = set()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return GameClock.ticks_per_step > 1
+
+    @staticmethod
+    def add_node(node: Node2D) -> None:
+        if (
+            not RenderInterpolation.is_enabled()
+            or node.entity_id in RenderInterpolation._nodes
+        ):
+            return None
+        position = node.position
+        RenderInterpolation._nodes[node.entity_id] = [node, position, position]
+        if node.entity_id not in RenderInterpolation._exit_subscribed_nodes:
+            RenderInterpolation._exit_subscribed_nodes.add(node.entity_id)
+            node.subscribe_to_event(
+                "scene_exited",
+                SceneTree.get_root(),
+                lambda args: RenderInterpolation._on_node_exited(node),
+            )
+
+    @staticmethod
+    def remove_node(node: Node2D) -> None:
+        RenderInterpolation._nodes.pop(node.entity_id, None)
+
+    @staticmethod
+    def clear() -> None:
+        RenderInterpolation._nodes.clear()
+        RenderInterpolation._exit_subscribed_nodes.clear()
+
+    @staticmethod
+    def _on_node_exited(node: Node2D) -> None:
+        RenderInterpolation._nodes.pop(node.entity_id, None)
+        RenderInterpolation._exit_subscribed_nodes.discard(node.entity_id)
+
+    @staticmethod
+    def begin_step() -> None:
+        for node, previous_position, position in RenderInterpolation._nodes.values():
+            node.position = position
+
+    @staticmethod
+    def end_step() -> None:
+        for node_entry in RenderInterpolation._nodes.values():
+            node = node_entry[0]
+            node_entry[1] = node_entry[2]
+            node_entry[2] = node.position
+            node.position = node_entry[1]
+
+    @staticmethod
+    def update() -> None:
+        """
+        Draws nodes between their last two step positions, called on engine ticks without a physics step.
+        """
+        alpha = GameClock.get_step_alpha()
+        for node, previous_position, position in RenderInterpolation._nodes.values():
+            node.position = Vector2(
+                previous_position.x + (position.x - previous_position.x) * alpha,
+                previous_position.y + (position.y - previous_position.y) * alpha,
+            )
@@ -0,0 +1,78 @@
+import time
+from typing import Dict, Iterable
+
+from crescent_api import PackedScene, SceneUtil
+
+
+class SceneCache:
+    """
+    Packed scenes by scene path, loaded the first time they're needed by 'get' or ahead of time by 'preload'.
+    Scenes that are no longer needed are dropped with 'evict' or 'evict_all_except' so the engine can free them,
+    instances already created from them aren't affected.
+    How long each scene took to load is kept in 'load_times' (by scene path, in seconds, the most recent load) across
+    scenes along with the load and eviction counts, so load costs can be reported by the task profiler.
+    """
+
+    load_times: Dict[str, float] = {}
+    load_count = 0
+    eviction_count = 0
+    _scenes: Dict[str, PackedScene] = {}
+
+    @staticmethod
+    def get(scene_path: str) -> PackedScene:
+        packed_scene = SceneCache._scenes.get(scene_path, None)
+        if packed_scene is None:
+            packed_scene = SceneCache._load(scene_path)
+        return packed_scene
+
+    @staticmethod
+    def preload(scene_path: str) -> bool:
+        """
+        Loads the scene if it isn't cached yet, returns True if it was loaded.
+        """
+        if scene_path in SceneCache._scenes:
+            return False
+        SceneCache._load(scene_path)
+        return True
+
+    @staticmethod
+    def is_loaded(scene_path: str) -> bool:
+        return scene_path in SceneCache._scenes
+
+    @staticmethod
+    def evict(scene_path: str) -> None:
+        if SceneCache._scenes.pop(scene_path, None) is not None:
+            SceneCache.eviction_count += 1
+
+    @staticmethod
+    def evict_all_except(scene_paths: Iterable[str]) -> None:
+        scene_paths = set(scene_paths)
+        for scene_path in list(SceneCache._scenes):
+            if scene_path not in scene_paths:
+                SceneCache.evict(scene_path)
+
+    @staticmethod
+    def get_counters() -> dict:
+        return {
+            "cached_scene_count": len(SceneCache._scenes),
+            "load_count": SceneCache.load_count,
+            "eviction_count": SceneCache.eviction_count,
+            "total_load_time": sum(SceneCache.load_times.values()),
+            "load_times": SceneCache.load_times,
+        }
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Drops every cached scene, load times and counts are kept so they can be reported across scenes.
+        """
+        SceneCache._scenes.clear()
+
+    @staticmethod
+    def _load(scene_path: str) -> PackedScene:
+        start_time = time.perf_counter()
+        packed_scene = SceneUtil.load_scene(scene_path)
+        SceneCache.load_times[scene_path] = time.perf_counter() - start_time
+        SceneCache.load_count += 1
+        SceneCache._scenes[scene_path] = packed_scene
+        return packed_scene
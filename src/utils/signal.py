@@ -0,0 +1,31 @@
+from typing import Callable, List
+
+
+class Signal:
+    """
+    Emitted when something happens (a property changes, an event is broadcast, etc...).  Functions can subscribe to
+    it and tasks can wait on it with 'await co_wait_signal(signal)', waiting tasks are parked by their task manager
+    and take no frame time until the signal is emitted.  The emission count is exposed as 'time' so the task manager
+    can treat a signal like any other clock it sleeps tasks on.
+    """
+
+    def __init__(self):
+        self.time = 0
+        self.args = None
+        self._subscribers: List[Callable] = []
+
+    def subscribe(self, func: Callable) -> None:
+        self._subscribers.append(func)
+
+    def unsubscribe(self, func: Callable) -> None:
+        try:
+            self._subscribers.remove(func)
+        except ValueError:
+            pass
+
+    def emit(self, args=None) -> None:
+        self.time += 1
+        self.args = args
+        # Copied so subscribers can unsubscribe while being called
+        for subscriber_func in self._subscribers[:]:
+            subscriber_func(args)
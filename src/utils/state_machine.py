@@ -0,0 +1,71 @@
+import time
+from typing import Callable, Coroutine, Dict, Optional
+
+from src.utils.task import Task
+
+
+class StateMachine:
+    """
+    Runs a task for the current state, created from a table of state -> coroutine factory.  The state task is closed
+    and replaced once the state changes, each state's task object is reused between transitions instead of creating
+    a new one.  Keeps counters of transitions into each state, frames spent in each state and time spent resuming it.
+    Closing the state machine closes the current state task, so using it as a context manager
+    ('with StateMachine(...) as state_machine:') ties the state task to the owning coroutine.
+    """
+
+    def __init__(self, states: Dict[str, Callable[[], Coroutine]]):
+        self.states = states
+        self.state: Optional[str] = None
+        self.state_task: Optional[Task] = None
+        self.transition_count = 0
+        self.state_transition_counts: Dict[str, int] = {state: 0 for state in states}
+        self.state_frame_counts: Dict[str, int] = {state: 0 for state in states}
+        self.state_resume_times: Dict[str, float] = {state: 0.0 for state in states}
+        self._state_tasks: Dict[str, Task] = {}
+
+    def __enter__(self) -> "StateMachine":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def set_state(self, state: str) -> None:
+        if state == self.state:
+            return None
+        if self.state_task:
+            self.state_task.close()
+            self.state_task = None
+        self.state = state
+        coroutine_factory = self.states.get(state, None)
+        if not coroutine_factory:
+            print(f"ERROR: Invalid state {state}!")
+            return None
+        state_task = self._state_tasks.get(state, None)
+        if state_task:
+            state_task.reset(coroutine_factory())
+        else:
+            state_task = Task(coroutine=coroutine_factory())
+            self._state_tasks[state] = state_task
+        self.state_task = state_task
+        self.transition_count += 1
+        self.state_transition_counts[state] += 1
+
+    def resume(self) -> None:
+        if self.state_task:
+            start_time = time.perf_counter()
+            self.state_task.resume()
+            self.state_resume_times[self.state] += time.perf_counter() - start_time
+            self.state_frame_counts[self.state] += 1
+
+    def update(self, state: str) -> None:
+        """
+        Changes to 'state' if it's different from the current state, then resumes the state task.
+        """
+        self.set_state(state)
+        self.resume()
+
+    def close(self) -> None:
+        if self.state_task:
+            self.state_task.close()
+            self.state_task = None
+        self.state = None
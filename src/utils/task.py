@@ -1,49 +1,225 @@
+import heapq
 import time
-from typing import Coroutine, Callable, Optional, List
+from typing import Coroutine, Callable, Optional, List, Dict, Set, Tuple, Union
 
-from crescent_api import World
+from crescent_api import Node, SceneTree
+
+from src.utils.game_clock import Clock, GameClock
+from src.utils.signal import Signal
 
 
 class Awaitable:
     class State:
         SUSPENDED = 0
         FINISHED = 1
+        SLEEPING = 2
 
-    def __init__(self, state: int):
+    def __init__(self, state: int, wake_time=0.0, wake_clock: Optional[Clock] = None):
         self.state = state
+        self.wake_time = wake_time
+        self.wake_clock = wake_clock
 
     def __await__(self):
         yield self
 
 
+class TaskPriority:
+    """
+    Lanes task managers resume tasks in, in order.  Critical and gameplay tasks always run, cosmetic tasks are
+    deferred to the next update once the frame budget is spent.
+    """
+
+    CRITICAL = 0
+    GAMEPLAY = 1
+    COSMETIC = 2
+
+
+class FrameBudget:
+    """
+    Time budget (in seconds) for each scheduler update, shared by every task manager and task group resumed during
+    it.  Only cosmetic tasks are deferred once it's spent.  Keeps counters of deferred cosmetic task resumes so
+    running over budget can be tracked.
+    """
+
+    budget: Optional[float] = 0.008
+    start_time = 0.0
+    is_in_frame = False
+    frame_count = 0
+    over_budget_frame_count = 0
+    deferred_task_count = 0
+    max_deferred_tasks_per_frame = 0
+    _frame_deferred_task_count = 0
+
+    @staticmethod
+    def begin_frame() -> None:
+        FrameBudget.is_in_frame = True
+        FrameBudget.frame_count += 1
+        FrameBudget._frame_deferred_task_count = 0
+        FrameBudget.start_time = time.perf_counter()
+
+    @staticmethod
+    def end_frame() -> None:
+        FrameBudget.is_in_frame = False
+
+    @staticmethod
+    def is_spent() -> bool:
+        return (
+            FrameBudget.is_in_frame
+            and FrameBudget.budget is not None
+            and time.perf_counter() - FrameBudget.start_time >= FrameBudget.budget
+        )
+
+    @staticmethod
+    def defer_tasks(task_count=1) -> None:
+        if FrameBudget._frame_deferred_task_count == 0:
+            FrameBudget.over_budget_frame_count += 1
+        FrameBudget._frame_deferred_task_count += task_count
+        FrameBudget.deferred_task_count += task_count
+        FrameBudget.max_deferred_tasks_per_frame = max(
+            FrameBudget.max_deferred_tasks_per_frame,
+            FrameBudget._frame_deferred_task_count,
+        )
+
+    @staticmethod
+    def get_counters() -> dict:
+        return {
+            "budget": FrameBudget.budget,
+            "frame_count": FrameBudget.frame_count,
+            "over_budget_frame_count": FrameBudget.over_budget_frame_count,
+            "deferred_task_count": FrameBudget.deferred_task_count,
+            "max_deferred_tasks_per_frame": FrameBudget.max_deferred_tasks_per_frame,
+        }
+
+    @staticmethod
+    def reset_counters() -> None:
+        FrameBudget.frame_count = 0
+        FrameBudget.over_budget_frame_count = 0
+        FrameBudget.deferred_task_count = 0
+        FrameBudget.max_deferred_tasks_per_frame = 0
+
+
 class Task:
-    def __init__(self, coroutine: Coroutine):
+    # Time accumulated on the ticking task's tick clock since its previous tick, returned by 'co_tick'
+    current_tick_delta = 0.0
+
+    def __init__(
+        self,
+        coroutine: Coroutine,
+        tick_divisor=1,
+        tick_frequency: Optional[float] = None,
+        tick_clock: Optional[Clock] = None,
+        priority=TaskPriority.GAMEPLAY,
+    ):
         self.coroutine = coroutine
+        self.priority = priority
         self.on_close_subscribers = []
         self.valid = True
         self.current_task: "Task" = self
         self.parent_task: Optional["Task"] = None
+        # Sleep state, set when a coroutine awaits 'co_wait_seconds' or 'co_wait_signal' (signals are slept on like clocks)
+        self.wake_time = 0.0
+        self.wake_clock: Optional[Clock] = None
+        # Tick rate, a task with a tick clock is resumed every 'tick_divisor' updates of its task manager (staggered by
+        # 'tick_offset') and can get the time accumulated between ticks from 'co_tick'
+        if tick_frequency:
+            tick_divisor = get_tick_divisor(tick_frequency)
+        self.tick_divisor = tick_divisor
+        self.tick_offset = 0
+        self.tick_clock = tick_clock
+        if not tick_clock and tick_divisor > 1:
+            self.tick_clock = GameClock.world
+        self._last_tick_time: Optional[float] = None
 
     def __await__(self):
         yield self
 
+    def is_sleeping(self) -> bool:
+        return self.wake_clock is not None
+
+    def is_running(self) -> bool:
+        """
+        Returns True while the task's coroutine, or one of its subtasks' coroutines, is executing.  A running task
+        can't be closed, code that can be called from the task it would close has to let the coroutine return instead.
+        """
+        task = self.current_task
+        while task:
+            if task.coroutine.cr_running:
+                return True
+            task = task.parent_task
+        return False
+
+    def is_due(self) -> bool:
+        """
+        Returns True if the task isn't sleeping or its clock has reached the wake time.
+        """
+        if not self.wake_clock:
+            return True
+        if self.wake_clock.time < self.wake_time:
+            return False
+        self.wake_clock = None
+        return True
+
+    def is_ticking(self, update_count: int) -> bool:
+        return (update_count + self.tick_offset) % self.tick_divisor == 0
+
+    def begin_tick(self) -> None:
+        tick_time = self.tick_clock.time
+        if self._last_tick_time is None:
+            Task.current_tick_delta = self.tick_clock.delta_time
+        else:
+            Task.current_tick_delta = tick_time - self._last_tick_time
+        self._last_tick_time = tick_time
+
+    def reset(self, coroutine: Coroutine) -> None:
+        """
+        Reuses a finished or closed task for a new coroutine.
+        """
+        self.coroutine = coroutine
+        self.valid = True
+        self.current_task = self
+        self.parent_task = None
+        self.wake_time = 0.0
+        self.wake_clock = None
+        self._last_tick_time = None
+
     def resume(self) -> None:
-        if self.valid:
+        if not self.valid:
+            return None
+        if self.wake_clock is not None and not self.is_due():
+            return None
+        current_task = self.current_task
+        # Loop instead of recursing so finished subtask chains unwind in place
+        while True:
             try:
-                task_return_value = self.current_task.coroutine.send(None)
-                if issubclass(type(task_return_value), Awaitable):
-                    if task_return_value.state == Awaitable.State.FINISHED:
-                        raise StopIteration
-                elif issubclass(type(task_return_value), Task):
-                    # Swap subtask in place
-                    task_return_value.parent_task = self.current_task
-                    self.current_task = task_return_value
+                task_return_value = current_task.coroutine.send(None)
             except StopIteration:
-                if self.current_task.parent_task:
-                    self.current_task = self.current_task.parent_task
-                    self.resume()
-                else:
+                task_return_value = _RETURN_AWAITABLE
+            if task_return_value is _SUSPEND_AWAITABLE:
+                return None
+            elif task_return_value is _RETURN_AWAITABLE:
+                parent_task = current_task.parent_task
+                if not parent_task:
                     self.valid = False
+                    return None
+                current_task = parent_task
+                self.current_task = parent_task
+            elif isinstance(task_return_value, Task):
+                # Swap subtask in place
+                task_return_value.parent_task = current_task
+                self.current_task = task_return_value
+                return None
+            elif (
+                isinstance(task_return_value, Awaitable)
+                and task_return_value.state == Awaitable.State.SLEEPING
+            ):
+                # Sleep request from 'co_sleep', park the whole task chain until the wake time is reached
+                self.wake_time = task_return_value.wake_time
+                self.wake_clock = task_return_value.wake_clock
+                return None
+            else:
+                raise TypeError(
+                    f"Task coroutine awaited {task_return_value!r}, only 'co_*' awaitables and tasks can be awaited!"
+                )
 
     def close(self) -> None:
         if self.valid:
@@ -56,46 +232,389 @@ class Task:
                 pass
 
 
+class TaskGroup:
+    """
+    Child tasks resumed together, in the order they were added, by the coroutine that owns the group.  Finished
+    children are dropped as soon as they finish and sleeping children are skipped until they are due.  Closing the
+    group closes every child, so using it as a context manager ('with TaskGroup() as task_group:') makes it a cancel
+    scope for the owning coroutine's subtree.
+    """
+
+    def __init__(self, tasks: Optional[List[Task]] = None):
+        self.tasks: List[Task] = []
+        self.update_count = 0
+        self._tick_stagger = 0
+        if tasks:
+            for task in tasks:
+                self.add_task(task)
+
+    def __enter__(self) -> "TaskGroup":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __contains__(self, task: Optional[Task]) -> bool:
+        return task in self.tasks
+
+    def add_task(self, task: Task) -> Task:
+        self._tick_stagger = stagger_task_tick(task, self._tick_stagger)
+        self.tasks.append(task)
+        return task
+
+    def cancel_task(self, task: Optional[Task]) -> None:
+        if task in self.tasks:
+            self.tasks.remove(task)
+            task.close()
+
+    def resume(self) -> Optional[Task]:
+        """
+        Resumes every runnable child.  Returns the first child that finished during this resume, if any.
+        """
+        finished_task = None
+        self.update_count += 1
+        update_count = self.update_count
+        for task in self.tasks[:]:
+            wake_clock = task.wake_clock
+            if wake_clock is not None and wake_clock.time < task.wake_time:
+                continue
+            if task.tick_clock is not None:
+                if not task.is_ticking(update_count):
+                    continue
+                task.begin_tick()
+            if task.priority == TaskPriority.COSMETIC and FrameBudget.is_spent():
+                FrameBudget.defer_tasks()
+                continue
+            task.resume()
+            if not task.valid and not finished_task:
+                finished_task = task
+        if finished_task:
+            self.tasks = [task for task in self.tasks if task.valid]
+        return finished_task
+
+    def close(self) -> None:
+        for task in self.tasks:
+            task.close()
+        self.tasks.clear()
+
+    def is_empty(self) -> bool:
+        return not self.tasks
+
+    def get_next_wake(self) -> Optional[Tuple[float, Clock]]:
+        """
+        Returns the earliest wake time (and its clock) if every child is sleeping on the same clock, otherwise None.
+        """
+        if not self.tasks:
+            return None
+        wake_clock = self.tasks[0].wake_clock
+        if wake_clock is None:
+            return None
+        wake_time = self.tasks[0].wake_time
+        for task in self.tasks:
+            if task.wake_clock is not wake_clock:
+                return None
+            wake_time = min(wake_time, task.wake_time)
+        return wake_time, wake_clock
+
+    def co_idle(self) -> Awaitable:
+        """
+        Awaitable for the owning coroutine between resumes.  When every child is asleep the owning task sleeps until
+        the first one is due instead of resuming the group each frame.
+        """
+        next_wake = self.get_next_wake()
+        if next_wake:
+            return co_sleep(*next_wake)
+        return _SUSPEND_AWAITABLE
+
+
 class TaskManager:
+    """
+    Resumes runnable tasks once per update, lane by lane in priority order.  Cosmetic tasks are deferred to the next
+    update once the frame budget is spent.  Sleeping tasks are parked in a min-heap (one per clock) keyed by wake time
+    and aren't touched again until they are due.
+    """
+
     def __init__(self, tasks: Optional[List[Task]] = None):
-        if not tasks:
-            tasks = []
-        self.tasks: List[Task] = tasks
+        # Runnable tasks, indexed by priority
+        self.task_lanes: List[List[Task]] = [[], [], []]
+        self._sleeping_tasks: Dict[Clock, List[tuple]] = {}
+        self._sleep_order = 0
+        # Tasks removed during the current update, so stale entries in the update snapshot are skipped
+        self._removed_tasks = set()
+        self.update_count = 0
+        self._tick_stagger = 0
+        # Where to start resuming cosmetic tasks from, so deferred tasks run first next update
+        self._cosmetic_task_index = 0
+        if tasks:
+            for task in tasks:
+                self.add_task(task)
 
     def add_task(self, task: Task) -> None:
-        self.tasks.append(task)
+        self._tick_stagger = stagger_task_tick(task, self._tick_stagger)
+        if task.is_sleeping():
+            self._park_task(task)
+        else:
+            self.task_lanes[task.priority].append(task)
 
     def remove_task(self, task: Task) -> None:
+        self._removed_tasks.add(task)
         try:
-            self.tasks.remove(task)
+            self.task_lanes[task.priority].remove(task)
         except ValueError as e:
-            pass
+            self._unpark_task(task)
 
     def update(self) -> None:
-        for task in self.tasks[:]:
-            task.resume()
-            if not task.valid:
-                self.remove_task(task)
+        self._wake_due_tasks()
+        self._removed_tasks.clear()
+        self.update_count += 1
+        for task in self.task_lanes[TaskPriority.CRITICAL][:]:
+            self._resume_task(task)
+        for task in self.task_lanes[TaskPriority.GAMEPLAY][:]:
+            self._resume_task(task)
+        self._resume_cosmetic_tasks()
 
     def kill_tasks(self) -> None:
-        for task in self.tasks[:]:
+        for task in self._get_all_tasks():
             if task.valid:
                 task.close()
-        self.tasks.clear()
+        for task_lane in self.task_lanes:
+            task_lane.clear()
+        self._sleeping_tasks.clear()
 
     def get_task_amount(self) -> int:
-        return len(self.tasks)
+        return (
+            sum(len(task_lane) for task_lane in self.task_lanes)
+            + self.get_sleeping_task_amount()
+        )
+
+    def get_sleeping_task_amount(self) -> int:
+        return sum(len(heap) for heap in self._sleeping_tasks.values())
 
     def has_tasks(self) -> bool:
-        return len(self.tasks) > 0
+        return self.get_task_amount() > 0
+
+    def _resume_task(self, task: Task) -> None:
+        if task in self._removed_tasks:
+            return None
+        if task.tick_clock is not None:
+            if not task.is_ticking(self.update_count):
+                return None
+            task.begin_tick()
+        task.resume()
+        if not task.valid:
+            self.remove_task(task)
+        elif task.is_sleeping():
+            self.remove_task(task)
+            self._park_task(task)
+
+    def _resume_cosmetic_tasks(self) -> None:
+        cosmetic_tasks = self.task_lanes[TaskPriority.COSMETIC][:]
+        task_count = len(cosmetic_tasks)
+        if task_count == 0:
+            return None
+        start_index = self._cosmetic_task_index % task_count
+        for i in range(task_count):
+            if FrameBudget.is_spent():
+                FrameBudget.defer_tasks(task_count - i)
+                self._cosmetic_task_index = start_index + i
+                return None
+            self._resume_task(cosmetic_tasks[(start_index + i) % task_count])
+        self._cosmetic_task_index = 0
+
+    def _get_all_tasks(self) -> List[Task]:
+        all_tasks = []
+        for task_lane in self.task_lanes:
+            all_tasks.extend(task_lane)
+        for heap in self._sleeping_tasks.values():
+            all_tasks.extend(entry[2] for entry in heap)
+        return all_tasks
+
+    def _park_task(self, task: Task) -> None:
+        heap = self._sleeping_tasks.setdefault(task.wake_clock, [])
+        # Order is used as a tie-breaker so tasks are never compared
+        self._sleep_order += 1
+        heapq.heappush(heap, (task.wake_time, self._sleep_order, task))
+
+    def _unpark_task(self, task: Task) -> None:
+        for clock, heap in self._sleeping_tasks.items():
+            for i, entry in enumerate(heap):
+                if entry[2] is task:
+                    heap.pop(i)
+                    heapq.heapify(heap)
+                    return None
+
+    def _wake_due_tasks(self) -> None:
+        has_empty_heaps = False
+        for clock, heap in self._sleeping_tasks.items():
+            current_time = clock.time
+            while heap and heap[0][0] <= current_time:
+                task = heapq.heappop(heap)[2]
+                if task.valid:
+                    task.wake_clock = None
+                    self.task_lanes[task.priority].append(task)
+            if not heap:
+                has_empty_heaps = True
+        # Drop empty heaps so one-off signals don't accumulate
+        if has_empty_heaps:
+            self._sleeping_tasks = {
+                clock: heap for clock, heap in self._sleeping_tasks.items() if heap
+            }
+
+
+class TaskScheduler(TaskManager):
+    """
+    Singleton scheduler that steps every registered task from a single engine callback (the scene root's
+    '_fixed_update') instead of each node resuming its own tasks.  Node tasks are closed once the node exits the scene.
+    A node's tasks can be suspended (taken out of the scheduler without being closed) and resumed later, tasks added
+    to a suspended node wait until it's resumed.
+    Node events waited on with 'co_wait_node_event' are subscribed to once per node, event and scoped node, the
+    signal they emit is reused by later waits and dropped once the node exits the scene.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = object.__new__(cls)
+            TaskManager.__init__(cls._instance)
+            cls._instance._node_tasks: Dict[int, List[Task]] = {}
+            cls._instance._suspended_nodes: Set[int] = set()
+            # (node entity id, event id, scoped node entity id) -> signal emitted by the event
+            cls._instance._node_event_signals: Dict[Tuple[int, str, int], Signal] = {}
+            cls._instance._node_event_exit_subscribed_nodes: Set[int] = set()
+        return cls._instance
+
+    def __init__(self):
+        pass
+
+    def add_node_task(self, node: Node, task: Task) -> Task:
+        node_tasks = self._node_tasks.get(node.entity_id, None)
+        if node_tasks is None:
+            node_tasks = []
+            self._node_tasks[node.entity_id] = node_tasks
+            node.subscribe_to_event(
+                "scene_exited",
+                SceneTree.get_root(),
+                lambda args: self.remove_node_tasks(node),
+            )
+        else:
+            # Drop references to finished tasks
+            node_tasks[:] = [node_task for node_task in node_tasks if node_task.valid]
+        node_tasks.append(task)
+        if node.entity_id not in self._suspended_nodes:
+            self.add_task(task)
+        return task
+
+    def get_node_event_signal(
+        self, node: Node, event_id: str, scoped_node: Node
+    ) -> Signal:
+        key = (node.entity_id, event_id, scoped_node.entity_id)
+        signal = self._node_event_signals.get(key, None)
+        if not signal:
+            signal = Signal()
+            self._node_event_signals[key] = signal
+            node.subscribe_to_event(event_id, scoped_node, signal.emit)
+            if node.entity_id not in self._node_event_exit_subscribed_nodes:
+                self._node_event_exit_subscribed_nodes.add(node.entity_id)
+                node.subscribe_to_event(
+                    "scene_exited",
+                    SceneTree.get_root(),
+                    lambda args: self._remove_node_event_signals(node),
+                )
+        return signal
+
+    def _remove_node_event_signals(self, node: Node) -> None:
+        entity_id = node.entity_id
+        self._node_event_exit_subscribed_nodes.discard(entity_id)
+        for key in [key for key in self._node_event_signals if key[0] == entity_id]:
+            del self._node_event_signals[key]
+
+    def remove_node_tasks(self, node: Node) -> None:
+        self._suspended_nodes.discard(node.entity_id)
+        for task in self._node_tasks.pop(node.entity_id, []):
+            if task.valid:
+                task.close()
+            self.remove_task(task)
+
+    def suspend_node_tasks(self, node: Node) -> None:
+        if node.entity_id in self._suspended_nodes:
+            return None
+        self._suspended_nodes.add(node.entity_id)
+        for task in self._node_tasks.get(node.entity_id, []):
+            if task.valid:
+                self.remove_task(task)
+
+    def resume_node_tasks(self, node: Node) -> None:
+        if node.entity_id not in self._suspended_nodes:
+            return None
+        self._suspended_nodes.discard(node.entity_id)
+        for task in self._node_tasks.get(node.entity_id, []):
+            if task.valid:
+                self.add_task(task)
+
+    def is_node_suspended(self, node: Node) -> bool:
+        return node.entity_id in self._suspended_nodes
+
+    def get_suspended_node_ids(self) -> Set[int]:
+        return self._suspended_nodes
+
+    def update(self) -> None:
+        FrameBudget.begin_frame()
+        super().update()
+        FrameBudget.end_frame()
+
+    def kill_tasks(self) -> None:
+        super().kill_tasks()
+        # Suspended tasks aren't in the scheduler
+        for entity_id in self._suspended_nodes:
+            for task in self._node_tasks.get(entity_id, []):
+                if task.valid:
+                    task.close()
+        self._node_tasks.clear()
+        self._suspended_nodes.clear()
+        self._node_event_signals.clear()
+        self._node_event_exit_subscribed_nodes.clear()
+
+
+# Preallocated so suspending and returning don't create objects, 'Task.resume' dispatches on identity
+_SUSPEND_AWAITABLE = Awaitable(Awaitable.State.SUSPENDED)
+_RETURN_AWAITABLE = Awaitable(Awaitable.State.FINISHED)
 
 
 def co_suspend() -> Awaitable:
-    return Awaitable(Awaitable.State.SUSPENDED)
+    return _SUSPEND_AWAITABLE
+
+
+async def co_tick() -> float:
+    """
+    Suspends until the task's next tick, returns the time accumulated on the task's tick clock since its last tick.
+    Only meaningful for tasks created with a tick divisor, frequency or clock.
+    """
+    await co_suspend()
+    return Task.current_tick_delta
+
+
+def get_tick_divisor(tick_frequency: float) -> int:
+    """
+    Returns how many fixed steps to skip between ticks to run at roughly 'tick_frequency' (Hz).
+    """
+    step_delta_time = GameClock.get_step_delta_time()
+    return max(1, round(1.0 / (tick_frequency * step_delta_time)))
+
+
+def stagger_task_tick(task: Task, tick_stagger: int) -> int:
+    """
+    Offsets a reduced rate task's ticks so tasks with the same divisor don't all run on the same update.  Returns the
+    next stagger value.
+    """
+    if task.tick_divisor > 1:
+        task.tick_offset = tick_stagger % task.tick_divisor
+        return tick_stagger + 1
+    return tick_stagger
 
 
 def co_return() -> Awaitable:
-    return Awaitable(Awaitable.State.FINISHED)
+    return _RETURN_AWAITABLE
 
 
 async def co_wait_until(predicate: [Callable, Coroutine]):
@@ -105,8 +624,12 @@ async def co_wait_until(predicate: [Callable, Coroutine]):
                 await co_suspend()
         elif isinstance(_predicate, Coroutine):
             try:
-                while _predicate.send(None).state == Awaitable.State.SUSPENDED:
-                    await co_suspend()
+                while True:
+                    predicate_value = _predicate.send(None)
+                    if predicate_value is _RETURN_AWAITABLE:
+                        break
+                    # Forward so sleeps and subtasks are handled by the owning task
+                    await predicate_value
             except StopIteration:
                 pass
         else:
@@ -117,26 +640,76 @@ async def co_wait_until(predicate: [Callable, Coroutine]):
     await Task(co_wait_until_internal(predicate))
 
 
-# TODO: Get current time from engine function to allow for time dilation changes
-async def co_wait_seconds(
-    seconds: float, time_func: Callable = None, ignore_time_dilation=False
-):
-    async def co_wait_seconds_internal(
-        _seconds: float, _time_func: Callable = None, _ignore_time_dilation=False
-    ):
-        if not _time_func:
-            _time_func = time.time
-        start_time = _time_func()
+async def co_gather(*tasks: Task):
+    """
+    Runs tasks together until all of them have finished.  Unfinished tasks are closed if the awaiting task is.
+    """
+    with TaskGroup(list(tasks)) as task_group:
         while True:
-            current_time = _time_func()
-            if not _ignore_time_dilation:
-                current_time *= World.get_time_dilation()
-            delta = current_time - start_time
-            if delta >= _seconds:
+            task_group.resume()
+            if task_group.is_empty():
                 break
-            await co_suspend()
+            await task_group.co_idle()
+
+
+async def co_race(*tasks: Task) -> Task:
+    """
+    Runs tasks together until one of them finishes, the others are then closed.  Returns the task that finished first.
+    """
+    with TaskGroup(list(tasks)) as task_group:
+        while True:
+            finished_task = task_group.resume()
+            if finished_task:
+                return finished_task
+            await task_group.co_idle()
+
+
+def co_sleep(wake_time: float, wake_clock: Union[Clock, Signal]) -> Awaitable:
+    return Awaitable(
+        Awaitable.State.SLEEPING, wake_time=wake_time, wake_clock=wake_clock
+    )
+
+
+async def co_wait_seconds(
+    seconds: float, clock: Optional[Clock] = None, ignore_time_dilation=False
+):
+    """
+    Parks the awaiting task until 'seconds' have passed on 'clock' (defaults to the world clock, or the unscaled
+    clock when ignoring time dilation).  The task isn't resumed while it's sleeping.
+    """
+    if not clock:
+        clock = GameClock.unscaled if ignore_time_dilation else GameClock.world
+    await co_sleep(clock.time + seconds, clock)
+
+
+def co_wait_signal(signal: Signal) -> Awaitable:
+    """
+    Parks the awaiting task until 'signal' is next emitted.  The emitted args are available from 'signal.args'.
+    """
+    return co_sleep(signal.time + 1, signal)
+
+
+async def co_wait_node_event(
+    node: Node, event_id: str, scoped_node: Optional[Node] = None
+):
+    """
+    Parks the awaiting task until 'node' broadcasts 'event_id'.  Returns the broadcast args.  Repeated waits on the
+    same event reuse a single subscription, see 'TaskScheduler.get_node_event_signal'.
+    """
+    if not scoped_node:
+        scoped_node = SceneTree.get_root()
+    signal = TaskScheduler().get_node_event_signal(node, event_id, scoped_node)
+    await co_wait_signal(signal)
+    return signal.args
+
 
-    await Task(co_wait_seconds_internal(seconds, time_func, ignore_time_dilation))
+async def co_wait_world_unpaused():
+    """
+    Waits a frame, then parks the awaiting task for as long as the world's time dilation is 0.
+    """
+    await co_suspend()
+    while GameClock.world.time_dilation <= 0.0:
+        await co_wait_signal(GameClock.world_time_dilation_changed)
 
 
 # Coroutine example
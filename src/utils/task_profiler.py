@@ -0,0 +1,232 @@
+import csv
+import json
+import os
+import sys
+import time
+import weakref
+from typing import Dict, List, Optional
+
+from src.utils.frame_context import FrameContext
+from src.utils.node_pool import NodePool
+from src.utils.scene_cache import SceneCache
+from src.utils.task import FrameBudget, Task, TaskManager, TaskScheduler
+
+
+class TaskStats:
+    """
+    Stats for task resumes grouped by coroutine qualname, a resume is counted for the innermost awaited subtask that
+    was running when the task was resumed.
+    'total_time' includes tasks resumed from within the task (task groups, state machines, etc...), 'self_time'
+    doesn't.  'allocated_blocks' is the net change in allocated memory blocks across resumes.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.resume_count = 0
+        self.total_time = 0.0
+        self.self_time = 0.0
+        self.max_time = 0.0
+        self.allocated_blocks = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "resume_count": self.resume_count,
+            "total_time": self.total_time,
+            "self_time": self.self_time,
+            "max_time": self.max_time,
+            "allocated_blocks": self.allocated_blocks,
+        }
+
+
+class TaskProfiler:
+    """
+    Opt-in instrumentation for 'Task' and 'TaskManager'.  Enabling the profiler swaps in profiled versions of
+    'Task.resume' and 'TaskManager.update', while disabled the original methods are used so there is no cost.
+    Set the 'TASK_PROFILE_OUTPUT' environment variable to a '.json' or '.csv' path to profile a run, the results are
+    written once the main scene ends.
+    """
+
+    OUTPUT_PATH_ENV_VAR = "TASK_PROFILE_OUTPUT"
+
+    enabled = False
+    output_path: Optional[str] = None
+    stats: Dict[str, TaskStats] = {}
+    update_count = 0
+    update_time = 0.0
+    max_update_time = 0.0
+    _task_parents = weakref.WeakKeyDictionary()
+    # Entries of [task, time spent resuming nested tasks]
+    _resume_stack: List[list] = []
+    _original_task_resume = None
+    _original_task_manager_update = None
+
+    @staticmethod
+    def enable(output_path: Optional[str] = None) -> None:
+        TaskProfiler.output_path = output_path
+        if TaskProfiler.enabled:
+            return None
+        TaskProfiler.enabled = True
+        TaskProfiler._original_task_resume = Task.resume
+        TaskProfiler._original_task_manager_update = TaskManager.update
+        Task.resume = TaskProfiler._profiled_task_resume
+        TaskManager.update = TaskProfiler._profiled_task_manager_update
+
+    @staticmethod
+    def enable_from_environment() -> bool:
+        output_path = os.environ.get(TaskProfiler.OUTPUT_PATH_ENV_VAR, None)
+        if output_path:
+            TaskProfiler.enable(output_path)
+        return TaskProfiler.enabled
+
+    @staticmethod
+    def disable() -> None:
+        if not TaskProfiler.enabled:
+            return None
+        Task.resume = TaskProfiler._original_task_resume
+        TaskManager.update = TaskProfiler._original_task_manager_update
+        TaskProfiler.enabled = False
+
+    @staticmethod
+    def reset() -> None:
+        TaskProfiler.stats.clear()
+        TaskProfiler.update_count = 0
+        TaskProfiler.update_time = 0.0
+        TaskProfiler.max_update_time = 0.0
+        TaskProfiler._task_parents.clear()
+
+    @staticmethod
+    def get_sorted_stats() -> List[TaskStats]:
+        return sorted(
+            TaskProfiler.stats.values(),
+            key=lambda task_stats: task_stats.self_time,
+            reverse=True,
+        )
+
+    @staticmethod
+    def get_task_tree(task_manager: Optional[TaskManager] = None) -> List[dict]:
+        """
+        Returns the current tree of tasks, starting from the task manager's (defaults to the scheduler) tasks.
+        Children are tasks that were last resumed from within another task, subtasks are the chain of awaited tasks.
+        """
+        if not task_manager:
+            task_manager = TaskScheduler()
+        task_children: Dict[Task, List[Task]] = {}
+        for task, parent_task in list(TaskProfiler._task_parents.items()):
+            if task.valid:
+                task_children.setdefault(parent_task, []).append(task)
+
+        def get_task_node(task: Task) -> dict:
+            subtasks = []
+            current_task = task.current_task
+            while current_task and current_task is not task:
+                subtasks.insert(0, current_task.coroutine.__qualname__)
+                current_task = current_task.parent_task
+            return {
+                "name": task.coroutine.__qualname__,
+                "subtasks": subtasks,
+                "is_sleeping": task.is_sleeping(),
+                "children": [
+                    get_task_node(child_task)
+                    for child_task in task_children.get(task, [])
+                ],
+            }
+
+        return [
+            get_task_node(task) for task in task_manager._get_all_tasks() if task.valid
+        ]
+
+    @staticmethod
+    def print_task_tree(task_manager: Optional[TaskManager] = None) -> None:
+        def print_task_node(task_node: dict, depth: int) -> None:
+            subtasks = " -> ".join([task_node["name"]] + task_node["subtasks"])
+            sleeping = " (sleeping)" if task_node["is_sleeping"] else ""
+            print(f"{'  ' * depth}{subtasks}{sleeping}")
+            for child_node in task_node["children"]:
+                print_task_node(child_node, depth + 1)
+
+        for root_node in TaskProfiler.get_task_tree(task_manager):
+            print_task_node(root_node, 0)
+
+    @staticmethod
+    def write_json(path: str) -> None:
+        with open(path, "w") as file:
+            json.dump(
+                {
+                    "update_count": TaskProfiler.update_count,
+                    "update_time": TaskProfiler.update_time,
+                    "max_update_time": TaskProfiler.max_update_time,
+                    "frame_budget": FrameBudget.get_counters(),
+                    "frame_context": FrameContext.get_counters(),
+                    "node_pool_high_water_marks": NodePool.high_water_marks,
+                    "scene_cache": SceneCache.get_counters(),
+                    "stats": [
+                        task_stats.to_dict()
+                        for task_stats in TaskProfiler.get_sorted_stats()
+                    ],
+                    "task_tree": TaskProfiler.get_task_tree(),
+                },
+                file,
+                indent=2,
+            )
+
+    @staticmethod
+    def write_csv(path: str) -> None:
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=list(TaskStats("").to_dict()))
+            writer.writeheader()
+            for task_stats in TaskProfiler.get_sorted_stats():
+                writer.writerow(task_stats.to_dict())
+
+    @staticmethod
+    def flush() -> None:
+        """
+        Writes results to the output path (if enabled with one), format is determined by the file extension.
+        """
+        if not TaskProfiler.enabled or not TaskProfiler.output_path:
+            return None
+        if TaskProfiler.output_path.endswith(".csv"):
+            TaskProfiler.write_csv(TaskProfiler.output_path)
+        else:
+            TaskProfiler.write_json(TaskProfiler.output_path)
+
+    # --- Profiled methods --- #
+    def _profiled_task_resume(self: Task) -> None:
+        wake_clock = self.wake_clock
+        if not self.valid or (
+            wake_clock is not None and wake_clock.time < self.wake_time
+        ):
+            return TaskProfiler._original_task_resume(self)
+        name = self.current_task.coroutine.__qualname__
+        resume_stack = TaskProfiler._resume_stack
+        if resume_stack:
+            TaskProfiler._task_parents[self] = resume_stack[-1][0]
+        stack_entry = [self, 0.0]
+        resume_stack.append(stack_entry)
+        start_blocks = sys.getallocatedblocks()
+        start_time = time.perf_counter()
+        try:
+            TaskProfiler._original_task_resume(self)
+        finally:
+            elapsed_time = time.perf_counter() - start_time
+            allocated_blocks = sys.getallocatedblocks() - start_blocks
+            resume_stack.pop()
+            if resume_stack:
+                resume_stack[-1][1] += elapsed_time
+            task_stats = TaskProfiler.stats.get(name, None)
+            if not task_stats:
+                task_stats = TaskStats(name)
+                TaskProfiler.stats[name] = task_stats
+            task_stats.resume_count += 1
+            task_stats.total_time += elapsed_time
+            task_stats.self_time += elapsed_time - stack_entry[1]
+            task_stats.max_time = max(task_stats.max_time, elapsed_time)
+            task_stats.allocated_blocks += allocated_blocks
+
+    def _profiled_task_manager_update(self: TaskManager) -> None:
+        start_time = time.perf_counter()
+        TaskProfiler._original_task_manager_update(self)
+        elapsed_time = time.perf_counter() - start_time
+        TaskProfiler.update_count += 1
+        TaskProfiler.update_time += elapsed_time
+        TaskProfiler.max_update_time = max(TaskProfiler.max_update_time, elapsed_time)
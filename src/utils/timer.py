@@ -1,9 +1,20 @@
+from typing import Optional
+
+from src.utils.game_clock import Clock
+
+
 class Timer:
-    def __init__(self, time: float):
+    def __init__(self, time: float, clock: Optional[Clock] = None):
         self.time = time
         self.time_remaining = time
+        self.clock = clock
 
-    def tick(self, delta_time: float) -> "Timer":
+    def tick(self, delta_time: Optional[float] = None) -> "Timer":
+        """
+        Ticks the timer by 'delta_time', or by the attached clock's delta time if not passed in.
+        """
+        if delta_time is None:
+            delta_time = self.clock.delta_time
         self.time_remaining = max(self.time_remaining - delta_time, 0.0)
         return self
 
@@ -0,0 +1,33 @@
+from typing import Any, Dict, Optional
+
+_UNRESOLVED = object()
+
+
+class TypeDispatch:
+    """
+    Maps classes to values (usually handler functions) to replace 'issubclass' chains.  A lookup walks the class's
+    MRO once to find the closest registered base class and caches the result, so later lookups for that class are
+    a single dict lookup.  Classes without a registered base resolve to None.
+    """
+
+    def __init__(self, values: Optional[Dict[type, Any]] = None):
+        self._values: Dict[type, Any] = dict(values) if values else {}
+        self._resolved_values: Dict[type, Any] = {}
+
+    def register(self, registered_type: type, value: Any) -> None:
+        self._values[registered_type] = value
+        self._resolved_values.clear()
+
+    def get(self, lookup_type: type) -> Any:
+        value = self._resolved_values.get(lookup_type, _UNRESOLVED)
+        if value is _UNRESOLVED:
+            value = self._resolve(lookup_type)
+            self._resolved_values[lookup_type] = value
+        return value
+
+    def _resolve(self, lookup_type: type) -> Any:
+        for base_type in lookup_type.__mro__:
+            value = self._values.get(base_type, _UNRESOLVED)
+            if value is not _UNRESOLVED:
+                return value
+        return None